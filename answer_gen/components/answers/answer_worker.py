@@ -1,16 +1,20 @@
 import logging
 
-from answer_gen.storage.db import build_connection
+from answer_gen.storage.db import build_async_connection
 from answer_gen.storage import Question, Answer
-from answer_gen.storage.persistence import Persistence
+from answer_gen.storage.async_persistence import AsyncPersistence
 from answer_gen.utils.generative import generate_single_answer
+from answer_gen.utils.generative.clients.base import GenerativeClient
 from answer_gen.utils.generative.mappers import map_answers
 
-from answer_gen.utils.embedder import Embedder
+from answer_gen.utils.embedder import get_embedder
 from answer_gen.exceptions import InvalidResourceIdentifier
 import answer_gen.exceptions as exceptions
 
 from answer_gen.utils.config.answer_worker_config import AnswerWorkerConfig
+from answer_gen.components.answers.context_builder import ContextBuilder
+from answer_gen.components.answers.prompt_packer import get_token_counter
+from answer_gen.components.answers.semantic_cache import SemanticAnswerCache, record_llm_calls_avoided
 
 logger = logging.getLogger(__name__)
 
@@ -18,22 +22,39 @@ class AnswerWorker:
     def __init__(
         self,
         db_url: str,
-        generative_client,
+        generative_client: GenerativeClient,
         config : AnswerWorkerConfig
     ):
         """Initialize answer generation dependencies and runtime configuration."""
         self._db_url = db_url
         self._generative_client = generative_client
-        self._embedder = Embedder(config.embedding_model, batch_size = config.embedding_batch_size)
+        self._embedder = get_embedder(
+            config.embedding_model,
+            batch_size = config.embedding_batch_size,
+            batch_window_ms = config.embedding_batch_window_ms,
+        )
         self._config = config
+        self._chunk_version_id = None
+        self._context_builder: ContextBuilder | None = None
+        self._semantic_cache = None
+        if config.semantic_cache_min_similarity is not None:
+            self._semantic_cache = SemanticAnswerCache(
+                config.semantic_cache_min_similarity,
+                config.semantic_cache_candidates,
+                ef_search=config.ef_search,
+                probes=config.probes,
+            )
+
+    async def __call__(self, question_id: int, use_cache: bool = True):
+        """Generate and persist answers for a question, or return cached answers.
 
-    async def __call__(self, question_id: int):
-        """Generate and persist answers for a question, or return cached answers."""
-        with build_connection(self._db_url) as session:
+        ``use_cache=False`` bypasses the semantic answer cache and the LLM response cache.
+        """
+        async with build_async_connection(self._db_url) as session:
             # Persistence facade wraps all DB access for this unit of work.
-            store = Persistence(session)
+            store = AsyncPersistence(session)
 
-            question: Question = store.get_question_by_id(question_id)
+            question: Question = await store.get_question_by_id(question_id)
             if question is None:
                 logger.warning("Question not found question_id=%s", question_id)
                 raise InvalidResourceIdentifier(f"Question with id {question_id} does not exist in the database.")
@@ -44,19 +65,42 @@ class AnswerWorker:
                 return {"question": question.id, "answers": [a.to_dict() for a in question.answers]}
 
             # Retrieve best matching chunk by vector similarity
-            question_embedding = self._embedder([question.content])[0]
-            chunks = list(store.get_most_similar_chunks(
+            question_embedding = question.embedding
+            if question_embedding is None:
+                question_embedding = (await self._embedder.aencode([question.content]))[0]
+                # Stored so later RFPs can find this question in the semantic cache; committed now so
+                # the paths that return without answers (or fail) do not make a retry re-embed it.
+                question.embedding = question_embedding
+                await store.commit()
+
+            chunk_version_id = await self._get_chunk_version_id(store)
+            corpus_stamp = None
+            if self._semantic_cache is not None:
+                corpus_stamp = await store.get_corpus_stamp(chunk_version_id)
+            if self._semantic_cache is not None and use_cache:
+                reused = await self._semantic_cache.lookup(store, [question], [question_embedding], chunk_version_id, corpus_stamp)
+                if question.id in reused:
+                    answers = reused[question.id]
+                    await store.bulk_insert_answers(answers)
+                    await store.commit()
+                    record_llm_calls_avoided(1)
+                    return {"question": question.id, "answers": [a.to_dict() for a in answers]}
+
+            chunks = await store.get_most_similar_chunks(
                 question_embedding,
-               self._config.min_similarity,
+                self._config.min_similarity,
                 self._config.top_k,
-                chunk_version_name=self._config.chunk_version_name,
-            ))
+                chunk_version_id=chunk_version_id,
+                oversample=self._config.retrieval_oversample,
+                ef_search=self._config.ef_search,
+                probes=self._config.probes,
+            )
             if not chunks:
                 logger.info("No similar chunks found question_id=%s", question.id)
                 return {"question": question.id, "answers": []}
 
-            # TODO: deal with prompt sizing
-            context = " | ".join([c.content for c in chunks])
+            # Merge adjacent chunks, drop overlap and fit the answer model's context budget.
+            context = self._get_context_builder().build(chunks)
 
             try:
                 answer_response = await generate_single_answer(
@@ -65,6 +109,7 @@ class AnswerWorker:
                     self._config.answer_model,
                     question_text=question.content,
                     context=context,
+                    use_cache=use_cache,
                 )
             except Exception:
                 logger.exception(
@@ -87,19 +132,21 @@ class AnswerWorker:
             answers = map_answers(
                 [answer_response],
                 question_ids=[question.id],
-                answer_version_id=self._get_answer_version_id(store) if self._config.answer_version_name is not None else None,
+                answer_version_id=await self._get_answer_version_id(store) if self._config.answer_version_name is not None else None,
+                chunk_version_id=chunk_version_id,
+                corpus_stamp=corpus_stamp,
             )
 
             # Persist newly generated answers for future cache hits.
-            store.bulk_insert_answers(answers)
-            store.commit()
+            await store.bulk_insert_answers(answers)
+            await store.commit()
             logger.info("Generated answers question_id=%s count=%s", question.id, len(answers))
 
             return {"question": question.id, "answers": [a.to_dict() for a in answers]}
 
-    def _get_answer_version_id(self, store : Persistence) -> int:
+    async def _get_answer_version_id(self, store : AsyncPersistence) -> int:
         """Resolve and cache the configured answer version id."""
-        answer_version = store.get_answer_version_by_name(self._config.answer_version_name)
+        answer_version = await store.get_answer_version_by_name(self._config.answer_version_name)
 
         if answer_version is None:
             logger.warning(f'No answer version with name: {self._config.answer_version_name}')
@@ -108,11 +155,29 @@ class AnswerWorker:
         self._answer_version = answer_version.id
         return self._answer_version
 
-    def fetch_answer(self, answer_id) -> dict:
+    async def _get_chunk_version_id(self, store : AsyncPersistence) -> int | None:
+        """Resolve the configured chunk version id once and reuse it for every retrieval."""
+        if self._chunk_version_id is None and self._config.chunk_version_name is not None:
+            chunk_version = await store.get_chunk_version(self._config.chunk_version_name)
+
+            if chunk_version is None:
+                logger.warning(f'No chunk version with name: {self._config.chunk_version_name}')
+                raise exceptions.DatabaseQueryError(f'Could not find chunk version with name {self._config.chunk_version_name}')
+
+            self._chunk_version_id = chunk_version.id
+        return self._chunk_version_id
+
+    def _get_context_builder(self) -> ContextBuilder:
+        """Build the token-budgeted context builder once for the answer model."""
+        if self._context_builder is None:
+            self._context_builder = ContextBuilder(get_token_counter(self._config.answer_model), self._config.max_context_tokens)
+        return self._context_builder
+
+    async def fetch_answer(self, answer_id) -> dict:
         """Fetch one answer by id and return it as an API-friendly payload."""
-        with build_connection(self._db_url) as session:
-            store = Persistence(session)
-            answer : Answer = store.get_answer_by_id(answer_id)
+        async with build_async_connection(self._db_url) as session:
+            store = AsyncPersistence(session)
+            answer : Answer = await store.get_answer_by_id(answer_id)
 
             if answer is None:
                 logger.warning(f'No answer with ID {answer_id}.')
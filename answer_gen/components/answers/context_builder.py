@@ -0,0 +1,136 @@
+"""Assemble token-bounded, deduplicated retrieval context for answer prompts."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Shortest repeated boundary text treated as chunk overlap rather than coincidence.
+_MIN_OVERLAP_CHARS = 16
+# Chunk overlap is a few dozen tokens; never search further back than this for it.
+_MAX_OVERLAP_CHARS = 2000
+
+
+def strip_overlap(previous: str, following: str) -> str:
+    """Drop the prefix of ``following`` that repeats the tail of ``previous``."""
+    head = following[:_MIN_OVERLAP_CHARS]
+    if len(head) < _MIN_OVERLAP_CHARS:
+        return following
+
+    # The leftmost match in the tail is the longest overlap.
+    start = previous.find(head, max(0, len(previous) - _MAX_OVERLAP_CHARS))
+    while start != -1:
+        if following.startswith(previous[start:]):
+            return following[len(previous) - start:]
+        start = previous.find(head, start + 1)
+    return following
+
+
+@dataclass(slots=True)
+class ContextPassage:
+    """A run of adjacent chunks from one document, merged into a single passage."""
+
+    doc_id: int
+    text: str
+    tokens: int
+    chunk_ids: set[int] = field(default_factory=set)
+
+
+class ContextBuilder:
+    """Merge retrieved chunks into passages and select them under a per-question token budget.
+
+    Adjacent chunks of the same document (consecutive ``order``) are merged with their
+    overlap removed, so each passage holds at most ``max_context_tokens``.
+    """
+
+    def __init__(self, count_tokens: Callable[[str], int], max_context_tokens: int):
+        """Configure the tokenizer and the per-question context budget."""
+        self._count_tokens = count_tokens
+        self._max_context_tokens = max(1, max_context_tokens)
+
+    def build(self, scored_chunks: Sequence[tuple]) -> str:
+        """Return numbered ``[Source n]`` context for one question's `(chunk, similarity)` pairs."""
+        passages = self.merge(scored_chunks)
+        selected = self._select(passages, self._rank(passages, scored_chunks))
+        return "\n\n".join(f"[Source {n}] {passages[i].text}" for n, i in enumerate(selected, start=1))
+
+    def build_shared(self, chunks_per_question: Sequence[Sequence[tuple]]) -> tuple[dict[int, str], list[list[int]]]:
+        """Build one numbered source table for many questions and each question's source ids.
+
+        Chunks retrieved for several questions land in one passage that is emitted once
+        and referenced by id from every question that retrieved it.
+        """
+        passages = self.merge([pair for chunks in chunks_per_question for pair in chunks])
+        source_ids: dict[int, int] = {}
+        refs: list[list[int]] = []
+
+        for chunks in chunks_per_question:
+            selected = self._select(passages, self._rank(passages, chunks))
+            for index in selected:
+                source_ids.setdefault(index, len(source_ids) + 1)
+            refs.append([source_ids[index] for index in selected])
+
+        sources = {source_id: passages[index].text for index, source_id in source_ids.items()}
+        return sources, refs
+
+    def merge(self, scored_chunks: Sequence[tuple]) -> list[ContextPassage]:
+        """Merge unique chunks into passages of adjacent, overlap-free text per document."""
+        unique = {chunk.id: chunk for chunk, _ in scored_chunks}
+        ordered = sorted(unique.values(), key=lambda c: (c.doc_id, c.order))
+
+        passages: list[ContextPassage] = []
+        previous = None
+        for chunk in ordered:
+            current = passages[-1] if passages else None
+            adjacent = previous is not None and previous.doc_id == chunk.doc_id and chunk.order == previous.order + 1
+            text = strip_overlap(previous.content, chunk.content) if adjacent else chunk.content
+            tokens = self._count_tokens(text)
+
+            if adjacent and current.tokens + tokens <= self._max_context_tokens:
+                current.text = f"{current.text} {text.lstrip()}"
+                current.tokens += tokens
+                current.chunk_ids.add(chunk.id)
+            else:
+                passage_text, tokens = self._trim(chunk.content)
+                passages.append(ContextPassage(chunk.doc_id, passage_text, tokens, {chunk.id}))
+            previous = chunk
+
+        return passages
+
+    def _rank(self, passages: list[ContextPassage], scored_chunks: Sequence[tuple]) -> list[int]:
+        """Indexes of passages holding any of ``scored_chunks``, best similarity first."""
+        best: dict[int, float] = {}
+        for chunk, similarity in scored_chunks:
+            score = float(similarity)
+            if best.get(chunk.id, float("-inf")) < score:
+                best[chunk.id] = score
+
+        scores = {
+            index: max(best[cid] for cid in passage.chunk_ids if cid in best)
+            for index, passage in enumerate(passages)
+            if not passage.chunk_ids.isdisjoint(best)
+        }
+        return sorted(scores, key=lambda index: scores[index], reverse=True)
+
+    def _select(self, passages: list[ContextPassage], ranked: list[int]) -> list[int]:
+        """Greedily keep ranked passages that fit the budget; the best one is always kept."""
+        selected: list[int] = []
+        used = 0
+        for index in ranked:
+            tokens = passages[index].tokens
+            if selected and used + tokens > self._max_context_tokens:
+                continue
+            selected.append(index)
+            used += tokens
+        return selected
+
+    def _trim(self, text: str) -> tuple[str, int]:
+        """Cut a single oversized chunk down to the context budget."""
+        tokens = self._count_tokens(text)
+        while tokens > self._max_context_tokens and text:
+            text = text[: int(len(text) * min(0.9, self._max_context_tokens / tokens))]
+            tokens = self._count_tokens(text)
+        return text, tokens
@@ -0,0 +1,126 @@
+"""Pack bulk-answer prompt items into shards that fit the model's token budgets."""
+
+from __future__ import annotations
+
+import json
+import logging
+from functools import lru_cache
+from typing import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Encoding used when tiktoken does not know the model name (e.g. a newer OpenAI model).
+_FALLBACK_ENCODING = "o200k_base"
+# Separator and bracket tokens added per item when the items are serialised as a JSON list.
+_ITEM_OVERHEAD_TOKENS = 2
+
+
+@lru_cache(maxsize=8)
+def get_token_counter(model_name: str) -> Callable[[str], int]:
+    """Return a tiktoken-backed `text -> token count` function, built once per model."""
+    import tiktoken
+
+    try:
+        encoding = tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        encoding = tiktoken.get_encoding(_FALLBACK_ENCODING)
+
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+class PromptPacker:
+    """Greedily split `{"question_id", "question", "context" | "sources"}` items into token-bounded shards.
+
+    A shard stays within ``max_input_tokens`` (prompt template included) and within
+    ``max_output_tokens`` at ``output_tokens_per_item`` per expected answer. It also holds
+    at most ``max_items`` items. Items may reference ids of a shared source table instead
+    of carrying their own context; each referenced source is then counted once per shard.
+    Shards keep the input order and every item lands in exactly one shard; an item too
+    large on its own has its sources or context trimmed to fit.
+    """
+
+    def __init__(
+        self,
+        count_tokens: Callable[[str], int],
+        prompt_template: str,
+        max_input_tokens: int,
+        max_output_tokens: int,
+        output_tokens_per_item: int,
+        max_items: int | None = None,
+    ):
+        """Precompute the per-shard item budget from the template and token limits."""
+        self._count_tokens = count_tokens
+        self._item_budget = max(1, max_input_tokens - count_tokens(prompt_template))
+        max_items_by_output = max(1, max_output_tokens // max(1, output_tokens_per_item))
+        self._max_items = min(max_items or max_items_by_output, max_items_by_output)
+
+    @property
+    def item_budget(self) -> int:
+        """Input tokens left for items once the prompt template is accounted for."""
+        return self._item_budget
+
+    @property
+    def max_items(self) -> int:
+        """Largest number of items a single shard may hold."""
+        return self._max_items
+
+    def pack(self, items: Sequence[dict], sources: dict[int, str] | None = None) -> list[list[dict]]:
+        """Split ``items`` into ordered shards that each fit the input and output budgets."""
+        source_costs = {sid: self._cost({"id": sid, "text": text}) for sid, text in (sources or {}).items()}
+        shards: list[list[dict]] = []
+        current: list[dict] = []
+        current_sources: set[int] = set()
+        used = 0
+
+        for item in items:
+            item, cost = self._fit(item, source_costs)
+            refs = set(item.get("sources") or ())
+            added = cost - sum(source_costs.get(sid, 0) for sid in refs & current_sources)
+            if current and (used + added > self._item_budget or len(current) >= self._max_items):
+                shards.append(current)
+                current, current_sources, used = [], set(), 0
+                added = cost
+            current.append(item)
+            current_sources |= refs
+            used += added
+
+        if current:
+            shards.append(current)
+        return shards
+
+    def _cost(self, item: dict) -> int:
+        """Token cost of one item as it appears in the serialised prompt."""
+        return self._count_tokens(json.dumps(item)) + _ITEM_OVERHEAD_TOKENS
+
+    def _standalone_cost(self, item: dict, source_costs: dict[int, int]) -> int:
+        """Cost of an item alone in a shard, including every source it references."""
+        return self._cost(item) + sum(source_costs.get(sid, 0) for sid in item.get("sources") or ())
+
+    def _fit(self, item: dict, source_costs: dict[int, int]) -> tuple[dict, int]:
+        """Drop trailing sources, then trim context, until an item fits a shard on its own."""
+        cost = self._standalone_cost(item, source_costs)
+        if cost <= self._item_budget:
+            return item, cost
+
+        original_cost = cost
+        refs = list(item.get("sources") or ())
+        while cost > self._item_budget and len(refs) > 1:
+            refs = refs[:-1]
+            item = {**item, "sources": refs}
+            cost = self._standalone_cost(item, source_costs)
+
+        context = item.get("context") or ""
+        while cost > self._item_budget and context:
+            keep = int(len(context) * min(0.9, self._item_budget / cost))
+            context = context[:keep]
+            item = {**item, "context": context}
+            cost = self._standalone_cost(item, source_costs)
+
+        logger.warning(
+            "Trimmed oversized prompt item question_id=%s tokens_before=%s tokens_after=%s budget=%s",
+            item.get("question_id"),
+            original_cost,
+            cost,
+            self._item_budget,
+        )
+        return item, cost
@@ -1,22 +1,50 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import time
 from typing import List
 import json
 
-from answer_gen.storage.db import build_connection
-from answer_gen.storage.persistence import Persistence
-from answer_gen.storage import Answer, Question
-from answer_gen.utils.embedder import Embedder
-from answer_gen.utils.generative import generate_answers
+from answer_gen.storage.db import build_async_connection
+from answer_gen.storage.async_persistence import AsyncPersistence
+from answer_gen.storage import Answer, Question, Job
+from answer_gen.storage.factories import job_factory
+from answer_gen.utils.embedder import get_embedder
+from answer_gen.utils.generative import generate_answers, stream_answers, submit_answer_batch
+from answer_gen.utils.generative.clients.base import BatchStatus, GenerativeClient
+from answer_gen.utils.generative.clients.rate_limiter import RequestPriority
 from answer_gen.utils.generative.mappers import map_answers
+from answer_gen.utils.generative.parsers import parse_answer_json
 from answer_gen.utils.generative.parsers.answer_parser import GenerativeAnswerResponse
 from answer_gen.utils.config.answer_worker_config import BulkAnswerWorkerConfig
+from answer_gen.utils.file_utils import read_file_async
+from answer_gen.components.answers.prompt_packer import PromptPacker, get_token_counter
+from answer_gen.components.answers.context_builder import ContextBuilder
+from answer_gen.components.answers.semantic_cache import SemanticAnswerCache, record_llm_calls_avoided
 
 from answer_gen.exceptions import DatabaseQueryError
 
 logger = logging.getLogger(__name__)
 
+BULK_ANSWER_JOB_KIND = "bulk_answer"
+
+
+def build_bulk_answer_job(rfp_id: int, batch: bool | None = None, use_cache: bool = True) -> Job:
+    """Build a queued job that answers every unanswered question of ``rfp_id``.
+
+    ``batch`` selects Batch API execution; None leaves it to ``bulk_batch_mode``. Without
+    ``use_cache`` the job skips the semantic answer cache and the LLM response cache.
+    """
+    payload = {"rfp_id": rfp_id}
+    if batch is not None:
+        payload["batch"] = batch
+    if not use_cache:
+        payload["use_cache"] = False
+    return job_factory(BULK_ANSWER_JOB_KIND, payload=payload)
+
+
 class RfpBulkAnswerWorker:
     """Generate answers for all questions of an RFP, skipping those already answered."""
 
@@ -24,21 +52,39 @@ class RfpBulkAnswerWorker:
         self,
         db_url: str,
         config: BulkAnswerWorkerConfig,
-        generative_client,
+        generative_client: GenerativeClient,
     ):
         """Initialize bulk-answer generation dependencies and configuration."""
         self._db_url = db_url
         self._config = config
         self._generative_client = generative_client
-        self._embedder = Embedder(config.embedding_model, batch_size = config.embedding_batch_size)
+        self._embedder = get_embedder(
+            config.embedding_model,
+            batch_size = config.embedding_batch_size,
+            batch_window_ms = config.embedding_batch_window_ms,
+        )
         self._answer_version_id = None
+        self._chunk_version_id = None
+        self._packer: PromptPacker | None = None
+        self._context_builder: ContextBuilder | None = None
+        self._semantic_cache = None
+        if config.semantic_cache_min_similarity is not None:
+            self._semantic_cache = SemanticAnswerCache(
+                config.semantic_cache_min_similarity,
+                config.semantic_cache_candidates,
+                ef_search=config.ef_search,
+                probes=config.probes,
+            )
 
-    async def __call__(self, rfp_id: int):
-        """Generate missing answers for all questions under an RFP and return grouped results."""
-        with build_connection(self._db_url) as session:
+    async def __call__(self, rfp_id: int, use_cache: bool = True):
+        """Generate missing answers for all questions under an RFP and return grouped results.
+
+        ``use_cache=False`` regenerates through the LLM, bypassing the semantic and response caches.
+        """
+        async with build_async_connection(self._db_url) as session:
             # Load all questions once, including existing answers.
-            store = Persistence(session)
-            questions: List[Question] = store.get_questions_with_answers(rfp_id)
+            store = AsyncPersistence(session)
+            questions: List[Question] = await store.get_questions_with_answers(rfp_id)
 
             already_answered = [q for q in questions if q.answers]
             to_answer = [q for q in questions if not q.answers]
@@ -49,23 +95,7 @@ class RfpBulkAnswerWorker:
                 len(to_answer),
             )
 
-            new_answers, new_answers_by_q = [], {}
-            if to_answer:
-                try:
-                    new_answers, new_answers_by_q = await self._generate_new_answers(store, to_answer)
-                except Exception:
-                    logger.exception(
-                        "Bulk answer generation failed rfp_id=%s unanswered=%s model=%s",
-                        rfp_id,
-                        len(to_answer),
-                        self._config.answer_model,
-                    )
-                    raise
-
-            if new_answers:
-                store.bulk_insert_answers(new_answers)
-                store.commit()
-                logger.info("Inserted bulk answers rfp_id=%s inserted=%s", rfp_id, len(new_answers))
+            new_answers_by_q = await self._answer_in_shards(store, rfp_id, to_answer, use_cache=use_cache)
 
             result_questions = already_answered + to_answer
             return {
@@ -80,101 +110,537 @@ class RfpBulkAnswerWorker:
                 ],
             }
 
-    async def _generate_new_answers(self, store : Persistence, questions : list) -> tuple:
-            """Generate and map new answers for unanswered questions in one bulk LLM call."""
-            new_answers: List[Answer] = []
-            new_answers_by_q: dict[int, List[Answer]] = {}
+    async def run_job(self, job_id: int) -> dict:
+        """Job handler: answer an RFP in concurrent shards, recording progress after each shard commits."""
+        async with build_async_connection(self._db_url) as session:
+            store = AsyncPersistence(session)
+            job = await store.get_job(job_id)
+            rfp_id = int(job.payload["rfp_id"])
+            batch = job.payload.get("batch")
+            use_cache = job.payload.get("use_cache", True)
+            # A requeued batch job finds its submitted batch in the result checkpoint.
+            batch_state = dict(job.result or {}) if (self._config.bulk_batch_mode if batch is None else batch) else None
+
+            # Only unanswered questions are loaded, so a requeued job resumes after its last shard.
+            questions: List[Question] = await store.get_questions_with_answers(rfp_id)
+            to_answer = [q for q in questions if not q.answers]
+            await store.set_job_total(job_id, len(to_answer))
+            await store.commit()
+
+            async def on_shard(shard: List[Question], _answers: List[Answer]) -> None:
+                await store.add_job_progress(job_id, done=len(shard))
+                await store.commit()
+
+            new_answers_by_q = await self._answer_in_shards(
+                store,
+                rfp_id,
+                to_answer,
+                on_shard,
+                batch_job_id=job_id if batch_state is not None else None,
+                batch_state=batch_state,
+                use_cache=use_cache,
+            )
+
+        return {"rfp_id": rfp_id, "answered": sum(len(a) for a in new_answers_by_q.values())}
+
+    async def fetch_answered_questions(self, rfp_id: int, exclude: set[int] | None = None) -> list[dict]:
+        """Return answered questions of an RFP (minus ``exclude``) as API-friendly payloads."""
+        exclude = exclude or set()
+        async with build_async_connection(self._db_url) as session:
+            questions = await AsyncPersistence(session).get_questions_with_answers(rfp_id)
+            return [
+                {"id": q.id, "content": q.content, "answers": [a.to_dict() for a in q.answers]}
+                for q in questions
+                if q.answers and q.id not in exclude
+            ]
+
+    async def _answer_in_shards(self, store : AsyncPersistence, rfp_id : int, questions : List[Question], on_shard=None,
+                                batch_job_id : int | None = None, batch_state : dict | None = None,
+                                use_cache : bool = True) -> dict[int, List[Answer]]:
+        """Generate answers for token-packed shards concurrently, committing each shard as it lands.
+
+        LLM calls run up to ``bulk_concurrency`` at a time; inserts and commits stay sequential
+        because every shard shares the one session. With ``bulk_streaming`` a shard's answers are
+        committed as the streamed completion produces them rather than once it finishes. With a
+        ``batch_job_id`` the shards go through the Batch API instead (see `_answer_via_batch`).
+        Without ``use_cache`` neither the semantic cache nor the LLM response cache is consulted.
+        """
+        new_answers_by_q: dict[int, List[Answer]] = {}
+        if not questions:
+            return new_answers_by_q
+
+        answer_version_id = await self._get_version_id(store, self._config.answer_version_name) if self._answer_version_id is None else self._answer_version_id
+        chunk_version_id = await self._get_chunk_version_id(store)
+        answer_fields = {"answer_version_id": answer_version_id, "chunk_version_id": chunk_version_id, "corpus_stamp": None}
+
+        # Embed unanswered questions for vector retrieval, reusing embeddings stored at parse time.
+        embeddings = await self._question_embeddings(questions)
+
+        if self._semantic_cache is not None:
+            # Regenerated answers are stamped too, so later lookups can reuse them.
+            answer_fields["corpus_stamp"] = await store.get_corpus_stamp(chunk_version_id)
+        if self._semantic_cache is not None and use_cache:
+            reused = await self._reuse_cached_answers(store, rfp_id, questions, embeddings, answer_fields, on_shard)
+            new_answers_by_q.update(reused)
+
+            remaining = [i for i, q in enumerate(questions) if q.id not in reused]
+            questions = [questions[i] for i in remaining]
+            embeddings = [embeddings[i] for i in remaining]
+            if not questions:
+                return new_answers_by_q
+
+        prompt_items, sources = await self._build_prompt(store, questions, embeddings)
+
+        # Tokenizing every item is CPU bound; keep it off the event loop.
+        packer = await self._get_packer()
+        shards = await asyncio.to_thread(packer.pack, prompt_items, sources)
+        questions_by_id = {q.id: q for q in questions}
+        logger.info(
+            "Packed bulk answer shards rfp_id=%s questions=%s shards=%s concurrency=%s",
+            rfp_id,
+            len(questions),
+            len(shards),
+            self._config.bulk_concurrency,
+        )
+
+        if batch_job_id is not None:
+            await self._answer_via_batch(
+                store, batch_job_id, batch_state or {}, rfp_id, shards, sources, questions_by_id, answer_fields, new_answers_by_q, on_shard,
+                use_cache=use_cache,
+            )
+            return new_answers_by_q
+
+        semaphore = asyncio.Semaphore(max(1, self._config.bulk_concurrency))
+        # Shard tasks hand answers to the loop below, which alone touches the session. Each task
+        # ends with an ``(index, None, error_or_None)`` marker.
+        landed: asyncio.Queue = asyncio.Queue()
+
+        async def generate_shard(index: int, items: list[dict]):
+            shard = [questions_by_id[item["question_id"]] for item in items]
+            async with semaphore:
+                try:
+                    if self._config.bulk_streaming:
+                        async for answered, new_answers in self._stream_new_answers(shard, items, sources, answer_fields, use_cache):
+                            landed.put_nowait((index, answered, new_answers))
+                    else:
+                        new_answers, _ = await self._generate_new_answers(shard, items, sources, answer_fields, use_cache)
+                        landed.put_nowait((index, shard, new_answers))
+                except Exception as exc:
+                    logger.exception(
+                        "Bulk answer generation failed rfp_id=%s shard_index=%s shard_size=%s model=%s",
+                        rfp_id,
+                        index,
+                        len(shard),
+                        self._config.answer_model,
+                    )
+                    landed.put_nowait((index, None, exc))
+                else:
+                    landed.put_nowait((index, None, None))
+
+        tasks = [asyncio.create_task(generate_shard(i, items)) for i, items in enumerate(shards)]
+        try:
+            unfinished = len(tasks)
+            while unfinished:
+                batch = [await landed.get()]
+                while not landed.empty():
+                    batch.append(landed.get_nowait())
+
+                # Whatever landed meanwhile is committed in one go per shard.
+                by_shard: dict[int, tuple[list[Question], list[Answer]]] = {}
+                for index, answered, payload in batch:
+                    if answered is None:
+                        unfinished -= 1
+                        if payload is not None:
+                            raise payload
+                        continue
+                    shard_questions, shard_answers = by_shard.setdefault(index, ([], []))
+                    shard_questions.extend(answered)
+                    shard_answers.extend(payload)
+
+                for index, (answered, new_answers) in by_shard.items():
+                    await self._commit_shard(store, rfp_id, index, answered, new_answers, new_answers_by_q, on_shard)
+        finally:
+            # A failed shard or commit aborts the rest; committed shards are kept for a requeue.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return new_answers_by_q
+
+    async def _commit_shard(self, store : AsyncPersistence, rfp_id : int, index, answered : List[Question], new_answers : List[Answer],
+                            new_answers_by_q : dict[int, List[Answer]], on_shard=None) -> None:
+        if new_answers:
+            await store.bulk_insert_answers(new_answers)
+            await store.commit()
+            logger.info("Inserted bulk answer shard rfp_id=%s shard_index=%s inserted=%s", rfp_id, index, len(new_answers))
+
+        new_answers_by_q.update({answer.question_id: [answer] for answer in new_answers})
+        if on_shard is not None:
+            await on_shard(answered, new_answers)
+
+    async def _answer_via_batch(
+        self,
+        store : AsyncPersistence,
+        job_id : int,
+        batch_state : dict,
+        rfp_id : int,
+        shards : list[list[dict]],
+        sources : dict[int, str],
+        questions_by_id : dict[int, Question],
+        answer_fields : dict,
+        new_answers_by_q : dict[int, List[Answer]],
+        on_shard=None,
+        use_cache : bool = True,
+    ) -> None:
+        """Submit every shard as one Batch API request, wait for the batch, then commit shard by shard.
+
+        The batch id and the question ids behind each custom id are checkpointed in the job's
+        result, so a requeued job polls the batch it already submitted instead of paying again.
+        Shards without a usable batch output, and questions added after submission, are answered
+        with direct calls; questions missing from an output get the usual retry and fallback.
+        """
+        items_by_qid = {item["question_id"]: item for items in shards for item in items}
+        batch_id = batch_state.get("batch_id")
+        batch_shards: dict[str, list[int]] = batch_state.get("shards") or {}
+
+        if batch_id is None:
+            payloads = {f"job-{job_id}-shard-{i}": self._bulk_payload(items, sources) for i, items in enumerate(shards)}
+            batch_shards = {custom_id: [item["question_id"] for item in items] for custom_id, items in zip(payloads, shards)}
+            batch_id = await submit_answer_batch(
+                self._generative_client,
+                self._config.answer_prompt_path,
+                self._config.answer_model,
+                payloads,
+            )
+            await store.set_job_result(job_id, {"batch_id": batch_id, "shards": batch_shards})
+            await store.commit()
+            logger.info("Submitted bulk answer batch rfp_id=%s job_id=%s batch_id=%s shards=%s", rfp_id, job_id, batch_id, len(batch_shards))
+        else:
+            logger.info("Resuming bulk answer batch rfp_id=%s job_id=%s batch_id=%s", rfp_id, job_id, batch_id)
+
+        batch = await self._wait_for_batch(batch_id)
 
-            # Embed unanswered questions for vector retrieval.
-            embeddings = self._embedder([q.content for q in questions])
+        planned: list[tuple[str | None, list[Question]]] = [
+            (custom_id, [questions_by_id[qid] for qid in question_ids if qid in questions_by_id])
+            for custom_id, question_ids in batch_shards.items()
+        ]
+        covered = {q.id for _custom_id, shard in planned for q in shard}
+        unplanned = [items_by_qid[qid] for qid in questions_by_id if qid not in covered]
+        if unplanned:
+            logger.warning("Bulk answer questions not in batch rfp_id=%s batch_id=%s count=%s; answering directly", rfp_id, batch_id, len(unplanned))
+            packer = await self._get_packer()
+            for items in await asyncio.to_thread(packer.pack, unplanned, sources):
+                planned.append((None, [questions_by_id[item["question_id"]] for item in items]))
 
-            prompt_questions = self._build_prompt(store, questions, embeddings)
-            # Send one bulk prompt to the LLM.
+        for index, (custom_id, shard) in enumerate(planned):
+            if not shard:
+                # Answered since submission (e.g. committed before a requeue).
+                continue
+            items = [items_by_qid[q.id] for q in shard]
+            responses = self._parse_batch_output(batch, custom_id)
+            if responses:
+                matched = self._match_responses(shard, responses)
+                completed = await self._complete_responses(shard, items, sources, matched, use_cache=use_cache)
+                new_answers = map_answers(completed, [q.id for q in shard], **answer_fields)
+            else:
+                new_answers, _ = await self._generate_new_answers(shard, items, sources, answer_fields, use_cache)
+            await self._commit_shard(store, rfp_id, index, shard, new_answers, new_answers_by_q, on_shard)
 
+    async def _wait_for_batch(self, batch_id : str) -> BatchStatus:
+        """Poll until the batch finishes; past ``bulk_batch_max_wait_seconds`` it is cancelled and treated as expired."""
+        deadline = time.monotonic() + self._config.bulk_batch_max_wait_seconds
+        while True:
             try:
-                responses = await generate_answers(
-                    self._generative_client,
-                    self._config.answer_prompt_path,
-                    self._config.answer_model,
-                    question_text=json.dumps(prompt_questions),
-                )
+                batch = await self._generative_client.get_batch(batch_id)
             except Exception:
-                logger.exception(
-                    "LLM bulk call failed question_count=%s model=%s",
-                    len(questions),
-                    self._config.answer_model,
+                # Polling is idempotent; a transient error just waits for the next round.
+                logger.warning("Polling bulk answer batch failed batch_id=%s", batch_id, exc_info=True)
+            else:
+                if batch.is_finished:
+                    logger.info("Bulk answer batch finished batch_id=%s status=%s outputs=%s", batch_id, batch.status, len(batch.outputs))
+                    return batch
+
+            if time.monotonic() >= deadline:
+                logger.warning("Gave up waiting for bulk answer batch batch_id=%s", batch_id)
+                # The shards are answered directly next; don't leave the batch running (and billing).
+                try:
+                    await self._generative_client.cancel_batch(batch_id)
+                except Exception:
+                    logger.warning("Cancelling bulk answer batch failed batch_id=%s", batch_id, exc_info=True)
+                return BatchStatus("expired")
+            await asyncio.sleep(self._config.bulk_batch_poll_interval_seconds)
+
+    def _parse_batch_output(self, batch : BatchStatus, custom_id : str | None) -> list[GenerativeAnswerResponse]:
+        """Parsed answers of one batch request; empty when it has no usable output."""
+        output = batch.outputs.get(custom_id) if custom_id is not None else None
+        if output is None:
+            if custom_id is not None:
+                logger.warning(
+                    "Bulk answer batch has no output custom_id=%s status=%s error=%s; answering directly",
+                    custom_id,
+                    batch.status,
+                    batch.errors.get(custom_id),
                 )
-                raise
-
-            # Map generated responses back to question IDs.
-            responses = self._normalize_responses(questions, responses)
-            mapped_all = map_answers(
-                responses,
-                [q.id for q in questions],
-                answer_version_id= self._get_version_id(store, self._config.answer_version_name) if self._answer_version_id is None else self._answer_version_id,
-            )
+            return []
+        try:
+            return parse_answer_json(output)
+        except Exception:
+            logger.warning("Unparseable bulk answer batch output custom_id=%s; answering directly", custom_id)
+            return []
 
-            new_answers.extend(mapped_all)
-            new_answers_by_q = {
-                q.id: mapped_all[i : i + 1] for i, q in enumerate(questions)
-            }
+    async def _reuse_cached_answers(self, store : AsyncPersistence, rfp_id : int, questions : List[Question], embeddings : list, answer_fields : dict, on_shard=None) -> dict[int, List[Answer]]:
+        """Commit answers copied from near-duplicate questions as one shard, before any LLM call."""
+        reused = await self._semantic_cache.lookup(
+            store, questions, embeddings, answer_fields["chunk_version_id"], answer_fields["corpus_stamp"]
+        )
+        if not reused:
+            return reused
+
+        reused_questions = [q for q in questions if q.id in reused]
+        reused_answers = [a for q in reused_questions for a in reused[q.id]]
+        await store.bulk_insert_answers(reused_answers)
+        await store.commit()
+        logger.info("Reused cached answers rfp_id=%s reused=%s", rfp_id, len(reused_answers))
+
+        # Bulk hits are counted in calls of a full shard.
+        record_llm_calls_avoided(math.ceil(len(reused_questions) / (await self._get_packer()).max_items))
+        if on_shard is not None:
+            await on_shard(reused_questions, reused_answers)
+        return reused
+
+    async def _generate_new_answers(self, questions : List[Question], prompt_items : list[dict], sources : dict[int, str], answer_fields : dict,
+                                    use_cache : bool = True) -> tuple:
+        """Generate and map new answers for one shard, matching responses by question id."""
+        responses = await self._call_llm(prompt_items, sources, use_cache)
+        matched = self._match_responses(questions, responses)
 
-            return new_answers, new_answers_by_q
+        responses = await self._complete_responses(questions, prompt_items, sources, matched, use_cache=use_cache)
+        new_answers = map_answers(
+            responses,
+            [q.id for q in questions],
+            **answer_fields,
+        )
+        new_answers_by_q = {q.id: [answer] for q, answer in zip(questions, new_answers)}
+
+        return new_answers, new_answers_by_q
+
+    async def _stream_new_answers(self, questions : List[Question], prompt_items : list[dict], sources : dict[int, str], answer_fields : dict,
+                                  use_cache : bool = True):
+        """Yield ``(questions, answers)`` for one shard as the streamed completion closes each answer.
+
+        Questions the stream skipped get the same retry and fallback as `_generate_new_answers`.
+        """
+        questions_by_id = {q.id: q for q in questions}
+        answered: set[int] = set()
+        unmatched: list[GenerativeAnswerResponse] = []
+        async for response in self._stream_llm(prompt_items, sources, use_cache):
+            question = questions_by_id.get(response.question_id)
+            if question is None or question.id in answered:
+                unmatched.append(response)
+                continue
+            answered.add(question.id)
+            yield [question], map_answers([response], [question.id], **answer_fields)
+
+        remaining = [i for i, q in enumerate(questions) if q.id not in answered]
+        if not remaining:
+            return
+
+        rest = [questions[i] for i in remaining]
+        # Positional matching is only safe when the model echoed no usable ids at all.
+        matched = self._match_responses(rest, [] if answered else unmatched)
+        responses = await self._complete_responses(
+            rest, [prompt_items[i] for i in remaining], sources, matched, shard_size=len(questions), use_cache=use_cache
+        )
+        yield rest, map_answers(responses, [q.id for q in rest], **answer_fields)
 
-    def _normalize_responses(
+    async def _complete_responses(
+        self,
+        questions: list[Question],
+        prompt_items: list[dict],
+        sources: dict[int, str],
+        matched: list[GenerativeAnswerResponse | None],
+        shard_size: int | None = None,
+        use_cache: bool = True,
+    ) -> list[GenerativeAnswerResponse]:
+        """Give questions the model skipped one more, smaller call, then fall back for the rest.
+
+        The retry is skipped when the model answered nothing of its ``shard_size`` questions.
+        """
+        matched = list(matched)
+        missing = [i for i, response in enumerate(matched) if response is None]
+        if missing and len(missing) < (shard_size or len(questions)):
+            retry_responses = await self._call_llm([prompt_items[i] for i in missing], sources, use_cache)
+            retried = self._match_responses([questions[i] for i in missing], retry_responses)
+            for i, response in zip(missing, retried):
+                matched[i] = response
+
+        return self._fill_missing_responses(questions, matched)
+
+    def _bulk_payload(self, prompt_items : list[dict], sources : dict[int, str]) -> str:
+        """Serialize ``prompt_items`` with only the sources they reference."""
+        referenced = sorted({sid for item in prompt_items for sid in item.get("sources") or ()})
+        return json.dumps({
+            "sources": [{"id": sid, "text": sources[sid]} for sid in referenced],
+            "questions": prompt_items,
+        })
+
+    async def _stream_llm(self, prompt_items : list[dict], sources : dict[int, str], use_cache : bool = True):
+        """Stream one bulk prompt, yielding each answer as soon as it is parsed."""
+        try:
+            async for response in stream_answers(
+                self._generative_client,
+                self._config.answer_prompt_path,
+                self._config.answer_model,
+                question_text=self._bulk_payload(prompt_items, sources),
+                use_cache=use_cache,
+                priority=RequestPriority.BULK,
+            ):
+                yield response
+        except Exception:
+            logger.exception(
+                "LLM bulk stream failed question_count=%s model=%s",
+                len(prompt_items),
+                self._config.answer_model,
+            )
+            raise
+
+    async def _call_llm(self, prompt_items : list[dict], sources : dict[int, str], use_cache : bool = True) -> list[GenerativeAnswerResponse]:
+        """Send one bulk prompt for ``prompt_items`` with only the sources they reference."""
+        try:
+            return await generate_answers(
+                self._generative_client,
+                self._config.answer_prompt_path,
+                self._config.answer_model,
+                question_text=self._bulk_payload(prompt_items, sources),
+                use_cache=use_cache,
+                # Queued behind interactive single-answer requests when the model is saturated.
+                priority=RequestPriority.BULK,
+            )
+        except Exception:
+            logger.exception(
+                "LLM bulk call failed question_count=%s model=%s",
+                len(prompt_items),
+                self._config.answer_model,
+            )
+            raise
+
+    def _match_responses(
         self,
         questions: list[Question],
         responses: list[GenerativeAnswerResponse],
+    ) -> list[GenerativeAnswerResponse | None]:
+        """Align responses to ``questions`` by echoed ``question_id``; ``None`` marks a missing answer.
+
+        Falls back to positional matching only when the model echoed no usable ids and
+        returned exactly one response per question.
+        """
+        expected_ids = {q.id for q in questions}
+        by_id: dict[int, GenerativeAnswerResponse] = {}
+        for response in responses:
+            if response.question_id in expected_ids and response.question_id not in by_id:
+                by_id[response.question_id] = response
+
+        if not by_id and len(responses) == len(questions):
+            logger.warning(
+                "Bulk LLM responses carried no question ids count=%s model=%s; matching by position",
+                len(responses),
+                self._config.answer_model,
+            )
+            return list(responses)
+
+        if len(by_id) != len(responses):
+            logger.warning(
+                "Ignored bulk LLM responses with unknown or duplicate question ids received=%s matched=%s model=%s",
+                len(responses),
+                len(by_id),
+                self._config.answer_model,
+            )
+        return [by_id.get(q.id) for q in questions]
+
+    def _fill_missing_responses(
+        self,
+        questions: list[Question],
+        responses: list[GenerativeAnswerResponse | None],
     ) -> list[GenerativeAnswerResponse]:
-        """Force a 1:1 response/question mapping by trimming or padding with fallback answers."""
-        expected = len(questions)
-        actual = len(responses)
-        if actual == expected:
-            return responses
+        """Replace missing responses with explicit low-confidence fallback answers."""
+        missing = [q.id for q, response in zip(questions, responses) if response is None]
+        if not missing:
+            return list(responses)
 
         logger.warning(
-            "Bulk LLM response size mismatch expected=%s actual=%s model=%s; normalizing output",
-            expected,
-            actual,
+            "Bulk LLM response missing answers question_ids=%s model=%s; storing fallback answers",
+            missing,
             self._config.answer_model,
         )
+        return [
+            response if response is not None else GenerativeAnswerResponse(
+                answer=f"No information was available to describe {question.content}",
+                confidence="low",
+                sources=[],
+                coverage="insufficient",
+                notes="Generated fallback due to missing LLM answer for this question.",
+                question_id=question.id,
+            )
+            for question, response in zip(questions, responses)
+        ]
 
-        normalized = list(responses[:expected])
-        if len(normalized) < expected:
-            for question in questions[len(normalized):]:
-                normalized.append(
-                    GenerativeAnswerResponse(
-                        answer=f"No information was available to describe {question.content}",
-                        confidence="low",
-                        sources=[],
-                        coverage="insufficient",
-                        notes="Generated fallback due to missing LLM answer for this question.",
-                    )
-                )
-        return normalized
-
-    def _build_prompt(self, store : Persistence, questions, embeddings) -> list:
-        """Build per-question prompt payloads with retrieval context from similar chunks."""
-        prompt_questions = []
-
-        for question, q_emb in zip(questions, embeddings):
-            chunks = list(
-                store.get_most_similar_chunks(
-                    q_emb,
-                    self._config.min_similarity,
-                    self._config.top_k,
-                    chunk_version_name=self._config.chunk_version_name,
-                )
+    async def _get_packer(self) -> PromptPacker:
+        """Build the token-budgeted prompt packer once from the bulk prompt template."""
+        if self._packer is None:
+            template = await read_file_async(self._config.answer_prompt_path)
+            self._packer = PromptPacker(
+                get_token_counter(self._config.answer_model),
+                template,
+                max_input_tokens=self._config.bulk_max_input_tokens,
+                max_output_tokens=self._config.bulk_max_output_tokens,
+                output_tokens_per_item=self._config.bulk_output_tokens_per_answer,
+                max_items=max(1, self._config.bulk_shard_size),
             )
-            context = " | ".join([c.content for c in chunks]) if chunks else ""
-            prompt_questions.append({"question" : question.content, "context" : context})
+        return self._packer
+
+    def _get_context_builder(self) -> ContextBuilder:
+        """Build the token-budgeted context builder once for the answer model."""
+        if self._context_builder is None:
+            self._context_builder = ContextBuilder(get_token_counter(self._config.answer_model), self._config.max_context_tokens)
+        return self._context_builder
 
-        return prompt_questions
+    async def _question_embeddings(self, questions: List[Question]) -> list:
+        """Return one embedding per question, encoding only those without a stored embedding."""
+        embeddings = [q.embedding for q in questions]
+        missing = [i for i, emb in enumerate(embeddings) if emb is None]
+        if missing:
+            vectors = await self._embedder.aencode([questions[i].content for i in missing])
+            for i, vector in zip(missing, vectors):
+                embeddings[i] = vector
+                # Stored with the shard's answers so later RFPs can find it in the semantic cache.
+                questions[i].embedding = vector
+        return embeddings
+
+    async def _build_prompt(self, store : AsyncPersistence, questions, embeddings) -> tuple[list[dict], dict[int, str]]:
+        """Build per-question prompt payloads that reference a shared, deduplicated source table."""
+        # One batched retrieval round trip for every question instead of one query each.
+        chunks_by_question = await store.get_most_similar_chunks_batch(
+            embeddings,
+            self._config.min_similarity,
+            self._config.top_k,
+            chunk_version_id=await self._get_chunk_version_id(store),
+            oversample=self._config.retrieval_oversample,
+            ef_search=self._config.ef_search,
+            probes=self._config.probes,
+        )
+
+        # Merging and tokenizing passages is CPU bound; keep it off the event loop.
+        sources, refs = await asyncio.to_thread(self._get_context_builder().build_shared, chunks_by_question)
+        prompt_questions = [
+            {"question_id" : question.id, "question" : question.content, "sources" : source_ids}
+            for question, source_ids in zip(questions, refs)
+        ]
+        return prompt_questions, sources
 
 
-    def _get_version_id(self, store : Persistence, version_name : str):
+    async def _get_version_id(self, store : AsyncPersistence, version_name : str):
         """Resolve and cache the configured answer version id for bulk inserts."""
-        version = store.get_answer_version_by_name(version_name)
+        version = await store.get_answer_version_by_name(version_name)
 
         if version is None:
             err_msg = f'No answer version with name {version_name}'
@@ -183,3 +649,16 @@ class RfpBulkAnswerWorker:
 
         self._answer_version_id = version.id
         return self._answer_version_id
+
+    async def _get_chunk_version_id(self, store : AsyncPersistence) -> int | None:
+        """Resolve and cache the configured chunk version id used to scope retrieval."""
+        if self._chunk_version_id is None and self._config.chunk_version_name is not None:
+            version = await store.get_chunk_version(self._config.chunk_version_name)
+
+            if version is None:
+                err_msg = f'No chunk version with name {self._config.chunk_version_name}'
+                logger.warning(err_msg)
+                raise DatabaseQueryError(err_msg)
+
+            self._chunk_version_id = version.id
+        return self._chunk_version_id
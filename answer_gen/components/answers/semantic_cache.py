@@ -0,0 +1,98 @@
+"""Reuse answers of near-duplicate questions from earlier RFPs instead of calling the LLM."""
+
+from __future__ import annotations
+
+import logging
+from threading import Lock
+from typing import Sequence
+
+from answer_gen.storage import Answer, Question
+from answer_gen.storage.async_persistence import AsyncPersistence
+from answer_gen.storage.factories import answer_factory
+
+logger = logging.getLogger(__name__)
+
+# Fallback answers name their own question, so they are never reused for another one.
+_NO_INFORMATION_PREFIX = "No information was available to describe"
+
+_STATS_LOCK = Lock()
+_STATS = {"lookups": 0, "hits": 0, "llm_calls_avoided": 0}
+
+
+def record_llm_calls_avoided(count: int) -> None:
+    """Count LLM calls that cache hits made unnecessary."""
+    with _STATS_LOCK:
+        _STATS["llm_calls_avoided"] += count
+
+
+def get_semantic_cache_stats() -> dict:
+    """Process-wide lookup, hit and avoided-call counters for the semantic answer cache."""
+    with _STATS_LOCK:
+        lookups = _STATS["lookups"]
+        return {
+            **_STATS,
+            "misses": lookups - _STATS["hits"],
+            "hit_rate": round(_STATS["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+class SemanticAnswerCache:
+    """Find answers of prior questions whose embeddings are within ``min_similarity``.
+
+    Only answers grounded on the same chunk version and corpus stamp qualify, so adding or
+    removing documents invalidates every earlier answer without an explicit purge.
+    """
+
+    def __init__(self, min_similarity: float, candidates: int = 5, ef_search: int | None = None, probes: int | None = None):
+        """Configure the reuse threshold, how many nearest questions to inspect and the ANN recall knobs."""
+        self._min_similarity = min_similarity
+        self._candidates = max(1, candidates)
+        self._ef_search = ef_search
+        self._probes = probes
+
+    async def lookup(
+        self,
+        store: AsyncPersistence,
+        questions: Sequence[Question],
+        embeddings: Sequence,
+        chunk_version_id: int | None,
+        corpus_stamp: str,
+    ) -> dict[int, list[Answer]]:
+        """Return new, unsaved answers copied from near-duplicate questions, keyed by question id."""
+        matches = await store.get_similar_answers_batch(
+            embeddings,
+            self._min_similarity,
+            self._candidates,
+            chunk_version_id,
+            corpus_stamp,
+            ef_search=self._ef_search,
+            probes=self._probes,
+            exclude_question_ids=[question.id for question in questions],
+            exclude_content_prefix=_NO_INFORMATION_PREFIX,
+        )
+
+        reused: dict[int, list[Answer]] = {}
+        for question, match in zip(questions, matches):
+            if match is None:
+                continue
+            answer, similarity = match
+            reused[question.id] = [
+                answer_factory(
+                    content=answer.content,
+                    question_id=question.id,
+                    answer_version_id=answer.answer_version_id,
+                    chunk_version_id=answer.chunk_version_id,
+                    corpus_stamp=answer.corpus_stamp,
+                )
+            ]
+            logger.info(
+                "Reusing cached answer question_id=%s source_answer_id=%s similarity=%.4f",
+                question.id,
+                answer.id,
+                similarity,
+            )
+
+        with _STATS_LOCK:
+            _STATS["lookups"] += len(questions)
+            _STATS["hits"] += len(reused)
+        return reused
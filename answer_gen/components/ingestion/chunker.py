@@ -1,5 +1,22 @@
+from functools import lru_cache
 from typing import Iterable
 
+_SEPARATORS = ('\n\n', '\n', ". ", "! ", "? ", " ", "")
+
+
+@lru_cache(maxsize=16)
+def get_splitter(model_name : str, chunk_chars : int, overlap : int):
+    """Build the tiktoken-backed splitter once per `(model_name, chunk_chars, overlap)`."""
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        model_name = model_name,
+        chunk_size = chunk_chars,
+        chunk_overlap = overlap,
+        separators = list(_SEPARATORS)
+    )
+
+
 class Chunker:
     def __init__(self, model_name : str, chunk_chars : int = 500, overlap : int = 50):
         """Configure token-aware chunking behavior for extracted document pages."""
@@ -9,14 +26,7 @@ class Chunker:
 
     def __call__(self, pages : Iterable[str]) -> list[str]:
         """Yield per-page chunk lists as `(page_number, split_chunks)` pairs."""
-        from langchain_text_splitters import RecursiveCharacterTextSplitter
-
-        splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            model_name = self._model_name,
-            chunk_size = self._chunk_chars,
-            chunk_overlap = self._overlap,
-            separators = ['\n\n', '\n', ". ", "! ", "? ", " ", ""]
-        )
+        splitter = get_splitter(self._model_name, self._chunk_chars, self._overlap)
 
         for page_number, page_text in pages:
             yield page_number, splitter.split_text(page_text)
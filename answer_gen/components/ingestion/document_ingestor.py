@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Iterable, Tuple, List
+from io import BytesIO
+from typing import AsyncIterator, Iterable, Tuple, List
 
 from answer_gen.components.ingestion.chunker import Chunker
-from answer_gen.utils.embedder import Embedder
-
-from answer_gen.storage import Document, Chunk, ChunkVersion
-from answer_gen.storage.persistence import Persistence
-from answer_gen.storage.factories import document_factory, chunk_factory
-
-from answer_gen.storage.db import build_bulk_connection
+from answer_gen.components.ingestion.parallel import ParallelChunkSource, build_process_pool
+from answer_gen.components.ingestion.streaming import (
+    ChunkTexts,
+    DocumentEnd,
+    DocumentStart,
+    StreamedDocument,
+    embed_chunks,
+    is_done,
+    plan_queue_sizes,
+    produce_chunks,
+)
+from answer_gen.utils.embedder import get_embedder
+from answer_gen.utils.config.document_ingestor_config import DocumentIngestorConfig
+
+from answer_gen.storage import Document, Chunk, ChunkVersion, Job, JobDocument, EMBEDDING_DIM
+from answer_gen.storage.async_persistence import AsyncPersistence
+from answer_gen.storage.factories import document_factory, chunk_factory, job_factory, job_document_factory
+from answer_gen.storage.job_document import JOB_DOCUMENT_FAILED, JOB_DOCUMENT_SKIPPED, JOB_DOCUMENT_SUCCEEDED
+
+from answer_gen.storage.db import build_async_bulk_connection, build_async_connection
 from answer_gen.utils.document_utils import get_document_hash, get_document_text
 
 import answer_gen.exceptions as exceptions
@@ -19,15 +33,19 @@ import answer_gen.exceptions as exceptions
 
 logger = logging.getLogger(__name__)
 
+INGESTION_JOB_KIND = "document_ingestion"
+
 
-@dataclass(frozen=True, slots=True)
-class DocumentIngestorConfig:
-    max_insert_chunks: int
-    chunk_window: int
-    chunk_overlap: int
-    chunk_token_model_name: str
-    chunk_version_name: str
-    embed_buffer_size: int | None = None
+def build_ingestion_job(document_count: int) -> Job:
+    """Build a queued ingestion job for ``document_count`` uploads, submitted as `JobDocument` rows."""
+    return job_factory(INGESTION_JOB_KIND, total_items=document_count)
+
+
+async def build_job_documents(uploads: Iterable[Tuple[str, str, object]]) -> AsyncIterator[JobDocument]:
+    """Yield a pending `JobDocument` per `(filename, doc_hash, upload)`, reading each upload only when it is written."""
+    for filename, doc_hash, upload in uploads:
+        await upload.seek(0)
+        yield job_document_factory(filename, doc_hash, await upload.read())
 
 
 class DocumentIngestorWorker:
@@ -48,7 +66,21 @@ class DocumentIngestorWorker:
             overlap=config.chunk_overlap,
         )
 
-        self._embedder = Embedder()
+        # Must match the query-side model, so use the configured model rather than defaults.
+        self._embedder = get_embedder(
+            config.embedding_model,
+            batch_size = config.embedding_batch_size,
+            batch_window_ms = config.embedding_batch_window_ms,
+        )
+
+        # Extraction/chunking is pure CPU; with workers configured it runs on other cores.
+        self._pool = build_process_pool(config.ingestion_workers) if config.ingestion_workers > 0 else None
+
+    def close(self) -> None:
+        """Shut down the extraction process pool, if any."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
 
     async def __call__(self, documents: Iterable[Tuple[str, bytes]]) -> List[tuple]:
         """Ingest a batch of (filename, bytes) documents and return inserted document IDs.
@@ -58,11 +90,11 @@ class DocumentIngestorWorker:
         failed_docs: dict[str, str] = {}
         logger.info("Starting document ingestion documents=%s", len(documents))
 
-        with build_bulk_connection(self._db_url) as session:
+        async with build_async_bulk_connection(self._db_url) as session:
             # Keep a single DB transaction/session for the ingestion batch.
-            persistence = Persistence(session)
+            persistence = AsyncPersistence(session)
             effective_chunk_version: ChunkVersion | None = (
-                persistence.get_chunk_version(self._config.chunk_version_name) if self._config.chunk_version_name else None
+                await persistence.get_chunk_version(self._config.chunk_version_name) if self._config.chunk_version_name else None
             )
             logger.info(
                 "Resolved chunk version requested=%s found=%s",
@@ -74,34 +106,39 @@ class DocumentIngestorWorker:
             if effective_chunk_version is None:
                 raise exceptions.InvalidResourceIdentifier(f"Chunk version {self._config.chunk_version_name} does not exist.")
 
-            to_insert = self._dedupe_documents(documents, persistence)
+            to_insert = await self._dedupe_documents(documents, persistence)
             logger.info("Deduplicated documents incoming=%s to_insert=%s", len(documents), len(to_insert))
 
             insert_batch: List[Chunk] = []
+            sources = [self._chunk_source(doc_content) for _, doc_content, _ in to_insert]
 
-            for filename, doc_content, doc_hash in to_insert:
+            for (filename, doc_content, doc_hash), source in zip(to_insert, sources):
                 doc_insert_batch: List[Chunk] = []
 
                 # Each document is inserted first so chunks can reference document ID.
                 document: Document | None = None
                 logger.info("Processing document filename=%s", filename)
                 try:
-                    document = self._insert_document(persistence, filename, filename, doc_hash)
-                    self._build_document_chunks(document, effective_chunk_version, doc_content, doc_insert_batch)
+                    document = await self._insert_document(persistence, filename, filename, doc_hash)
+                    await self._build_document_chunks(document, effective_chunk_version, doc_content, doc_insert_batch, source)
 
                     # Merge only fully successful document chunks into the shared batch.
                     if doc_insert_batch:
                         insert_batch.extend(doc_insert_batch)
                         if len(insert_batch) >= self._config.max_insert_chunks:
-                            self._bulk_insert_chunks(persistence, insert_batch[: self._config.max_insert_chunks])
+                            await self._bulk_insert_chunks(persistence, insert_batch[: self._config.max_insert_chunks])
                             del insert_batch[: self._config.max_insert_chunks]
                 except exceptions.StorageWriteError as e:
+                    if source is not None:
+                        source.cancel()
                     logger.warning("Document insert failed filename=%s error=%s", filename, str(e))
                     failed_docs[filename] = str(e)
                     continue
                 except Exception as e:
+                    if source is not None:
+                        source.cancel()
                     if document is not None:
-                        persistence.delete_document(document)
+                        await persistence.delete_document(document)
                     logger.exception("Document ingestion failed filename=%s", filename)
                     failed_docs[filename] = str(e)
                     continue
@@ -116,10 +153,10 @@ class DocumentIngestorWorker:
                 )
 
             if insert_batch:
-                self._bulk_insert_chunks(persistence, insert_batch)
+                await self._bulk_insert_chunks(persistence, insert_batch)
                 insert_batch.clear()
 
-            persistence.commit()
+            await persistence.commit()
             logger.info("Committed document ingestion batch inserted=%s failed=%s", len(inserted_ids), len(failed_docs))
 
         if len(failed_docs) == len(documents):
@@ -134,22 +171,203 @@ class DocumentIngestorWorker:
         )
         return inserted_ids, failed_docs
 
-    def _build_document_chunks(self, document : Document,
-                               chunk_version : ChunkVersion, doc_content, insert_batch : list):
+    def _chunk_source(self, doc_content: bytes) -> ParallelChunkSource | None:
+        """Start pool extraction for one document, or return None to chunk it inline."""
+        if self._pool is None:
+            return None
+        chunker_args = (self._config.chunk_token_model_name, self._config.chunk_window, self._config.chunk_overlap)
+        return ParallelChunkSource(self._pool, doc_content, self._config.pages_per_task, chunker_args)
+
+    @property
+    def streaming(self) -> bool:
+        return self._config.streaming_ingestion
+
+    async def ingest_stream(self, documents: Iterable[StreamedDocument]) -> List[tuple]:
+        """Ingest spooled uploads through bounded extract/chunk/embed/insert stages.
+
+        Each document is committed under its own SAVEPOINT, so a failure only drops that document.
+        """
+        documents = list(documents)
+        inserted_ids, failed_docs, _ = await self._ingest_stream(documents)
+
+        if documents and len(failed_docs) == len(documents):
+            fails = str(len(failed_docs))
+            logger.warning("All document uploads failed total=%s", fails)
+            raise exceptions.BulkUploadFailed(f'Failed to upload all {fails} documents. Could you please retry with other documents?')
+
+        return inserted_ids, failed_docs
+
+    async def run_job(self, job_id: int) -> dict:
+        """Job handler: ingest the job's pending uploads one by one, recording progress as it goes.
+
+        Processed uploads are marked and their bytes dropped, so a requeued job resumes where it stopped.
+        """
+        async with build_async_connection(self._db_url) as session:
+            pending_ids = await AsyncPersistence(session).get_pending_job_document_ids(job_id)
+        logger.info("Running ingestion job job_id=%s pending=%s", job_id, len(pending_ids))
+
+        for job_document_id in pending_ids:
+            async with build_async_connection(self._db_url) as session:
+                job_document = await AsyncPersistence(session).get_job_document(job_document_id)
+                filename, doc_hash, content = job_document.filename, job_document.doc_hash, job_document.content
+
+            error = None
+            try:
+                inserted_ids, failed_docs, chunk_counts = await self._ingest_stream(
+                    [StreamedDocument(filename, BytesIO(content or b""), doc_hash)]
+                )
+            except Exception as e:
+                logger.exception("Ingestion job document failed job_id=%s filename=%s", job_id, filename)
+                inserted_ids, failed_docs, chunk_counts, error = [], {}, {}, str(e)
+            del content
+
+            async with build_async_connection(self._db_url) as session:
+                store = AsyncPersistence(session)
+                job_document = await store.get_job_document(job_document_id)
+                job_document.content = None
+                if inserted_ids:
+                    job_document.status = JOB_DOCUMENT_SUCCEEDED
+                    job_document.document_id = inserted_ids[0]
+                    job_document.chunk_count = chunk_counts.get(filename, 0)
+                elif error is not None or failed_docs:
+                    job_document.status = JOB_DOCUMENT_FAILED
+                    job_document.error = error or failed_docs.get(filename)
+                else:
+                    # Already ingested by an earlier upload.
+                    job_document.status = JOB_DOCUMENT_SKIPPED
+                failed = job_document.status == JOB_DOCUMENT_FAILED
+                await store.add_job_progress(job_id, done=0 if failed else 1, failed=1 if failed else 0, chunks=job_document.chunk_count)
+                await store.commit()
+
+        async with build_async_connection(self._db_url) as session:
+            job = await AsyncPersistence(session).get_job(job_id)
+            documents = list(job.documents)
+
+        return {
+            "inserted_document_ids": [d.document_id for d in documents if d.status == JOB_DOCUMENT_SUCCEEDED],
+            "failed": {d.filename: d.error for d in documents if d.status == JOB_DOCUMENT_FAILED},
+        }
+
+    async def _ingest_stream(self, documents: List[StreamedDocument]) -> tuple[List[int], dict[str, str], dict[str, int]]:
+        """Run the streaming pipeline; returns inserted ids, failures and chunk counts by filename."""
+        inserted_ids: List[int] = []
+        failed_docs: dict[str, str] = {}
+        chunk_counts: dict[str, int] = {}
+        logger.info("Starting streaming document ingestion documents=%s", len(documents))
+
+        async with build_async_bulk_connection(self._db_url) as session:
+            persistence = AsyncPersistence(session)
+            chunk_version = await persistence.get_chunk_version(self._config.chunk_version_name) if self._config.chunk_version_name else None
+            if chunk_version is None:
+                raise exceptions.InvalidResourceIdentifier(f"Chunk version {self._config.chunk_version_name} does not exist.")
+
+            to_insert = await self._dedupe_streamed_documents(documents, persistence)
+            logger.info("Deduplicated documents incoming=%s to_insert=%s", len(documents), len(to_insert))
+
+            batch_size = self._config.embed_buffer_size or self._config.embedding_batch_size
+            text_slots, embedded_slots = plan_queue_sizes(
+                self._config.memory_budget_bytes, self._config.chunk_window, EMBEDDING_DIM, batch_size
+            )
+            text_queue: asyncio.Queue = asyncio.Queue(maxsize=text_slots)
+            embedded_queue: asyncio.Queue = asyncio.Queue(maxsize=embedded_slots)
+
+            async with asyncio.TaskGroup() as stages:
+                pool_source = self._chunk_source if self._pool is not None else None
+                stages.create_task(produce_chunks(to_insert, self._chunker, text_queue, pool_source))
+                stages.create_task(embed_chunks(text_queue, embedded_queue, self._embedder, batch_size))
+                await self._insert_stream(persistence, chunk_version, embedded_queue, inserted_ids, failed_docs, chunk_counts)
+
+            await persistence.commit()
+            logger.info("Committed streaming ingestion batch inserted=%s failed=%s", len(inserted_ids), len(failed_docs))
+
+        return inserted_ids, failed_docs, chunk_counts
+
+    async def _insert_stream(self, persistence: AsyncPersistence, chunk_version: ChunkVersion,
+                             queue: asyncio.Queue, inserted_ids: list, failed_docs: dict,
+                             chunk_counts: dict | None = None) -> None:
+        """Insert stage: write each embedded batch as soon as it arrives."""
+        savepoint = None
+        document: Document | None = None
+        filename = None
+        order_counter = 0
+        error: BaseException | None = None
+
+        while not is_done(item := await queue.get()):
+            if isinstance(item, DocumentStart):
+                filename = item.document.filename
+                order_counter = 0
+                error = None
+                try:
+                    savepoint = await persistence.begin_nested()
+                    document = await self._insert_document(persistence, filename, filename, item.document.doc_hash)
+                except Exception as e:
+                    logger.exception("Document insert failed filename=%s", filename)
+                    error = e
+                continue
+
+            if isinstance(item, ChunkTexts):
+                if error is not None:
+                    continue
+                chunks = []
+                for text, vector in zip(item.texts, item.embeddings):
+                    chunk = chunk_factory(doc_id=document.id, order=order_counter, content=text, chunk_version_id=chunk_version.id)
+                    chunk.embedding = vector
+                    chunks.append(chunk)
+                    order_counter += 1
+                try:
+                    await self._bulk_insert_chunks(persistence, chunks)
+                except Exception as e:
+                    logger.exception("Chunk insert failed filename=%s", filename)
+                    error = e
+                continue
+
+            if isinstance(item, DocumentEnd):
+                error = error or item.error
+                if error is None:
+                    await savepoint.commit()
+                    inserted_ids.append(document.id)
+                    if chunk_counts is not None:
+                        chunk_counts[filename] = order_counter
+                    logger.info("Document ingestion staged filename=%s document_id=%s chunks=%s", filename, document.id, order_counter)
+                else:
+                    if savepoint is not None and savepoint.is_active:
+                        await savepoint.rollback()
+                    failed_docs[filename] = str(error)
+                savepoint, document = None, None
+
+    async def _dedupe_streamed_documents(self, documents: List[StreamedDocument], persistence: AsyncPersistence) -> List[StreamedDocument]:
+        """Drop documents whose hash is already stored or repeated earlier in the same upload."""
+        unique: List[StreamedDocument] = []
+        seen: set[str] = set()
+        for document in documents:
+            if document.doc_hash not in seen:
+                seen.add(document.doc_hash)
+                unique.append(document)
+        existing_hashes = {doc.hash for doc in await persistence.get_documents_by_hashes([d.doc_hash for d in unique])}
+        return [d for d in unique if d.doc_hash not in existing_hashes]
+
+    async def _build_document_chunks(self, document : Document,
+                               chunk_version : ChunkVersion, doc_content, insert_batch : list,
+                               source : ParallelChunkSource | None = None):
         """Build chunks for one document and flush buffered embeddings/inserts in batches."""
         embed_buffer: List[Chunk] = []
         embed_buffer_size = self._config.embed_buffer_size or 512
         chunk_count = 0
-        for chunk in self._build_chunks(document.id, doc_content, chunk_version.id):
+        if source is None:
+            chunks = self._iter_chunks(self._build_chunks(document.id, doc_content, chunk_version.id))
+        else:
+            chunks = self._build_chunks_from_texts(document.id, source, chunk_version.id)
+
+        async for chunk in chunks:
             # Buffer chunks so embeddings and inserts can be batched.
             embed_buffer.append(chunk)
             chunk_count += 1
 
             if len(embed_buffer) >= embed_buffer_size:
-                self._handle_buffer_flush(embed_buffer, insert_batch)
+                await self._handle_buffer_flush(embed_buffer, insert_batch)
 
         if embed_buffer:
-            self._handle_buffer_flush(embed_buffer, insert_batch)
+            await self._handle_buffer_flush(embed_buffer, insert_batch)
 
         logger.info(
             "Built chunks for document document_id=%s chunk_count=%s",
@@ -157,18 +375,18 @@ class DocumentIngestorWorker:
             chunk_count,
         )
 
-    def _handle_buffer_flush(self, embed_buffer : list, insert_batch : list):
+    async def _handle_buffer_flush(self, embed_buffer : list, insert_batch : list):
         """Embed buffered chunks and move them into the pending insert batch."""
         logger.debug(
             "Flushing embed buffer size=%s pending_insert_batch=%s",
             len(embed_buffer),
             len(insert_batch),
         )
-        self._attach_embeddings(embed_buffer)
+        await self._attach_embeddings(embed_buffer)
         insert_batch.extend(embed_buffer)
         embed_buffer.clear()
 
-    def _dedupe_documents(self, documents: Iterable[Tuple[str, bytes]], persistence: Persistence) -> Iterable[Tuple[str, bytes, str]]:
+    async def _dedupe_documents(self, documents: Iterable[Tuple[str, bytes]], persistence: AsyncPersistence) -> Iterable[Tuple[str, bytes, str]]:
         """Remove already-ingested docs by comparing content hashes against the database."""
         docs = list(documents)
         doc_names = [d_name for d_name, _ in docs]
@@ -176,7 +394,7 @@ class DocumentIngestorWorker:
         doc_hashes = [get_document_hash(content) for content in doc_contents]
 
         doc_info = zip(doc_names, doc_contents, doc_hashes)
-        existing_hashes = {doc.hash for doc in persistence.get_documents_by_hashes(doc_hashes)}
+        existing_hashes = {doc.hash for doc in await persistence.get_documents_by_hashes(doc_hashes)}
 
         return [
             (doc_name, doc_content, doc_hash)
@@ -184,13 +402,13 @@ class DocumentIngestorWorker:
             if doc_hash not in existing_hashes
         ]
 
-    def _insert_document(self, persistence: Persistence, filename, storage_url, doc_hash) -> Document:
+    async def _insert_document(self, persistence: AsyncPersistence, filename, storage_url, doc_hash) -> Document:
         """Create and persist a Document row, returning the instance with its ID populated."""
         document : Document = document_factory(
             filename, storage_url, doc_hash
         )
         persistence.insert_document(document)
-        persistence.flush() # get document.id for FK usage
+        await persistence.flush() # get document.id for FK usage
         logger.debug("Inserted document row filename=%s document_id=%s", filename, document.id)
 
         return document
@@ -216,7 +434,23 @@ class DocumentIngestorWorker:
                 )
                 order_counter += 1
 
-    def _attach_embeddings(self, chunks: List[Chunk]) -> None:
+    async def _iter_chunks(self, chunks: Iterable[Chunk]) -> AsyncIterator[Chunk]:
+        for chunk in chunks:
+            yield chunk
+
+    async def _build_chunks_from_texts(self, document_id: int, texts: AsyncIterator[str], chunk_version_id: int) -> AsyncIterator[Chunk]:
+        """Wrap pool-produced chunk texts in Chunk ORM objects with the same ordering as `_build_chunks`."""
+        order_counter = 0
+        async for chunk_text in texts:
+            yield chunk_factory(
+                doc_id=document_id,
+                order=order_counter,
+                content=chunk_text,
+                chunk_version_id=chunk_version_id,
+            )
+            order_counter += 1
+
+    async def _attach_embeddings(self, chunks: List[Chunk]) -> None:
         """Compute embeddings for chunk.content and attach to chunk.embedding."""
         if not chunks:
             return
@@ -224,7 +458,9 @@ class DocumentIngestorWorker:
         logger.debug("Encoding embeddings for chunk batch size=%s", len(texts))
 
         try:
-            vectors = self._embedder.encode(texts)
+            # Runs on the embedder's executor so other requests keep being served meanwhile.
+            # Chunks are embedded once per version, so they bypass the (question) embedding cache.
+            vectors = await self._embedder.aencode(texts, cache=False)
         except Exception:
             logger.exception('An error occured when creating embeddings.')
             raise
@@ -236,13 +472,14 @@ class DocumentIngestorWorker:
             logger.exception(f'Embedding count does not match chunk count. Got {vec_count} embeddings and {chnk_count} chunks.')
             raise RuntimeError("Embedding count mismatch for chunks batch")
 
+        # Row views into one float32 batch array; no per-chunk float objects are created.
         for chunk, vector in zip(chunks, vectors):
             chunk.embedding = vector
 
-    def _bulk_insert_chunks(self, persistence: Persistence, chunks: List[Chunk]) -> None:
+    async def _bulk_insert_chunks(self, persistence: AsyncPersistence, chunks: List[Chunk]) -> None:
         """Bulk insert a list of Chunk objects using the provided repo."""
         if not chunks:
             return
 
-        persistence.bulk_insert_chunks(chunks)
+        await persistence.bulk_insert_chunks(chunks, method=self._config.chunk_insert_method)
         logger.debug("Bulk inserted chunks count=%s", len(chunks))
@@ -0,0 +1,88 @@
+"""Process-pool text extraction and chunking for `DocumentIngestorWorker`.
+
+Everything submitted to the pool is a module-level function over plain values so it pickles
+under the ``spawn`` start method. Chunking is per page, so splitting a document into page
+ranges and concatenating the results in range order reproduces the serial chunk order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator
+
+from answer_gen.components.ingestion.chunker import Chunker
+from answer_gen.utils.document_utils import get_document_page_count, get_document_text
+
+logger = logging.getLogger(__name__)
+
+
+def build_process_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn avoids forking a parent that already runs embedder and DB pool threads.
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def page_ranges(page_count: int, pages_per_task: int) -> list[tuple[int, int]]:
+    """Split ``page_count`` pages into consecutive `(start, stop)` ranges."""
+    step = max(1, pages_per_task)
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+
+def extract_and_chunk(
+    doc_bytes: bytes,
+    start: int,
+    stop: int,
+    model_name: str,
+    chunk_chars: int,
+    overlap: int,
+) -> list[str]:
+    """Extract pages ``start:stop`` of a PDF and return their chunk texts in page order."""
+    chunker = Chunker(model_name=model_name, chunk_chars=chunk_chars, overlap=overlap)
+    pages = get_document_text(doc_bytes, start, stop)
+    return [chunk_text for _, split_chunks in chunker(pages) for chunk_text in split_chunks]
+
+
+class ParallelChunkSource:
+    """Chunk texts for one document, computed by page-range tasks on a process pool."""
+
+    def __init__(self, pool: ProcessPoolExecutor, doc_bytes: bytes, pages_per_task: int, chunker_args: tuple):
+        self._pool = pool
+        self._doc_bytes = doc_bytes
+        self._pages_per_task = pages_per_task
+        self._chunker_args = chunker_args
+        # Start immediately so every document in the batch is extracted concurrently.
+        self._planned = asyncio.ensure_future(self._submit())
+
+    async def _submit(self) -> list[asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        page_count = await loop.run_in_executor(self._pool, get_document_page_count, self._doc_bytes)
+        return [
+            loop.run_in_executor(self._pool, extract_and_chunk, self._doc_bytes, start, stop, *self._chunker_args)
+            for start, stop in page_ranges(page_count, self._pages_per_task)
+        ]
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        futures = await self._planned
+        try:
+            for future in futures:
+                for chunk_text in await future:
+                    yield chunk_text
+        finally:
+            self._discard(futures)
+
+    def cancel(self) -> None:
+        """Drop pending work for a document that will not be consumed."""
+        if not self._planned.done():
+            self._planned.cancel()
+        elif not self._planned.cancelled() and self._planned.exception() is None:
+            self._discard(self._planned.result())
+
+    @staticmethod
+    def _discard(futures: list[asyncio.Future]) -> None:
+        for future in futures:
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                future.exception()  # mark retrieved so failures are not logged twice
@@ -0,0 +1,153 @@
+"""Bounded-memory extract -> chunk -> embed stages for streaming document ingestion.
+
+Stages talk through bounded `asyncio.Queue`s carrying per-document markers, so at most a
+configured number of chunk texts and embedded batches are resident at any time no matter
+how many documents are in the upload. The insert stage lives on `DocumentIngestorWorker`
+because it owns the DB session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, BinaryIO, Callable, Sequence
+
+import numpy as np
+
+from answer_gen.components.ingestion.chunker import Chunker
+from answer_gen.utils.document_utils import get_document_text
+
+logger = logging.getLogger(__name__)
+
+# Rough per-chunk resident cost besides the text and vector: str/ORM object headers, queue slots.
+_CHUNK_OVERHEAD_BYTES = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class StreamedDocument:
+    """One spooled upload: the file is read lazily, the hash was computed while spooling."""
+
+    filename: str
+    file: BinaryIO
+    doc_hash: str
+
+
+@dataclass(slots=True)
+class DocumentStart:
+    index: int
+    document: StreamedDocument
+
+
+@dataclass(slots=True)
+class ChunkTexts:
+    index: int
+    texts: list[str]
+    embeddings: np.ndarray | None = None
+
+
+@dataclass(slots=True)
+class DocumentEnd:
+    index: int
+    error: BaseException | None = field(default=None)
+
+
+_DONE = object()
+
+
+def plan_queue_sizes(budget_bytes: int, chunk_window: int, embedding_dim: int, embed_batch: int) -> tuple[int, int]:
+    """Split a memory budget into `(text_queue_chunks, embedded_queue_batches)`.
+
+    ``chunk_window`` is in tokens; ~4 UTF-8 bytes per token covers the text itself.
+    """
+    per_chunk = chunk_window * 4 + embedding_dim * 4 + _CHUNK_OVERHEAD_BYTES
+    chunks_in_flight = max(2 * embed_batch, budget_bytes // per_chunk)
+    text_queue = max(embed_batch, chunks_in_flight // 2)
+    embedded_queue = max(1, (chunks_in_flight - text_queue) // embed_batch)
+    return text_queue, embedded_queue
+
+
+async def produce_chunks(
+    documents: Sequence[StreamedDocument],
+    chunker: Chunker,
+    out_queue: asyncio.Queue,
+    pool_source: Callable[[bytes], AsyncIterator[str]] | None = None,
+) -> None:
+    """Extract and chunk each document in upload order.
+
+    Without ``pool_source`` pages are extracted one by one on a worker thread. With it (document
+    bytes -> `ParallelChunkSource`), a document's page ranges are extracted in parallel on the
+    process pool; only that document's bytes and chunk texts are resident at once.
+    """
+    for index, document in enumerate(documents):
+        await out_queue.put(DocumentStart(index, document))
+        error = None
+        try:
+            document.file.seek(0)
+            if pool_source is not None:
+                source = pool_source(document.file.read())
+                try:
+                    async for chunk_text in source:
+                        await out_queue.put(ChunkTexts(index, [chunk_text]))
+                finally:
+                    source.cancel()
+            else:
+                pages = chunker(get_document_text(document.file))
+                while True:
+                    # pypdf extraction and tiktoken splitting are CPU bound; keep them off the loop.
+                    page = await asyncio.to_thread(next, pages, None)
+                    if page is None:
+                        break
+                    _, split_chunks = page
+                    for chunk_text in split_chunks:
+                        await out_queue.put(ChunkTexts(index, [chunk_text]))
+        except Exception as e:
+            logger.exception("Streaming extraction failed filename=%s", document.filename)
+            error = e
+        await out_queue.put(DocumentEnd(index, error))
+    await out_queue.put(_DONE)
+
+
+async def embed_chunks(in_queue: asyncio.Queue, out_queue: asyncio.Queue, embedder, batch_size: int) -> None:
+    """Group chunk texts of one document into batches of ``batch_size`` and embed them."""
+    buffer: list[str] = []
+    current: int | None = None
+    failed: dict[int, BaseException] = {}
+
+    async def flush() -> None:
+        if not buffer or current in failed:
+            buffer.clear()
+            return
+        texts = list(buffer)
+        buffer.clear()
+        try:
+            vectors = await embedder.aencode(texts, cache=False)
+        except Exception as e:
+            logger.exception("Streaming embedding failed size=%s", len(texts))
+            failed[current] = e
+            return
+        await out_queue.put(ChunkTexts(current, texts, vectors))
+
+    while True:
+        item = await in_queue.get()
+        if item is _DONE:
+            await flush()
+            await out_queue.put(_DONE)
+            return
+
+        if isinstance(item, ChunkTexts):
+            buffer.extend(item.texts)
+            if len(buffer) >= batch_size:
+                await flush()
+            continue
+
+        await flush()
+        if isinstance(item, DocumentStart):
+            current = item.index
+        elif isinstance(item, DocumentEnd) and item.error is None and item.index in failed:
+            item = DocumentEnd(item.index, failed.pop(item.index))
+        await out_queue.put(item)
+
+
+def is_done(item) -> bool:
+    return item is _DONE
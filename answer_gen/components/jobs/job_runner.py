@@ -0,0 +1,171 @@
+"""Background job runner backed by the `jobs` table (no external queue).
+
+Runner slots claim queued jobs with `SELECT ... FOR UPDATE SKIP LOCKED`, so any number of
+slots or server processes can drain the same table without double-processing. Running jobs
+heartbeat; a job whose heartbeat goes stale (e.g. the server restarted mid-run) is requeued
+and its handler resumes from whatever work is still pending.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import AsyncIterable, Awaitable, Callable
+
+from answer_gen.exceptions import InvalidResourceIdentifier
+from answer_gen.storage import Job, JobDocument
+from answer_gen.storage.async_persistence import AsyncPersistence
+from answer_gen.storage.db import build_async_connection
+from answer_gen.storage.job import JOB_FAILED, JOB_SUCCEEDED
+from answer_gen.utils.config.job_runner_config import JobRunnerConfig
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[int], Awaitable[dict | None]]
+
+
+class JobRunner:
+    def __init__(self, db_url: str, handlers: dict[str, JobHandler], config: JobRunnerConfig):
+        """Create a runner that dispatches claimed jobs to ``handlers`` by job kind."""
+        self._db_url = db_url
+        self._handlers = dict(handlers)
+        self._config = config
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    async def submit(self, job: Job, documents: AsyncIterable[JobDocument] | None = None) -> int:
+        """Persist a new ``job`` (and its child rows), then wake an idle slot to run it.
+
+        ``documents`` are written one at a time as they are produced, so only one upload is in
+        memory at once; the job only becomes claimable when all of them are committed with it.
+        """
+        if job.kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind {job.kind!r}")
+        async with build_async_connection(self._db_url) as session:
+            store = AsyncPersistence(session)
+            store.insert_job(job)
+            await store.flush()
+            if documents is not None:
+                async for job_document in documents:
+                    job_document.job_id = job.id
+                    await store.insert_job_document(job_document)
+            await store.commit()
+        self.notify()
+        logger.info("Enqueued job job_id=%s kind=%s", job.id, job.kind)
+        return job.id
+
+    async def fetch_job(self, job_id: int) -> dict:
+        """Return a job's status, counters and per-item rows as an API-friendly payload."""
+        async with build_async_connection(self._db_url) as session:
+            job = await AsyncPersistence(session).get_job(job_id)
+            if job is None:
+                logger.warning("No job with ID %s.", job_id)
+                raise InvalidResourceIdentifier(f'Could not find a job with the given identifier.')
+            return {**job.to_dict(), "documents": [d.to_dict() for d in job.documents]}
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        await self._requeue_stale()
+        self._tasks = [asyncio.create_task(self._work(slot)) for slot in range(max(1, self._config.workers))]
+        logger.info("Started job runner slots=%s kinds=%s", len(self._tasks), sorted(self._handlers))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self) -> int | None:
+        """Claim and run a single job; returns its id, or None when the queue is empty."""
+        claimed = await self._claim()
+        if claimed is None:
+            return None
+        job_id, kind = claimed
+        await self._run(job_id, kind)
+        return job_id
+
+    async def _work(self, slot: int) -> None:
+        while True:
+            try:
+                if await self.run_once() is not None:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Claiming failed (e.g. DB restart); back off and keep the slot alive.
+                logger.exception("Job runner slot failed slot=%s", slot)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._config.poll_interval)
+            except asyncio.TimeoutError:
+                await self._requeue_stale()
+
+    async def _claim(self) -> tuple[int, str] | None:
+        async with build_async_connection(self._db_url) as session:
+            store = AsyncPersistence(session)
+            job = await store.claim_next_job(list(self._handlers))
+            if job is None:
+                await store.rollback()
+                return None
+            claimed = (job.id, job.kind)
+            await store.commit()
+        logger.info("Claimed job job_id=%s kind=%s", *claimed)
+        return claimed
+
+    async def _run(self, job_id: int, kind: str) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            result = await self._handlers[kind](job_id)
+        except asyncio.CancelledError:
+            # Shutdown: leave the job running so it is requeued once its heartbeat goes stale.
+            raise
+        except Exception as e:
+            logger.exception("Job failed job_id=%s kind=%s", job_id, kind)
+            await self._finish(job_id, JOB_FAILED, error=str(e) or type(e).__name__)
+        else:
+            await self._finish(job_id, JOB_SUCCEEDED, result=result)
+        finally:
+            heartbeat.cancel()
+
+    async def _finish(self, job_id: int, status: str, result: dict | None = None, error: str | None = None) -> None:
+        async with build_async_connection(self._db_url) as session:
+            store = AsyncPersistence(session)
+            job = await store.get_job(job_id)
+            if job is None:
+                return
+            job.status = status
+            job.result = result
+            job.error = error
+            job.finished_at = datetime.utcnow()
+            await store.commit()
+        logger.info("Finished job job_id=%s status=%s", job_id, status)
+
+    async def _heartbeat(self, job_id: int) -> None:
+        while True:
+            await asyncio.sleep(self._config.heartbeat_interval)
+            try:
+                async with build_async_connection(self._db_url) as session:
+                    store = AsyncPersistence(session)
+                    await store.touch_job(job_id)
+                    await store.commit()
+            except Exception:
+                logger.warning("Job heartbeat failed job_id=%s", job_id, exc_info=True)
+
+    async def _requeue_stale(self) -> None:
+        stale_before = datetime.utcnow() - timedelta(seconds=self._config.stale_after)
+        try:
+            async with build_async_connection(self._db_url) as session:
+                store = AsyncPersistence(session)
+                requeued = await store.requeue_stale_jobs(list(self._handlers), stale_before)
+                await store.commit()
+        except Exception:
+            logger.warning("Requeueing stale jobs failed", exc_info=True)
+            return
+        if requeued:
+            logger.warning("Requeued stale jobs count=%s", requeued)
@@ -1,50 +1,59 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import datetime, timedelta
+
 from answer_gen.utils.config.question_worker_config import QuestionWorkerConfig
 
 from answer_gen.utils.document_utils import get_document_hash
-from answer_gen.storage.db import build_bulk_connection
+from answer_gen.storage.db import build_async_bulk_connection, build_async_connection
 from answer_gen.storage.factories import rfp_factory
-from answer_gen.storage import RFP, Question
-from answer_gen.storage.persistence import Persistence
+from answer_gen.storage import RFP, Question, RfpRemoteFile
+from answer_gen.storage.async_persistence import AsyncPersistence
 
 from answer_gen.utils.generative import generate_questions
-from answer_gen.exceptions import EmptyRFP, InvalidGenerativeResponseStructure
+from answer_gen.utils.generative.clients.base import GenerativeClient
+from answer_gen.utils.generative.response_cache import template_version
+from answer_gen.utils.file_utils import read_file_async
+from answer_gen.utils.embedder import get_embedder
+from answer_gen.exceptions import EmptyRFP, InvalidGenerativeResponseStructure, GenerativeFileNotFound
 from answer_gen.utils.generative.mappers import map_questions
 
 logger = logging.getLogger(__name__)
 
 
 class QuestionWorker:
-    def __init__(self, db_url: str, generative_text_client, config: QuestionWorkerConfig):
+    def __init__(self, db_url: str, generative_text_client: GenerativeClient, config: QuestionWorkerConfig):
         """Create a worker to parse and persist RFP questions via an LLM."""
         self._db_url = db_url
         self._gen_txt_client = generative_text_client
         self._config = config
+        self._embedder = None
+        if config.embed_questions:
+            self._embedder = get_embedder(
+                config.embedding_model,
+                batch_size = config.embedding_batch_size,
+                batch_window_ms = config.embedding_batch_window_ms,
+            )
 
     async def __call__(self, filename, rfp_content : bytes):
         """Upsert an RFP and (re)parse its questions; returns the RFP id."""
-        with build_bulk_connection(self._db_url) as session:
+        async with build_async_bulk_connection(self._db_url) as session:
             # Use one session for the full parse/update transaction.
-            store = Persistence(session)
+            store = AsyncPersistence(session)
             rfp_hash = get_document_hash(rfp_content)
 
-            rfp, do_parse = self._does_rfp_need_parsing(store, filename, rfp_hash)
+            rfp, do_parse = await self._does_rfp_need_parsing(store, filename, rfp_hash)
 
             if rfp is None:
-                rfp = self._insert_rfp(store, filename, filename, rfp_hash)
+                rfp = await self._insert_rfp(store, filename, filename, rfp_hash)
 
             if not do_parse:
                 return {"rfp_id" : rfp.id, "questions" : []}
 
             try:
-                questions = await generate_questions(
-                    self._gen_txt_client,
-                    self._config.prompt_path,
-                    self._config.model,
-                    rfp_content,
-                )
+                questions = await self._parse_questions(store, rfp, rfp_hash, rfp_content)
             except Exception:
                 logger.exception(
                     "Question generation failed filename=%s rfp_id=%s model=%s",
@@ -65,12 +74,12 @@ class QuestionWorker:
             new_set = set(normalized)
 
             # Compare latest parsed set against current DB state.
-            existing, existing_set = self._get_existing_questions(store, rfp.id)
+            existing, existing_set = await self._get_existing_questions(store, rfp.id)
             if len(existing_set) > 0:
-                self._delete_rfp_questions(store, rfp.id, new_set)
+                await self._delete_rfp_questions(store, rfp.id, new_set)
 
             # Refresh existing questions in case some were deleted
-            existing, existing_set = self._get_existing_questions(store, rfp.id)
+            existing, existing_set = await self._get_existing_questions(store, rfp.id)
 
             to_insert: list[str] = sorted(list(new_set - existing_set))
 
@@ -82,22 +91,124 @@ class QuestionWorker:
                     logger.exception(f'{filename} Failed to map raw questions into Question instances')
                     raise InvalidGenerativeResponseStructure('Failed to map raw questions into Question instances.')
 
-                store.bulk_insert_questions(question_models)
-                store.commit()
+                await self._attach_embeddings(question_models)
+                await store.bulk_insert_questions(question_models)
+                await store.commit()
                 existing.extend(question_models)
                 logger.info("Inserted new questions rfp_id=%s inserted=%s", rfp.id, len(question_models))
 
             return {"rfp_id" : rfp.id, "questions" : [q.id for q in existing]}
 
-    def _does_rfp_need_parsing(self, store : Persistence, filename, rfp_hash):
+    async def cleanup_remote_files(self) -> int:
+        """Delete uploaded RFP files that expire within the reuse margin, remotely and in the DB."""
+        expiring_before = datetime.utcnow() + timedelta(seconds=self._config.remote_file_reuse_margin_seconds)
+        deleted = 0
+        async with build_async_connection(self._db_url) as session:
+            store = AsyncPersistence(session)
+            for remote_file in await store.get_stale_rfp_remote_files(expiring_before):
+                try:
+                    await self._gen_txt_client.delete_file(remote_file.file_id)
+                except Exception:
+                    logger.warning("Failed to delete remote RFP file file_id=%s", remote_file.file_id, exc_info=True)
+                    continue
+                await store.delete_rfp_remote_file(remote_file)
+                deleted += 1
+            await store.commit()
+
+        if deleted:
+            logger.info("Deleted stale remote RFP files count=%s", deleted)
+        return deleted
+
+    async def run_remote_file_cleanup(self) -> None:
+        """Run `cleanup_remote_files` every ``remote_file_cleanup_interval_seconds`` until cancelled."""
+        while True:
+            try:
+                await self.cleanup_remote_files()
+            except Exception:
+                logger.exception("Remote RFP file cleanup failed")
+            await asyncio.sleep(max(1, self._config.remote_file_cleanup_interval_seconds))
+
+    async def _parse_questions(self, store : AsyncPersistence, rfp : RFP, rfp_hash : str, rfp_content : bytes) -> list[str]:
+        """Return the parsed question list, from the parse cache when the RFP, prompt and model are unchanged."""
+        prompt_version = None
+        if self._config.parse_cache:
+            prompt_version = template_version(await read_file_async(self._config.prompt_path))
+            cached = await store.get_parsed_questions(rfp_hash, prompt_version, self._config.model)
+            if cached is not None:
+                logger.info("Reusing parsed questions rfp_id=%s count=%s", rfp.id, len(cached))
+                return cached
+
+        questions = await self._generate_questions(store, rfp_hash, rfp_content)
+
+        if prompt_version is not None and questions:
+            await store.put_parsed_questions(rfp_hash, prompt_version, self._config.model, questions)
+            await store.commit()
+        return questions
+
+    async def _generate_questions(self, store : AsyncPersistence, rfp_hash : str, rfp_content : bytes) -> list[str]:
+        """Run question extraction against the RFP's uploaded file, uploading it only when needed."""
+        remote_file = await self._get_reusable_remote_file(store, rfp_hash)
+        if remote_file is not None:
+            try:
+                return await self._generate_questions_from_file(rfp_content, remote_file.file_id)
+            except GenerativeFileNotFound:
+                # The provider dropped (or rejected) the file early; forget it and upload again.
+                logger.warning("Reused remote RFP file failed file_id=%s; re-uploading", remote_file.file_id)
+                await store.delete_rfp_remote_file(remote_file)
+                await store.commit()
+
+        file_id = await self._upload_rfp(store, rfp_hash, rfp_content)
+        return await self._generate_questions_from_file(rfp_content, file_id)
+
+    async def _generate_questions_from_file(self, rfp_content : bytes, file_id : str) -> list[str]:
+        return await generate_questions(
+            self._gen_txt_client,
+            self._config.prompt_path,
+            self._config.model,
+            rfp_content,
+            file_id=file_id,
+        )
+
+    async def _get_reusable_remote_file(self, store : AsyncPersistence, rfp_hash : str) -> RfpRemoteFile | None:
+        """Return the recorded upload for ``rfp_hash`` unless it expires within the reuse margin."""
+        remote_file = await store.get_rfp_remote_file(rfp_hash)
+        if remote_file is None:
+            return None
+
+        reusable_until = datetime.utcnow() + timedelta(seconds=self._config.remote_file_reuse_margin_seconds)
+        if remote_file.expires_at is not None and remote_file.expires_at <= reusable_until:
+            logger.info("Remote RFP file is expiring file_id=%s expires_at=%s", remote_file.file_id, remote_file.expires_at)
+            return None
+        return remote_file
+
+    async def _upload_rfp(self, store : AsyncPersistence, rfp_hash : str, rfp_content : bytes) -> str:
+        """Upload the RFP once and record its file id (and expiry) for later parses."""
+        ttl = self._config.remote_file_ttl_seconds
+        file_id = await self._gen_txt_client.upload_file(rfp_content, expires_after_seconds=ttl or None)
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl) if ttl else None
+
+        await store.upsert_rfp_remote_file(rfp_hash, file_id, expires_at)
+        await store.commit()
+        logger.info("Uploaded RFP file file_id=%s expires_at=%s", file_id, expires_at)
+        return file_id
+
+    async def _attach_embeddings(self, questions: list[Question]) -> None:
+        """Store question embeddings up front so answering does not re-embed them."""
+        if self._embedder is None or not questions:
+            return
+        vectors = await self._embedder.aencode([q.content for q in questions])
+        for question, vector in zip(questions, vectors):
+            question.embedding = vector
+
+    async def _does_rfp_need_parsing(self, store : AsyncPersistence, filename, rfp_hash):
         """Return `(rfp, should_parse)` based on hash lookup and document freshness."""
-        rfp: RFP | None = store.get_rfp_by_hash(rfp_hash)
+        rfp: RFP | None = await store.get_rfp_by_hash(rfp_hash)
 
         if rfp is None:
             return None, True
 
         # Re-parse only when RFP is new or documents changed after last upload.
-        most_rec_doc = store.get_most_recent_document()
+        most_rec_doc = await store.get_most_recent_document()
         needs_q_parsing : bool = most_rec_doc is None or most_rec_doc.uploaded_at > rfp.uploaded_at
 
         if not needs_q_parsing:
@@ -106,26 +217,26 @@ class QuestionWorker:
 
         return rfp, True
 
-    def _get_existing_questions(self, store : Persistence, rfp_id):
+    async def _get_existing_questions(self, store : AsyncPersistence, rfp_id):
             """Fetch current questions for an RFP and return both list and text set."""
-            existing = store.get_questions_by_rfp(rfp_id)
+            existing = await store.get_questions_by_rfp(rfp_id)
             return existing, {q.content for q in existing}
 
-    def _delete_rfp_questions(self, store : Persistence, rfp_id, new_questions):
+    async def _delete_rfp_questions(self, store : AsyncPersistence, rfp_id, new_questions):
         """Delete persisted questions not present in the latest parsed question set."""
         # Delete questions that no longer exist in the latest parse.
         delete_count = str(len(new_questions))
 
         logger.info(f'Deleting {delete_count} associated with {str(rfp_id)}')
-        store.delete_questions_not_in(rfp_id, list(new_questions))
-        store.commit()
+        await store.delete_questions_not_in(rfp_id, list(new_questions))
+        await store.commit()
 
-    def _insert_rfp(self, store : Persistence, filename : str, storage_url : str,  doc_hash : str) -> RFP:
+    async def _insert_rfp(self, store : AsyncPersistence, filename : str, storage_url : str,  doc_hash : str) -> RFP:
         """Insert a new RFP row and return it with its id populated."""
         rfp = rfp_factory(
             filename, storage_url, doc_hash
         )
         store.insert_rfp(rfp)
-        store.flush()
-        store.commit()
+        await store.flush()
+        await store.commit()
         return rfp
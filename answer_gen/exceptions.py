@@ -38,6 +38,14 @@ class GenerativeExecutionError(SystemError):
     def __init__(self, *args):
         super().__init__(*args)
 
+class GenerativeDeadlineExceeded(GenerativeExecutionError):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+class GenerativeFileNotFound(GenerativeExecutionError):
+    def __init__(self, *args):
+        super().__init__(*args)
+
 class EmbeddingError(SystemError):
     def __init__(self, *args):
         super().__init__(*args)
@@ -1,34 +1,83 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Annotated
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Request, status
+from fastapi.responses import StreamingResponse
 from answer_gen.exceptions import UserError
+from answer_gen.components.answers.rfp_answer_worker import BULK_ANSWER_JOB_KIND, build_bulk_answer_job
+from answer_gen.storage.job import JOB_TERMINAL_STATUSES
+from answer_gen.utils.config.config_utils import get_config_float
+from answer_gen.utils.generative.clients.call_policy import get_call_policy
 
 from .models import BulkAnswerRequest, SingleAnswerRequest
 from .answer_deps import (
     get_answer_worker,
     get_rfp_bulk_answer_worker,
 )
+from .job_deps import get_job_runner
+from .request_utils import run_for_request
 
 answer_router = APIRouter(prefix="/api/answers")
 
 @answer_router.post("/bulk-generate")
-async def generate_bulk_answers(bulk_request: Annotated[BulkAnswerRequest, Body(embed=False)]):
+async def generate_bulk_answers(bulk_request: Annotated[BulkAnswerRequest, Body(embed=False)], request: Request):
     worker = get_rfp_bulk_answer_worker()
-    result = await worker(bulk_request.rfp_id)
+    policy = get_call_policy()
+    timeout = bulk_request.timeout_seconds or (policy.bulk_request_timeout_seconds if policy is not None else None)
+    result = await run_for_request(request, worker(bulk_request.rfp_id, use_cache=bulk_request.use_cache), timeout)
 
     return result
 
+@answer_router.post("/bulk-jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_bulk_answer_job(bulk_request: Annotated[BulkAnswerRequest, Body(embed=False)]):
+    job_id = await get_job_runner().submit(
+        build_bulk_answer_job(bulk_request.rfp_id, batch=bulk_request.batch, use_cache=bulk_request.use_cache)
+    )
+    return {"job_id": job_id, "status": "queued"}
+
+@answer_router.get("/bulk-jobs/{job_id}/stream")
+async def stream_bulk_answer_job(job_id: int, request: Request):
+    """NDJSON stream: one `answer` line per question as its shard is committed, then a `done` line."""
+    runner = get_job_runner()
+    job = await runner.fetch_job(job_id)
+    if job["kind"] != BULK_ANSWER_JOB_KIND:
+        raise HTTPException(status_code=404, detail="Could not find a bulk answer job with the given identifier.")
+    rfp_id = int(job["payload"]["rfp_id"])
+    worker = get_rfp_bulk_answer_worker()
+    interval = get_config_float("jobs", "event_poll_interval_seconds", fallback = 1.0)
+
+    async def lines():
+        emitted: set[int] = set()
+        while True:
+            # Read job status first so the final answer poll after completion sees every shard.
+            job = await runner.fetch_job(job_id)
+            for question in await worker.fetch_answered_questions(rfp_id, exclude=emitted):
+                emitted.add(question["id"])
+                yield json.dumps({"type": "answer", "question": question}) + "\n"
+
+            if job["status"] in JOB_TERMINAL_STATUSES:
+                yield json.dumps({"type": "done", "job": job}, default=str) + "\n"
+                return
+            if await request.is_disconnected():
+                return
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson", headers={"Cache-Control": "no-cache"})
+
 @answer_router.post("/generate")
-async def generate_single_answer(single_request : Annotated[SingleAnswerRequest, Body(embed=False)]):
+async def generate_single_answer(single_request : Annotated[SingleAnswerRequest, Body(embed=False)], request: Request):
     worker = get_answer_worker()
-    result = await worker(single_request.question_id)
+    result = await run_for_request(
+        request, worker(single_request.question_id, use_cache=single_request.use_cache), single_request.timeout_seconds
+    )
 
     return result
 
 @answer_router.get("/{answer_id}")
 async def get_answer(answer_id : int):
     worker = get_answer_worker()
-    resp = worker.fetch_answer(answer_id)
+    resp = await worker.fetch_answer(answer_id)
 
     return resp
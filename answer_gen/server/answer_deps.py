@@ -2,7 +2,7 @@ from answer_gen.utils.config.answer_worker_config import AnswerWorkerConfig, Bul
 from answer_gen.utils.config.config_utils import read_config
 from answer_gen.components.answers.answer_worker import AnswerWorker
 from answer_gen.components.answers.rfp_answer_worker import RfpBulkAnswerWorker
-from answer_gen.utils.generative.clients.openai_client import OpenAIClient
+from answer_gen.utils.generative.clients import get_generative_client
 from dotenv import load_dotenv
 import os
 
@@ -26,7 +26,7 @@ def build_answer_worker():
 
     ANSWER_WORKER = AnswerWorker(
         db_url=db_url,
-        generative_client=OpenAIClient(os.getenv("LLM_API_KEY")),
+        generative_client=get_generative_client(),
         config = cfg
     )
 
@@ -41,7 +41,7 @@ def build_rfp_bulk_answer_worker():
 
     read_config(config_path)
     cfg = BulkAnswerWorkerConfig.from_config()
-    gen_client = OpenAIClient(os.getenv("LLM_API_KEY") or os.getenv("OPENAI_API_KEY"))
+    gen_client = get_generative_client()
 
     RFP_BULK_ANSWER_WORKER = RfpBulkAnswerWorker(
         db_url=db_url,
@@ -1,6 +1,6 @@
 from answer_gen.utils.config.document_ingestor_config import DocumentIngestorConfig
 from answer_gen.utils.config.question_worker_config import QuestionWorkerConfig
-from answer_gen.utils.generative.clients.openai_client import OpenAIClient
+from answer_gen.utils.generative.clients import get_generative_client
 
 from answer_gen.utils.config.config_utils import read_config
 from answer_gen.components.ingestion.document_ingestor import DocumentIngestorWorker
@@ -38,6 +38,14 @@ def get_document_worker():
     return DOCUMENT_WORKER
 
 
+def shutdown_document_worker():
+    """Release the document worker's extraction process pool."""
+    global DOCUMENT_WORKER
+    if DOCUMENT_WORKER is not None:
+        DOCUMENT_WORKER.close()
+        DOCUMENT_WORKER = None
+
+
 def build_question_worker():
     """Initialize and cache the singleton question parsing worker."""
     global QUESTION_WORKER
@@ -52,7 +60,7 @@ def build_question_worker():
 
     QUESTION_WORKER = QuestionWorker(
         db_url=db_url,
-        generative_text_client=OpenAIClient(os.getenv("LLM_API_KEY")),
+        generative_text_client=get_generative_client(),
         config = cfg
     )
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from answer_gen.exceptions import UserError
-from answer_gen.utils.file_utils import is_pdf
+from answer_gen.utils.file_utils import is_pdf, hash_upload
+from answer_gen.components.ingestion.streaming import StreamedDocument
 from answer_gen.utils.config.config_utils import get_config_int
 
 from answer_gen.exceptions import BulkUploadFailed
@@ -22,6 +23,21 @@ async def upload_document(documents: list[UploadFile] = File(...)):
     if total_docs > max_documents:
         raise BulkUploadFailed(f'Too many documents uploaded. Please upload under {str(max_documents)} documents')
 
+    if worker.streaming:
+        # Uploads stay spooled (on disk past 1MB); only a running hash is kept in memory.
+        streamed: list[StreamedDocument] = []
+        for f in documents:
+            try:
+                doc_hash, header = await hash_upload(f)
+            except Exception as exc:
+                raise HTTPException(status_code=400, detail=f"Failed to read upload.")
+            if not is_pdf(header):
+                raise HTTPException(status_code=400, detail="Please ensure uploaded files are valid PDF's.")
+            streamed.append(StreamedDocument(f.filename or "document.pdf", f.file, doc_hash))
+
+        inserted_ids, failed = await worker.ingest_stream(streamed)
+        return {"inserted_document_ids": inserted_ids, "failed" : failed}
+
     for f in documents:
         try:
             payload.append((f.filename or "document.pdf", await f.read()))
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from fastapi import APIRouter, File, HTTPException, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from answer_gen.components.ingestion.document_ingestor import build_ingestion_job, build_job_documents
+from answer_gen.exceptions import BulkUploadFailed
+from answer_gen.storage.job import JOB_TERMINAL_STATUSES
+from answer_gen.utils.config.config_utils import get_config_float, get_config_int
+from answer_gen.utils.file_utils import hash_upload, is_pdf
+
+from .job_deps import get_job_runner
+
+job_router = APIRouter(prefix="/api/jobs")
+
+@job_router.post("/documents", status_code=status.HTTP_202_ACCEPTED)
+async def submit_document_job(documents: list[UploadFile] = File(...)):
+    """Persist the uploads as a queued ingestion job and return immediately."""
+    runner = get_job_runner()
+
+    max_documents = get_config_int("documents", "max_document_batch", fallback = 10)
+    if len(documents) > max_documents:
+        raise BulkUploadFailed(f'Too many documents uploaded. Please upload under {str(max_documents)} documents')
+
+    # Validate every upload while it stays spooled; each is read whole only as its row is written.
+    uploads: list[tuple[str, str, UploadFile]] = []
+    for f in documents:
+        try:
+            doc_hash, header = await hash_upload(f)
+        except Exception as exc:
+            raise HTTPException(status_code=400, detail=f"Failed to read upload.")
+        if not is_pdf(header):
+            raise HTTPException(status_code=400, detail="Please ensure uploaded files are valid PDF's.")
+        uploads.append((f.filename or "document.pdf", doc_hash, f))
+
+    job_id = await runner.submit(build_ingestion_job(len(uploads)), build_job_documents(uploads))
+    return {"job_id": job_id, "status": "queued"}
+
+@job_router.get("/{job_id}")
+async def get_job(job_id: int):
+    return await get_job_runner().fetch_job(job_id)
+
+@job_router.get("/{job_id}/events")
+async def stream_job(job_id: int, request: Request):
+    """Server-sent events: one `data:` frame per progress change until the job finishes."""
+    runner = get_job_runner()
+    interval = get_config_float("jobs", "event_poll_interval_seconds", fallback = 1.0)
+    first = await runner.fetch_job(job_id)
+
+    async def events():
+        job, last = first, None
+        while True:
+            frame = json.dumps(job, default=str)
+            if frame != last:
+                yield f"data: {frame}\n\n"
+                last = frame
+            if job["status"] in JOB_TERMINAL_STATUSES or await request.is_disconnected():
+                return
+            await asyncio.sleep(interval)
+            job = await runner.fetch_job(job_id)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
@@ -0,0 +1,39 @@
+from answer_gen.components.jobs import JobRunner
+from answer_gen.components.ingestion.document_ingestor import INGESTION_JOB_KIND
+from answer_gen.components.answers.rfp_answer_worker import BULK_ANSWER_JOB_KIND
+from answer_gen.utils.config.job_runner_config import JobRunnerConfig
+from dotenv import load_dotenv
+import os
+
+from .deps import get_document_worker
+from .answer_deps import get_rfp_bulk_answer_worker
+
+load_dotenv()
+
+JOB_RUNNER = None
+
+
+def build_job_runner():
+    """Initialize and cache the singleton background job runner."""
+    global JOB_RUNNER
+    config_path = os.getenv("CONFIG_FILE", "config/global.ini")
+    db_url = os.getenv("DB_URL") or os.getenv("DATABASE_URL")
+
+    if not db_url:
+        raise RuntimeError("DB_URL or DATABASE_URL must be set")
+
+    JOB_RUNNER = JobRunner(
+        db_url=db_url,
+        handlers={
+            INGESTION_JOB_KIND: get_document_worker().run_job,
+            BULK_ANSWER_JOB_KIND: get_rfp_bulk_answer_worker().run_job,
+        },
+        config=JobRunnerConfig.from_config(config_path),
+    )
+
+
+def get_job_runner():
+    """Return the job runner, building it on first access."""
+    if JOB_RUNNER is None:
+        build_job_runner()
+    return JOB_RUNNER
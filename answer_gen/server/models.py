@@ -3,7 +3,15 @@ from pydantic import BaseModel, Field
 
 class BulkAnswerRequest(BaseModel):
     rfp_id: int = Field(gt=0)
+    timeout_seconds: float | None = Field(default=None, gt=0)
+    # Bulk jobs only: run through the Batch API; None uses [answers] bulk_batch_mode.
+    batch: bool | None = None
+    # False regenerates: skips the semantic answer cache and the LLM response cache.
+    use_cache: bool = True
 
 
 class SingleAnswerRequest(BaseModel):
     question_id: int = Field(gt=0)
+    timeout_seconds: float | None = Field(default=None, gt=0)
+    # False regenerates: skips the semantic answer cache and the LLM response cache.
+    use_cache: bool = True
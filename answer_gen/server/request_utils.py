@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, TypeVar
+
+from fastapi import HTTPException, Request
+
+from answer_gen.utils.generative.clients.call_policy import request_budget
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLIENT_CLOSED_REQUEST = 499
+
+
+async def run_for_request(
+    request: Request,
+    work: Awaitable[T],
+    timeout_seconds: float | None = None,
+    poll_interval: float = 0.5,
+) -> T:
+    """Run ``work`` under a request budget, cancelling it (and its LLM calls) if the client disconnects."""
+    with request_budget(timeout_seconds):
+        # The task copies the current context, so every LLM call it makes sees this budget.
+        task = asyncio.ensure_future(work)
+
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                logger.info("Client disconnected; cancelling %s %s", request.method, request.url.path)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request")
+    finally:
+        if not task.done():
+            task.cancel()
@@ -1,16 +1,18 @@
 from __future__ import annotations
 from typing import Annotated
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, Body
+from fastapi import APIRouter, File, HTTPException, Request, UploadFile, Body
 from answer_gen.exceptions import UserError
+from answer_gen.utils.generative.clients.call_policy import get_call_policy
 from answer_gen.utils.file_utils import is_pdf
 
 from .deps import get_question_worker
+from .request_utils import run_for_request
 
 rfp_router = APIRouter(prefix="/api/rfp")
 
 @rfp_router.post("/upload")
-async def upload_rfp(rfp: UploadFile = File(...)):
+async def upload_rfp(request: Request, rfp: UploadFile = File(...)):
     worker = get_question_worker()
 
     try:
@@ -21,5 +23,7 @@ async def upload_rfp(rfp: UploadFile = File(...)):
     if not is_pdf(content):
         raise HTTPException(status_code=400, detail="Please ensure uploaded files are valid PDF's.")
 
-    result = await worker(rfp.filename or "rfp.pdf", content)
+    policy = get_call_policy()
+    timeout = policy.extraction_request_timeout_seconds if policy is not None else None
+    result = await run_for_request(request, worker(rfp.filename or "rfp.pdf", content), timeout)
     return {**result}
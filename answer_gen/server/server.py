@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any, Dict
@@ -17,11 +18,23 @@ from fastapi.responses import JSONResponse
 from .doc_api import document_router
 from .rfp_api import rfp_router
 from .answer_api import answer_router
-from answer_gen.exceptions import UserError
+from .status_api import status_router
+from .job_api import job_router
+from answer_gen.exceptions import GenerativeDeadlineExceeded, UserError
 from contextlib import asynccontextmanager
 
-from .deps import build_document_worker, build_question_worker
+from .deps import build_document_worker, build_question_worker, get_question_worker, shutdown_document_worker
 from .answer_deps import build_answer_worker, build_rfp_bulk_answer_worker
+from .job_deps import build_job_runner, get_job_runner
+from answer_gen.storage.db import init_engine, init_async_engine, dispose_engines, dispose_async_engines
+from answer_gen.utils.config.database_config import DatabasePoolConfig
+from answer_gen.utils.config.embedding_cache_config import EmbeddingCacheConfig
+from answer_gen.utils.embedder import init_embedding_cache
+from answer_gen.utils.config.response_cache_config import ResponseCacheConfig
+from answer_gen.utils.generative import build_response_cache, init_response_cache
+from answer_gen.utils.config.rate_limit_config import RateLimitConfig
+from answer_gen.utils.config.call_policy_config import CallPolicyConfig
+from answer_gen.utils.generative.clients import CallPolicy, RateLimiterRegistry, init_call_policy, init_rate_limiters
 
 
 load_dotenv()
@@ -61,6 +74,58 @@ class LimitUploadSize(BaseHTTPMiddleware):
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Create the shared connection pool once; every worker borrows sessions from it.
+    db_url = os.getenv("DB_URL") or os.getenv("DATABASE_URL")
+    if not db_url:
+        raise RuntimeError("DB_URL or DATABASE_URL must be set")
+    config_path = os.getenv("CONFIG_FILE", "config/global.ini")
+    pool_config = DatabasePoolConfig.from_config(config_path)
+    init_engine(db_url, pool_config)
+    init_async_engine(db_url, pool_config)
+
+    # Must exist before the workers register their embedders so they pick it up.
+    cache_config = EmbeddingCacheConfig.from_config(config_path)
+    init_embedding_cache(cache_config.max_bytes, db_url if cache_config.persist else None)
+
+    response_cache_config = ResponseCacheConfig.from_config(config_path)
+    init_response_cache(
+        build_response_cache(
+            response_cache_config.backend,
+            max_entries=response_cache_config.max_entries,
+            ttl_seconds=response_cache_config.ttl_seconds,
+            db_url=db_url,
+        )
+    )
+
+    # Every OpenAIClient shares these per-model limiters, so the API key's limits are tracked once.
+    rate_limit_config = RateLimitConfig.from_config(config_path)
+    init_rate_limiters(
+        RateLimiterRegistry(
+            initial_concurrency=rate_limit_config.initial_concurrency,
+            min_concurrency=rate_limit_config.min_concurrency,
+            max_concurrency=rate_limit_config.max_concurrency,
+            additive_increase=rate_limit_config.additive_increase,
+            decrease_factor=rate_limit_config.decrease_factor,
+        )
+        if rate_limit_config.enabled
+        else None
+    )
+
+    call_policy_config = CallPolicyConfig.from_config(config_path)
+    init_call_policy(
+        CallPolicy(
+            request_timeout_seconds=call_policy_config.request_timeout_seconds,
+            bulk_request_timeout_seconds=call_policy_config.bulk_request_timeout_seconds,
+            extraction_request_timeout_seconds=call_policy_config.extraction_request_timeout_seconds,
+            request_max_retries=call_policy_config.request_max_retries,
+            call_timeout_seconds=call_policy_config.call_timeout_seconds,
+            hedge=call_policy_config.hedge,
+            hedge_percentile=call_policy_config.hedge_percentile,
+            hedge_min_samples=call_policy_config.hedge_min_samples,
+        )
+    )
+
+    # Workers share one embedder per model via the registry, so weights are only pulled once.
     logger.warning(f'Pulling Huggingface embedding weights down, please wait a moment...')
     build_document_worker()
     build_question_worker()
@@ -69,8 +134,22 @@ async def lifespan(app: FastAPI):
 
     logger.warning('Completed pulling weights from Huggingface.')
 
+    # Background ingestion jobs are drained from the jobs table by this process.
+    build_job_runner()
+    await get_job_runner().start()
+
+    # Periodically delete uploaded RFP files that can no longer be reused.
+    remote_file_cleanup = asyncio.create_task(get_question_worker().run_remote_file_cleanup())
+
     yield
 
+    remote_file_cleanup.cancel()
+    await asyncio.gather(remote_file_cleanup, return_exceptions=True)
+    await get_job_runner().stop()
+    shutdown_document_worker()
+    await dispose_async_engines()
+    dispose_engines()
+
 def create_app() -> FastAPI:
     app = FastAPI(title="Document Ingestion API", version="0.1.0", lifespan=lifespan)
     max_upload_size = int(os.getenv("MAX_UPLOAD_SIZE_BYTES", str(DEFAULT_MAX_UPLOAD_SIZE_BYTES)))
@@ -94,6 +173,10 @@ def create_app() -> FastAPI:
         payload: Dict[str, Any] = {"error": str(exc)}
         return JSONResponse(status_code=404, content=payload)
 
+    @app.exception_handler(GenerativeDeadlineExceeded)
+    async def deadline_exceeded_handler(request: Request, exc: GenerativeDeadlineExceeded):
+        return JSONResponse(status_code=504, content={"error": str(exc)})
+
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         payload: Dict[str, Any] = {"error": exc.detail or "HTTP error"}
@@ -112,6 +195,8 @@ def create_app() -> FastAPI:
     app.include_router(document_router)
     app.include_router(rfp_router)
     app.include_router(answer_router)
+    app.include_router(status_router)
+    app.include_router(job_router)
     return app
 
 app = create_app()
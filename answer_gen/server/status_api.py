@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from answer_gen.components.answers.semantic_cache import get_semantic_cache_stats
+from answer_gen.storage.db import get_pool_stats
+from answer_gen.utils.embedder import get_embedder_stats, get_embedding_cache_stats
+from answer_gen.utils.generative import get_response_cache_stats
+from answer_gen.utils.generative.clients import get_call_policy_stats, get_rate_limiter_stats
+
+status_router = APIRouter(prefix="/api/status")
+
+@status_router.get("/db-pool")
+async def get_db_pool_status():
+    return {"pools": get_pool_stats()}
+
+@status_router.get("/embedders")
+async def get_embedders_status():
+    return {"embedders": get_embedder_stats(), "cache": get_embedding_cache_stats()}
+
+@status_router.get("/answer-cache")
+async def get_answer_cache_status():
+    return {"semantic_cache": get_semantic_cache_stats(), "llm_response_cache": get_response_cache_stats()}
+
+@status_router.get("/llm-rate-limits")
+async def get_llm_rate_limit_status():
+    return {"models": get_rate_limiter_stats(), "call_policy": get_call_policy_stats()}
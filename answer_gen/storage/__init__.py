@@ -1,9 +1,18 @@
 """SQLAlchemy base and model exports for storage package."""
 
+import os
+
+from dotenv import load_dotenv
 from sqlalchemy.orm import declarative_base
 
+load_dotenv()
+
 Base = declarative_base()
 
+# Width of every stored embedding; must match the configured embedding model's output dimension
+# (384 for sentence-transformers/all-MiniLM-L6-v2). pgvector can only index fixed-width columns.
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "384"))
+
 # Import models so Base.metadata is populated on import
 from .document import Document  # noqa: E402,F401
 from .chunk_version import ChunkVersion  # noqa: E402,F401
@@ -12,6 +21,12 @@ from .chunk import Chunk  # noqa: E402,F401
 from .rfp import RFP  # noqa: E402,F401
 from .question import Question  # noqa: E402,F401
 from .answer import Answer  # noqa: E402,F401
+from .embedding_cache_entry import EmbeddingCacheEntry  # noqa: E402,F401
+from .llm_response_cache_entry import LlmResponseCacheEntry  # noqa: E402,F401
+from .rfp_remote_file import RfpRemoteFile  # noqa: E402,F401
+from .rfp_parse_cache_entry import RfpParseCacheEntry  # noqa: E402,F401
+from .job import Job  # noqa: E402,F401
+from .job_document import JobDocument  # noqa: E402,F401
 from .factories import (  # noqa: E402,F401
     document_factory,
     chunk_version_factory,
@@ -20,10 +35,13 @@ from .factories import (  # noqa: E402,F401
     rfp_factory,
     question_factory,
     answer_factory,
+    job_factory,
+    job_document_factory,
 )
 
 __all__ = [
     "Base",
+    "EMBEDDING_DIM",
     "Document",
     "ChunkVersion",
     "AnswerVersion",
@@ -31,6 +49,12 @@ __all__ = [
     "RFP",
     "Question",
     "Answer",
+    "EmbeddingCacheEntry",
+    "LlmResponseCacheEntry",
+    "RfpRemoteFile",
+    "RfpParseCacheEntry",
+    "Job",
+    "JobDocument",
     "document_factory",
     "chunk_version_factory",
     "answer_version_factory",
@@ -38,4 +62,6 @@ __all__ = [
     "rfp_factory",
     "question_factory",
     "answer_factory",
+    "job_factory",
+    "job_document_factory",
 ]
@@ -12,6 +12,9 @@ class Answer(Base):
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False)
     answer_version_id = Column(Integer, ForeignKey("answer_versions.id"), nullable=True)
+    # Retrieval corpus the answer was grounded on; semantic-cache reuse requires both to match.
+    chunk_version_id = Column(Integer, ForeignKey("chunk_versions.id"), nullable=True)
+    corpus_stamp = Column(String(64), nullable=True)
 
     question = relationship("Question", back_populates="answers")
     answer_version = relationship("AnswerVersion", back_populates="answers")
@@ -23,6 +26,7 @@ class Answer(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "question_id": self.question_id,
             "answer_version_id": self.answer_version_id,
+            "chunk_version_id": self.chunk_version_id,
         }
 
     def __repr__(self) -> str:  # pragma: no cover
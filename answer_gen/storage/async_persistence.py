@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from answer_gen.exceptions import StorageWriteError
+from answer_gen.storage import (
+    Document,
+    Chunk,
+    RFP,
+    RfpRemoteFile,
+    RfpParseCacheEntry,
+    Question,
+    Answer,
+    ChunkVersion,
+    AnswerVersion,
+    Job,
+    JobDocument,
+)
+from answer_gen.storage import copy_loader, queries
+from answer_gen.storage.job import JOB_RUNNING
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPersistence:
+    """Asyncio counterpart of `Persistence` so DB I/O never blocks the event loop."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    # ---- Documents ----
+    async def get_documents_by_hashes(self, doc_hashes: list[str]) -> list[Document]:
+        if not doc_hashes:
+            return []
+        stmt = queries.documents_by_hashes_stmt(doc_hashes)
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def get_most_recent_document(self) -> Document | None:
+        stmt = queries.most_recent_document_stmt()
+        return (await self.session.execute(stmt)).scalars().first()
+
+    def insert_document(self, document: Document) -> None:
+        self.session.add(document)
+
+    async def delete_document(self, document: Document) -> None:
+        await self.session.delete(document)
+
+    # ---- RFPs ----
+    async def get_rfp_by_hash(self, doc_hash: str) -> RFP | None:
+        stmt = queries.rfp_by_hash_stmt(doc_hash)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    def insert_rfp(self, rfp: RFP) -> None:
+        self.session.add(rfp)
+
+    async def get_rfp_remote_file(self, rfp_hash: str) -> RfpRemoteFile | None:
+        stmt = queries.rfp_remote_file_stmt(rfp_hash)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_stale_rfp_remote_files(self, expiring_before: datetime) -> list[RfpRemoteFile]:
+        stmt = queries.stale_rfp_remote_files_stmt(expiring_before)
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def upsert_rfp_remote_file(self, rfp_hash: str, file_id: str, expires_at: datetime | None) -> RfpRemoteFile:
+        remote_file = await self.get_rfp_remote_file(rfp_hash)
+        if remote_file is None:
+            remote_file = RfpRemoteFile(rfp_hash=rfp_hash)
+            self.session.add(remote_file)
+        remote_file.file_id = file_id
+        remote_file.uploaded_at = datetime.utcnow()
+        remote_file.expires_at = expires_at
+        return remote_file
+
+    async def delete_rfp_remote_file(self, remote_file: RfpRemoteFile) -> None:
+        await self.session.delete(remote_file)
+
+    async def get_parsed_questions(self, rfp_hash: str, prompt_version: str, model_name: str) -> list[str] | None:
+        stmt = queries.rfp_parse_cache_lookup_stmt(rfp_hash, prompt_version, model_name)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def put_parsed_questions(self, rfp_hash: str, prompt_version: str, model_name: str, questions: list[str]) -> None:
+        await self.session.merge(
+            RfpParseCacheEntry(rfp_hash=rfp_hash, prompt_version=prompt_version, model_name=model_name, questions=list(questions))
+        )
+
+    # ---- Questions ----
+    async def get_question_by_id(self, question_id: int) -> Question | None:
+        stmt = queries.question_by_id_stmt(question_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_questions_by_rfp(self, rfp_id: int) -> list[Question]:
+        stmt = queries.questions_by_rfp_stmt(rfp_id)
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def get_questions_with_answers(self, rfp_id: int) -> list[Question]:
+        stmt = queries.questions_with_answers_stmt(rfp_id)
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def delete_questions_not_in(self, rfp_id: int, keep_texts: list[str]) -> int:
+        stmt = queries.delete_questions_not_in_stmt(rfp_id, keep_texts)
+        result = await self.session.execute(stmt)
+        return int(result.rowcount or 0)
+
+    async def bulk_insert_questions(self, questions: list[Question]) -> None:
+        if questions:
+            await self.session.run_sync(lambda s: s.bulk_save_objects(questions, return_defaults = True))
+
+    # ---- Answers ----
+    def insert_answer(self, answer: Answer) -> None:
+        self.session.add(answer)
+
+    async def get_answer_by_id(self, answer_id: int) -> Answer | None:
+        stmt = queries.answer_by_id_stmt(answer_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def bulk_insert_answers(self, answers: list[Answer]) -> None:
+        if answers:
+            await self.session.run_sync(lambda s: s.bulk_save_objects(answers))
+
+    async def get_answer_version_by_name(self, version_name: str) -> AnswerVersion | None:
+        stmt = queries.answer_version_by_name_stmt(version_name)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    # ---- Chunks ----
+    async def bulk_insert_chunks(self, chunks: list[Chunk], method: str = "orm") -> None:
+        """Insert chunks via the ORM, or via binary COPY when ``method="copy"`` and the DB supports it."""
+        if not chunks:
+            return
+        if method == "copy" and copy_loader.supports_copy(self.session.get_bind()):
+            await copy_loader.copy_chunks_async(self.session, chunks)
+        else:
+            await self.session.run_sync(lambda s: s.bulk_save_objects(chunks))
+
+    async def get_chunks_by_doc_and_version(self, doc_id: int, chunk_version_id: int) -> list[Chunk]:
+        stmt = queries.chunks_by_doc_and_version_stmt(doc_id, chunk_version_id)
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def get_chunk_version(self, version_name: str) -> ChunkVersion | None:
+        stmt = queries.chunk_version_by_name_stmt(version_name)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_chunk_version_by_name(self, version_name: str) -> ChunkVersion | None:
+        return await self.get_chunk_version(version_name)
+
+    async def get_most_similar_chunks(
+        self,
+        query_embedding: list[float],
+        min_similarity: float,
+        top_k: int,
+        chunk_version_id: int | None = None,
+        oversample: int = 1,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[tuple[Chunk, float]]:
+        """Return up to ``top_k`` `(chunk, similarity)` pairs at or above ``min_similarity``.
+
+        The index-ordered top ``top_k * oversample`` candidates are fetched first and the
+        threshold is applied afterwards, so the ANN index drives the scan.
+        """
+        if query_embedding is None or len(query_embedding) == 0:
+            raise ValueError("query_embedding must be non-empty")
+        for setting in queries.vector_search_settings_stmts(ef_search, probes):
+            await self.session.execute(setting)
+        stmt = queries.most_similar_chunks_stmt(query_embedding, top_k * max(1, oversample), chunk_version_id)
+        return queries.filter_similar_chunks((await self.session.execute(stmt)).all(), min_similarity, top_k)
+
+    async def get_most_similar_chunks_batch(
+        self,
+        query_embeddings,
+        min_similarity: float,
+        top_k: int,
+        chunk_version_id: int | None = None,
+        oversample: int = 1,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[list[tuple[Chunk, float]]]:
+        """Batched `get_most_similar_chunks`: one statement, results grouped per query embedding."""
+        if len(query_embeddings) == 0:
+            return []
+        for setting in queries.vector_search_settings_stmts(ef_search, probes):
+            await self.session.execute(setting)
+        stmt = queries.most_similar_chunks_batch_stmt(query_embeddings, top_k * max(1, oversample), chunk_version_id)
+        return queries.group_similar_chunks((await self.session.execute(stmt)).all(), len(query_embeddings), min_similarity, top_k)
+
+    async def get_corpus_stamp(self, chunk_version_id: int | None = None) -> str:
+        """Fingerprint of the chunk corpus; it changes whenever documents are added or removed."""
+        count, max_id = (await self.session.execute(queries.corpus_stamp_stmt(chunk_version_id))).one()
+        return f"{int(count or 0)}:{int(max_id or 0)}"
+
+    async def get_similar_answers_batch(
+        self,
+        query_embeddings,
+        min_similarity: float,
+        candidates: int,
+        chunk_version_id: int | None,
+        corpus_stamp: str,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        exclude_question_ids: Sequence[int] = (),
+        exclude_content_prefix: str | None = None,
+    ) -> list[tuple[Answer, float] | None]:
+        """Best reusable answer per query embedding from the nearest previously answered questions."""
+        if len(query_embeddings) == 0:
+            return []
+        for setting in queries.vector_search_settings_stmts(ef_search, probes):
+            await self.session.execute(setting)
+        stmt = queries.similar_answers_batch_stmt(
+            query_embeddings,
+            max(1, candidates),
+            chunk_version_id,
+            corpus_stamp,
+            exclude_question_ids=exclude_question_ids,
+            exclude_content_prefix=exclude_content_prefix,
+        )
+        return queries.group_similar_answers((await self.session.execute(stmt)).all(), len(query_embeddings), min_similarity)
+
+    # ---- LLM response cache ----
+    async def get_cached_llm_response(self, fingerprint: str, fresh_after: datetime | None = None) -> str | None:
+        stmt = queries.llm_response_cache_lookup_stmt(fingerprint, fresh_after)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def put_cached_llm_response(self, fingerprint: str, model_name: str, response_text: str) -> None:
+        stmt = queries.llm_response_cache_upsert_stmt(fingerprint, model_name, response_text, datetime.utcnow())
+        await self.session.execute(stmt)
+
+    # ---- Jobs ----
+    def insert_job(self, job: Job) -> None:
+        self.session.add(job)
+
+    async def insert_job_document(self, job_document: JobDocument) -> None:
+        """Write one job document and detach it, so its file bytes are not held until commit."""
+        self.session.add(job_document)
+        await self.flush()
+        self.session.expunge(job_document)
+
+    async def get_job(self, job_id: int) -> Job | None:
+        stmt = queries.job_by_id_stmt(job_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def claim_next_job(self, kinds: list[str]) -> Job | None:
+        """Lock the oldest queued job of ``kinds`` and mark it running; the caller commits."""
+        job = (await self.session.execute(queries.claim_job_stmt(kinds))).scalar_one_or_none()
+        if job is None:
+            return None
+        now = datetime.utcnow()
+        job.status = JOB_RUNNING
+        job.attempts = (job.attempts or 0) + 1
+        job.started_at = job.started_at or now
+        job.heartbeat_at = now
+        return job
+
+    async def requeue_stale_jobs(self, kinds: list[str], stale_before: datetime) -> int:
+        result = await self.session.execute(queries.requeue_stale_jobs_stmt(kinds, stale_before))
+        return int(result.rowcount or 0)
+
+    async def touch_job(self, job_id: int) -> None:
+        await self.session.execute(queries.job_heartbeat_stmt(job_id, datetime.utcnow()))
+
+    async def add_job_progress(self, job_id: int, done: int = 0, failed: int = 0, chunks: int = 0) -> None:
+        await self.session.execute(queries.job_progress_stmt(job_id, datetime.utcnow(), done, failed, chunks))
+
+    async def set_job_total(self, job_id: int, total_items: int) -> None:
+        await self.session.execute(queries.job_total_stmt(job_id, total_items))
+
+    async def set_job_result(self, job_id: int, result: dict | None) -> None:
+        """Store ``result`` while the job runs (e.g. a resume checkpoint); finishing overwrites it."""
+        await self.session.execute(queries.job_result_stmt(job_id, result))
+
+    async def get_pending_job_document_ids(self, job_id: int) -> list[int]:
+        stmt = queries.pending_job_document_ids_stmt(job_id)
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def get_job_document(self, job_document_id: int) -> JobDocument | None:
+        stmt = queries.job_document_by_id_stmt(job_document_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    # ---- Tx helpers ----
+    async def begin_nested(self):
+        """Open a SAVEPOINT so one unit (e.g. a document) can be rolled back on its own."""
+        return await self.session.begin_nested()
+
+    async def flush(self) -> None:
+        try:
+            await self.session.flush()
+        except Exception:
+            logger.exception("Storage flush failed")
+            await self._rollback_innermost()
+            raise StorageWriteError(f'Unable to flush to storage.')
+
+    async def commit(self) -> None:
+        try:
+            await self.session.commit()
+        except Exception:
+            logger.exception("Storage commit failed")
+            await self.rollback()
+            raise StorageWriteError(f'Unable to commit transactiom to storage.')
+
+    async def _rollback_innermost(self) -> None:
+        """Roll back only the open SAVEPOINT, if any, so work already released under earlier ones survives."""
+        nested = self.session.get_nested_transaction()
+        if nested is not None and nested.is_active:
+            await nested.rollback()
+        else:
+            await self.rollback()
+
+    async def rollback(self) -> None:
+        try:
+            await self.session.rollback()
+        except Exception:
+            logger.exception("Storage rollback failed")
+            raise
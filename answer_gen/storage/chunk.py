@@ -2,7 +2,7 @@ from pgvector.sqlalchemy import Vector
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func, UniqueConstraint, Index, Text
 from sqlalchemy.orm import relationship
 
-from . import Base
+from . import Base, EMBEDDING_DIM
 
 
 class Chunk(Base):
@@ -15,7 +15,7 @@ class Chunk(Base):
     doc_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
     order = Column(Integer, nullable = False)
     content = Column(Text, nullable=False)
-    embedding = Column(Vector(), nullable=True)
+    embedding = Column(Vector(EMBEDDING_DIM), nullable=True)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     chunk_version_id = Column(Integer, ForeignKey("chunk_versions.id"), nullable=False)
@@ -0,0 +1,71 @@
+"""Binary `COPY ... FROM STDIN` loader for chunk rows (PostgreSQL + psycopg only)."""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from answer_gen.storage import Chunk
+
+logger = logging.getLogger(__name__)
+
+CHUNK_COPY_SQL = (
+    'COPY chunks (doc_id, "order", content, embedding, chunk_version_id) '
+    "FROM STDIN WITH (FORMAT BINARY)"
+)
+CHUNK_COPY_TYPES = ["int4", "int4", "text", "vector", "int4"]
+
+
+def supports_copy(bind) -> bool:
+    """COPY needs a psycopg (v3) connection to PostgreSQL; anything else uses the ORM path."""
+    dialect = bind.dialect
+    return dialect.name == "postgresql" and dialect.driver in ("psycopg", "psycopg_async")
+
+
+def chunk_copy_rows(chunks: Iterable[Chunk]) -> Iterable[tuple]:
+    for chunk in chunks:
+        embedding = chunk.embedding
+        if embedding is not None:
+            # pgvector's binary dumper writes float32 straight from the array buffer.
+            embedding = np.asarray(embedding, dtype=np.float32)
+        yield (chunk.doc_id, chunk.order, chunk.content, embedding, chunk.chunk_version_id)
+
+
+def copy_chunks(session: Session, chunks: list[Chunk]) -> int:
+    """Stream ``chunks`` into the session's current transaction with binary COPY."""
+    from pgvector.psycopg import register_vector
+
+    driver = session.connection().connection.driver_connection
+    if driver.adapters.types.get("vector") is None:
+        register_vector(driver)
+
+    with driver.cursor() as cursor:
+        with cursor.copy(CHUNK_COPY_SQL) as copy:
+            copy.set_types(CHUNK_COPY_TYPES)
+            for row in chunk_copy_rows(chunks):
+                copy.write_row(row)
+    logger.debug("Copied chunks count=%s", len(chunks))
+    return len(chunks)
+
+
+async def copy_chunks_async(session: AsyncSession, chunks: list[Chunk]) -> int:
+    """Asyncio counterpart of `copy_chunks`."""
+    from pgvector.psycopg import register_vector_async
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    if driver.adapters.types.get("vector") is None:
+        await register_vector_async(driver)
+
+    async with driver.cursor() as cursor:
+        async with cursor.copy(CHUNK_COPY_SQL) as copy:
+            copy.set_types(CHUNK_COPY_TYPES)
+            for row in chunk_copy_rows(chunks):
+                await copy.write_row(row)
+    logger.debug("Copied chunks count=%s", len(chunks))
+    return len(chunks)
@@ -1,27 +1,172 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from contextlib import contextmanager
-from . import Base
+from contextlib import contextmanager, asynccontextmanager
+from threading import Lock
+from . import Base, EMBEDDING_DIM
+import logging
 import sys
 import os
 
 from dotenv import load_dotenv
 
-def build_engine(db_url, connection_pool_size = 10):
-    return create_engine(db_url, pool_size=connection_pool_size)
+from answer_gen.utils.config.database_config import DatabasePoolConfig
 
-def build_session(engine):
-    Session = sessionmaker(engine)
-    return Session()
+logger = logging.getLogger(__name__)
+
+# Process-wide engine registry keyed by DB URL so every unit of work reuses one pool.
+_ENGINES: dict[str, Engine] = {}
+_SESSION_FACTORIES: dict[tuple[str, bool], sessionmaker] = {}
+_ASYNC_ENGINES: dict[str, AsyncEngine] = {}
+_ASYNC_SESSION_FACTORIES: dict[tuple[str, bool], async_sessionmaker] = {}
+_REGISTRY_LOCK = Lock()
+
+
+def build_engine(db_url, pool_config: DatabasePoolConfig | None = None) -> Engine:
+    """Create a new engine for ``db_url`` using the given pool settings."""
+    pool_config = pool_config or DatabasePoolConfig()
+
+    # SQLite (used by tests) does not use a QueuePool, so sizing args are not accepted.
+    if make_url(db_url).get_backend_name() == "sqlite":
+        return create_engine(db_url, pool_pre_ping=pool_config.pool_pre_ping)
+
+    return create_engine(
+        db_url,
+        pool_size=pool_config.pool_size,
+        max_overflow=pool_config.max_overflow,
+        pool_pre_ping=pool_config.pool_pre_ping,
+        pool_recycle=pool_config.pool_recycle,
+        pool_timeout=pool_config.pool_timeout,
+    )
+
+
+def build_async_engine(db_url, pool_config: DatabasePoolConfig | None = None) -> AsyncEngine:
+    """Create a new asyncio engine; ``postgresql+psycopg`` resolves to psycopg's async driver."""
+    pool_config = pool_config or DatabasePoolConfig()
+    return create_async_engine(
+        db_url,
+        pool_size=pool_config.pool_size,
+        max_overflow=pool_config.max_overflow,
+        pool_pre_ping=pool_config.pool_pre_ping,
+        pool_recycle=pool_config.pool_recycle,
+        pool_timeout=pool_config.pool_timeout,
+    )
+
+
+def init_engine(db_url, pool_config: DatabasePoolConfig | None = None) -> Engine:
+    """Create the shared engine for ``db_url`` once and return it on later calls."""
+    with _REGISTRY_LOCK:
+        engine = _ENGINES.get(db_url)
+        if engine is None:
+            engine = build_engine(db_url, pool_config)
+            _ENGINES[db_url] = engine
+            logger.info("Created shared engine url=%s", _masked_url(db_url))
+        return engine
+
+
+def get_engine(db_url) -> Engine:
+    """Return the shared engine for ``db_url``, creating it with defaults if needed."""
+    engine = _ENGINES.get(db_url)
+    return engine if engine is not None else init_engine(db_url)
+
+
+def init_async_engine(db_url, pool_config: DatabasePoolConfig | None = None) -> AsyncEngine:
+    """Create the shared asyncio engine for ``db_url`` once and return it on later calls."""
+    with _REGISTRY_LOCK:
+        engine = _ASYNC_ENGINES.get(db_url)
+        if engine is None:
+            engine = build_async_engine(db_url, pool_config)
+            _ASYNC_ENGINES[db_url] = engine
+            logger.info("Created shared async engine url=%s", _masked_url(db_url))
+        return engine
+
+
+def get_async_engine(db_url) -> AsyncEngine:
+    """Return the shared asyncio engine for ``db_url``, creating it with defaults if needed."""
+    engine = _ASYNC_ENGINES.get(db_url)
+    return engine if engine is not None else init_async_engine(db_url)
+
+
+def dispose_engines() -> None:
+    """Close all pooled connections and clear the registry (server shutdown)."""
+    with _REGISTRY_LOCK:
+        for db_url, engine in _ENGINES.items():
+            engine.dispose()
+            logger.info("Disposed shared engine url=%s", _masked_url(db_url))
+        _ENGINES.clear()
+        _SESSION_FACTORIES.clear()
+
+
+async def dispose_async_engines() -> None:
+    """Close all pooled asyncio connections and clear the async registry."""
+    with _REGISTRY_LOCK:
+        engines = list(_ASYNC_ENGINES.items())
+        _ASYNC_ENGINES.clear()
+        _ASYNC_SESSION_FACTORIES.clear()
+
+    for db_url, engine in engines:
+        await engine.dispose()
+        logger.info("Disposed shared async engine url=%s", _masked_url(db_url))
+
+
+def get_pool_stats() -> dict[str, dict]:
+    """Return per-engine connection pool counters for sizing under load."""
+    stats = {}
+    engines = [(db_url, engine.pool, "sync") for db_url, engine in list(_ENGINES.items())]
+    engines += [(db_url, engine.sync_engine.pool, "async") for db_url, engine in list(_ASYNC_ENGINES.items())]
+    for db_url, pool, mode in engines:
+        stats[f"{mode}:{_masked_url(db_url)}"] = {
+            "pool_class": type(pool).__name__,
+            "size": _pool_counter(pool, "size"),
+            "checked_in": _pool_counter(pool, "checkedin"),
+            "checked_out": _pool_counter(pool, "checkedout"),
+            "overflow": _pool_counter(pool, "overflow"),
+            "status": pool.status(),
+        }
+    return stats
+
+
+def _pool_counter(pool, name: str) -> int | None:
+    """Read a QueuePool counter, returning None for pool classes that lack it."""
+    counter = getattr(pool, name, None)
+    return counter() if callable(counter) else None
+
+
+def _masked_url(db_url) -> str:
+    return make_url(db_url).render_as_string(hide_password=True)
+
+
+def _get_session_factory(db_url, bulk: bool) -> sessionmaker:
+    """Return a cached session factory bound to the shared engine for ``db_url``."""
+    key = (db_url, bulk)
+    factory = _SESSION_FACTORIES.get(key)
+    if factory is None:
+        engine = get_engine(db_url)
+        if bulk:
+            factory = sessionmaker(autocommit = False, autoflush = False, bind = engine)
+        else:
+            factory = sessionmaker(engine)
+        _SESSION_FACTORIES[key] = factory
+    return factory
+
+
+def _get_async_session_factory(db_url, bulk: bool) -> async_sessionmaker:
+    """Return a cached asyncio session factory bound to the shared async engine."""
+    key = (db_url, bulk)
+    factory = _ASYNC_SESSION_FACTORIES.get(key)
+    if factory is None:
+        engine = get_async_engine(db_url)
+        # Objects stay readable after commit; refreshing them would need awaited lazy loads.
+        factory = async_sessionmaker(engine, autoflush = not bulk, expire_on_commit = False)
+        _ASYNC_SESSION_FACTORIES[key] = factory
+    return factory
 
-def build_bulk_session(engine):
-    Session = sessionmaker(autocommit = False, autoflush = False, bind = engine)
-    return Session()
 
 @contextmanager
-def build_connection(db_url, connection_pool_size = 10):
-    engine = build_engine(db_url, connection_pool_size)
-    session = build_session(engine)
+def build_connection(db_url):
+    """Borrow a session from the shared pool for one unit of work."""
+    session = _get_session_factory(db_url, bulk=False)()
 
     try:
         yield session
@@ -29,17 +174,57 @@ def build_connection(db_url, connection_pool_size = 10):
         session.close()
 
 @contextmanager
-def build_bulk_connection(db_url, connection_pool_size = 10):
-    engine = build_engine(db_url, connection_pool_size)
-    session = build_bulk_session(engine)
+def build_bulk_connection(db_url):
+    """Borrow a non-autoflushing session from the shared pool for bulk writes."""
+    session = _get_session_factory(db_url, bulk=True)()
 
     try:
         yield session
     finally:
         session.close()
 
+@asynccontextmanager
+async def build_async_connection(db_url):
+    """Borrow an asyncio session from the shared async pool for one unit of work."""
+    session = _get_async_session_factory(db_url, bulk=False)()
+
+    try:
+        yield session
+    finally:
+        await session.close()
+
+@asynccontextmanager
+async def build_async_bulk_connection(db_url):
+    """Borrow a non-autoflushing asyncio session from the shared async pool for bulk writes."""
+    session = _get_async_session_factory(db_url, bulk=True)()
+
+    try:
+        yield session
+    finally:
+        await session.close()
+
+def ensure_question_embedding_column(conn: Connection, dim: int = EMBEDDING_DIM) -> None:
+    """Add `questions.embedding` to databases created before it existed."""
+    conn.execute(text(f"ALTER TABLE questions ADD COLUMN IF NOT EXISTS embedding vector({int(dim)})"))
+
+
+def ensure_answer_cache_columns(conn: Connection) -> None:
+    """Add the semantic-cache provenance columns to `answers` in databases created before them."""
+    conn.execute(text("ALTER TABLE answers ADD COLUMN IF NOT EXISTS chunk_version_id integer REFERENCES chunk_versions(id)"))
+    conn.execute(text("ALTER TABLE answers ADD COLUMN IF NOT EXISTS corpus_stamp varchar(64)"))
+
+
+def migrate_tables(conn: Connection) -> None:
+    """Add columns introduced after a table was first created; `create_all` never alters existing tables."""
+    ensure_question_embedding_column(conn)
+    ensure_answer_cache_columns(conn)
+
+
 def build_tables(engine):
     Base.metadata.create_all(engine)
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            migrate_tables(conn)
 
 
 if __name__ == "__main__":
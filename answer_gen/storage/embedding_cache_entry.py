@@ -0,0 +1,17 @@
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Boolean, Column, DateTime, String, func
+
+from . import Base, EMBEDDING_DIM
+
+
+class EmbeddingCacheEntry(Base):
+    __tablename__ = "embedding_cache"
+
+    model_name = Column(String(255), primary_key=True)
+    normalize = Column(Boolean, primary_key=True)
+    text_hash = Column(String(64), primary_key=True)
+    embedding = Column(Vector(EMBEDDING_DIM), nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<EmbeddingCacheEntry model={self.model_name!r} hash={self.text_hash[:12]}>"
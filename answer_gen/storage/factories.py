@@ -11,7 +11,11 @@ from . import (
     RFP,
     Question,
     Answer,
+    Job,
+    JobDocument,
 )
+from .job import JOB_QUEUED
+from .job_document import JOB_DOCUMENT_PENDING
 
 
 def document_factory(
@@ -85,10 +89,37 @@ def answer_factory(
     question_id: int,
     answer_version_id: Optional[int] = None,
     created_at: Optional[datetime] = None,
+    chunk_version_id: Optional[int] = None,
+    corpus_stamp: Optional[str] = None,
 ) -> Answer:
     return Answer(
         content=content,
         question_id=question_id,
         answer_version_id=answer_version_id,
         created_at=created_at or datetime.utcnow(),
+        chunk_version_id=chunk_version_id,
+        corpus_stamp=corpus_stamp,
+    )
+
+
+def job_factory(kind: str, payload: Optional[dict] = None, total_items: int = 0) -> Job:
+    return Job(
+        kind=kind,
+        status=JOB_QUEUED,
+        payload=payload,
+        total_items=total_items,
+        items_done=0,
+        items_failed=0,
+        chunks_done=0,
+        attempts=0,
+    )
+
+
+def job_document_factory(filename: str, doc_hash: str, content: bytes) -> JobDocument:
+    return JobDocument(
+        filename=filename,
+        doc_hash=doc_hash,
+        content=content,
+        status=JOB_DOCUMENT_PENDING,
+        chunk_count=0,
     )
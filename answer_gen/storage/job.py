@@ -0,0 +1,60 @@
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import relationship
+
+from . import Base
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_TERMINAL_STATUSES = (JOB_SUCCEEDED, JOB_FAILED)
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_kind_id", "status", "kind", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default=JOB_QUEUED)
+    payload = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    total_items = Column(Integer, nullable=False, default=0)
+    items_done = Column(Integer, nullable=False, default=0)
+    items_failed = Column(Integer, nullable=False, default=0)
+    chunks_done = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    documents = relationship("JobDocument", back_populates="job", cascade="all, delete-orphan", order_by="JobDocument.id")
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in JOB_TERMINAL_STATUSES
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "payload": self.payload,
+            "result": self.result,
+            "error": self.error,
+            "total_items": self.total_items,
+            "items_done": self.items_done,
+            "items_failed": self.items_failed,
+            "chunks_done": self.chunks_done,
+            "attempts": self.attempts,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<Job id={self.id} kind={self.kind!r} status={self.status!r}>"
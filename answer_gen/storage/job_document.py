@@ -0,0 +1,42 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String, Text, func
+from sqlalchemy.orm import relationship
+
+from . import Base
+
+JOB_DOCUMENT_PENDING = "pending"
+JOB_DOCUMENT_SUCCEEDED = "succeeded"
+JOB_DOCUMENT_SKIPPED = "skipped"
+JOB_DOCUMENT_FAILED = "failed"
+
+
+class JobDocument(Base):
+    """An uploaded file persisted with its ingestion job so the job can run (or resume) later."""
+
+    __tablename__ = "job_documents"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    filename = Column(String(100), nullable=False)
+    doc_hash = Column(String(32), nullable=False)
+    # Cleared once the document is processed; only pending rows hold file bytes.
+    content = Column(LargeBinary, nullable=True)
+    status = Column(String(20), nullable=False, default=JOB_DOCUMENT_PENDING)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="SET NULL"), nullable=True)
+    chunk_count = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    job = relationship("Job", back_populates="documents")
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "document_id": self.document_id,
+            "chunk_count": self.chunk_count,
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<JobDocument id={self.id} job_id={self.job_id} status={self.status!r}>"
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, String, Text, func
+
+from . import Base
+
+
+class LlmResponseCacheEntry(Base):
+    __tablename__ = "llm_response_cache"
+
+    fingerprint = Column(String(64), primary_key=True)
+    model_name = Column(String(255), nullable=False)
+    response_text = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<LlmResponseCacheEntry model={self.model_name!r} fingerprint={self.fingerprint[:12]}>"
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 import logging
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-
 from answer_gen.exceptions import StorageWriteError
 from answer_gen.storage import (
     Document,
@@ -15,6 +12,7 @@ from answer_gen.storage import (
     ChunkVersion,
     AnswerVersion,
 )
+from answer_gen.storage import copy_loader, queries
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +27,11 @@ class Persistence:
     def get_documents_by_hashes(self, doc_hashes: list[str]) -> list[Document]:
         if not doc_hashes:
             return []
-        stmt = select(Document).where(Document.hash.in_(doc_hashes))
+        stmt = queries.documents_by_hashes_stmt(doc_hashes)
         return list(self.session.execute(stmt).scalars().all())
 
     def get_most_recent_document(self) -> Document | None:
-        stmt = select(Document).order_by(Document.uploaded_at.desc()).limit(1)
+        stmt = queries.most_recent_document_stmt()
         return self.session.execute(stmt).scalars().first()
 
     def insert_document(self, document: Document) -> None:
@@ -44,7 +42,7 @@ class Persistence:
 
     # ---- RFPs ----
     def get_rfp_by_hash(self, doc_hash: str) -> RFP | None:
-        stmt = select(RFP).where(RFP.hash == doc_hash)
+        stmt = queries.rfp_by_hash_stmt(doc_hash)
         return self.session.execute(stmt).scalar_one_or_none()
 
     def insert_rfp(self, rfp: RFP) -> None:
@@ -52,26 +50,19 @@ class Persistence:
 
     # ---- Questions ----
     def get_question_by_id(self, question_id: int) -> Question | None:
-        stmt = select(Question).where(Question.id == question_id)
+        stmt = queries.question_by_id_stmt(question_id)
         return self.session.execute(stmt).scalar_one_or_none()
 
     def get_questions_by_rfp(self, rfp_id: int) -> list[Question]:
-        stmt = select(Question).where(Question.rfp_id == rfp_id)
+        stmt = queries.questions_by_rfp_stmt(rfp_id)
         return list(self.session.execute(stmt).scalars().all())
 
     def get_questions_with_answers(self, rfp_id: int) -> list[Question]:
-        stmt = (
-            select(Question)
-            .where(Question.rfp_id == rfp_id)
-            .options(selectinload(Question.answers))
-        )
+        stmt = queries.questions_with_answers_stmt(rfp_id)
         return list(self.session.execute(stmt).scalars().all())
 
     def delete_questions_not_in(self, rfp_id: int, keep_texts: list[str]) -> int:
-        if keep_texts:
-            stmt = Question.__table__.delete().where(Question.rfp_id == rfp_id, ~Question.content.in_(keep_texts))
-        else:
-            stmt = Question.__table__.delete().where(Question.rfp_id == rfp_id)
+        stmt = queries.delete_questions_not_in_stmt(rfp_id, keep_texts)
         result = self.session.execute(stmt)
         return int(result.rowcount or 0)
 
@@ -84,7 +75,7 @@ class Persistence:
         self.session.add(answer)
 
     def get_answer_by_id(self, answer_id: int) -> Answer | None:
-        stmt = select(Answer).where(Answer.id == answer_id)
+        stmt = queries.answer_by_id_stmt(answer_id)
         return self.session.execute(stmt).scalar_one_or_none()
 
     def bulk_insert_answers(self, answers: list[Answer]) -> None:
@@ -92,24 +83,25 @@ class Persistence:
             self.session.bulk_save_objects(answers)
 
     def get_answer_version_by_name(self, version_name: str) -> AnswerVersion | None:
-        stmt = select(AnswerVersion).where(AnswerVersion.version_name == version_name)
+        stmt = queries.answer_version_by_name_stmt(version_name)
         return self.session.execute(stmt).scalar_one_or_none()
 
     # ---- Chunks ----
-    def bulk_insert_chunks(self, chunks: list[Chunk]) -> None:
-        if chunks:
+    def bulk_insert_chunks(self, chunks: list[Chunk], method: str = "orm") -> None:
+        """Insert chunks via the ORM, or via binary COPY when ``method="copy"`` and the DB supports it."""
+        if not chunks:
+            return
+        if method == "copy" and copy_loader.supports_copy(self.session.get_bind()):
+            copy_loader.copy_chunks(self.session, chunks)
+        else:
             self.session.bulk_save_objects(chunks)
 
     def get_chunks_by_doc_and_version(self, doc_id: int, chunk_version_id: int) -> list[Chunk]:
-        stmt = (
-            select(Chunk)
-            .where(Chunk.doc_id == doc_id, Chunk.chunk_version_id == chunk_version_id)
-            .order_by(Chunk.order.asc())
-        )
+        stmt = queries.chunks_by_doc_and_version_stmt(doc_id, chunk_version_id)
         return list(self.session.execute(stmt).scalars().all())
 
     def get_chunk_version(self, version_name: str) -> ChunkVersion | None:
-        stmt = select(ChunkVersion).where(ChunkVersion.version_name == version_name)
+        stmt = queries.chunk_version_by_name_stmt(version_name)
         return self.session.execute(stmt).scalar_one_or_none()
 
     def get_chunk_version_by_name(self, version_name: str) -> ChunkVersion | None:
@@ -120,22 +112,40 @@ class Persistence:
         query_embedding: list[float],
         min_similarity: float,
         top_k: int,
-        chunk_version_name: str | None = None,
-    ) -> Chunk | None:
-        if not query_embedding:
+        chunk_version_id: int | None = None,
+        oversample: int = 1,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[tuple[Chunk, float]]:
+        """Return up to ``top_k`` `(chunk, similarity)` pairs at or above ``min_similarity``.
+
+        The index-ordered top ``top_k * oversample`` candidates are fetched first and the
+        threshold is applied afterwards, so the ANN index drives the scan.
+        """
+        if query_embedding is None or len(query_embedding) == 0:
             raise ValueError("query_embedding must be non-empty")
-        distance = Chunk.embedding.cosine_distance(query_embedding)
-        similarity = (1 - distance).label("similarity")
-
-        stmt = select(Chunk).where(Chunk.embedding.isnot(None), similarity >= min_similarity)
-        if chunk_version_name is not None:
-            stmt = (
-                stmt.join(ChunkVersion, Chunk.chunk_version_id == ChunkVersion.id)
-                .where(ChunkVersion.version_name == chunk_version_name)
-            )
-
-        stmt = stmt.order_by(distance.asc()).limit(top_k)
-        return self.session.execute(stmt).scalars()
+        for setting in queries.vector_search_settings_stmts(ef_search, probes):
+            self.session.execute(setting)
+        stmt = queries.most_similar_chunks_stmt(query_embedding, top_k * max(1, oversample), chunk_version_id)
+        return queries.filter_similar_chunks(self.session.execute(stmt).all(), min_similarity, top_k)
+
+    def get_most_similar_chunks_batch(
+        self,
+        query_embeddings,
+        min_similarity: float,
+        top_k: int,
+        chunk_version_id: int | None = None,
+        oversample: int = 1,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[list[tuple[Chunk, float]]]:
+        """Batched `get_most_similar_chunks`: one statement, results grouped per query embedding."""
+        if len(query_embeddings) == 0:
+            return []
+        for setting in queries.vector_search_settings_stmts(ef_search, probes):
+            self.session.execute(setting)
+        stmt = queries.most_similar_chunks_batch_stmt(query_embeddings, top_k * max(1, oversample), chunk_version_id)
+        return queries.group_similar_chunks(self.session.execute(stmt).all(), len(query_embeddings), min_similarity, top_k)
 
     # ---- Tx helpers ----
     def flush(self) -> None:
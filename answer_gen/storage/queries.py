@@ -0,0 +1,367 @@
+"""Statement builders shared by the sync and async persistence facades."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Sequence
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import and_, bindparam, cast, column, exists, func, not_, select, true, update, Select, Delete, Text, Update
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.orm import aliased, defer, selectinload
+
+from answer_gen.storage import (
+    EMBEDDING_DIM,
+    Document,
+    Chunk,
+    RFP,
+    Question,
+    Answer,
+    ChunkVersion,
+    AnswerVersion,
+    EmbeddingCacheEntry,
+    LlmResponseCacheEntry,
+    RfpRemoteFile,
+    RfpParseCacheEntry,
+    Job,
+    JobDocument,
+)
+from answer_gen.storage.job import JOB_QUEUED, JOB_RUNNING
+from answer_gen.storage.job_document import JOB_DOCUMENT_PENDING
+
+
+def documents_by_hashes_stmt(doc_hashes: list[str]) -> Select:
+    return select(Document).where(Document.hash.in_(doc_hashes))
+
+
+def most_recent_document_stmt() -> Select:
+    return select(Document).order_by(Document.uploaded_at.desc()).limit(1)
+
+
+def rfp_by_hash_stmt(doc_hash: str) -> Select:
+    return select(RFP).where(RFP.hash == doc_hash)
+
+
+def question_by_id_stmt(question_id: int) -> Select:
+    # Answers are loaded eagerly so callers never trigger a lazy load (not allowed under asyncio).
+    return (
+        select(Question)
+        .where(Question.id == question_id)
+        .options(selectinload(Question.answers))
+    )
+
+
+def questions_by_rfp_stmt(rfp_id: int) -> Select:
+    return select(Question).where(Question.rfp_id == rfp_id)
+
+
+def questions_with_answers_stmt(rfp_id: int) -> Select:
+    return (
+        select(Question)
+        .where(Question.rfp_id == rfp_id)
+        .options(selectinload(Question.answers))
+    )
+
+
+def delete_questions_not_in_stmt(rfp_id: int, keep_texts: list[str]) -> Delete:
+    if keep_texts:
+        return Question.__table__.delete().where(Question.rfp_id == rfp_id, ~Question.content.in_(keep_texts))
+    return Question.__table__.delete().where(Question.rfp_id == rfp_id)
+
+
+def rfp_remote_file_stmt(rfp_hash: str) -> Select:
+    return select(RfpRemoteFile).where(RfpRemoteFile.rfp_hash == rfp_hash)
+
+
+def stale_rfp_remote_files_stmt(expiring_before) -> Select:
+    """Remote files that expire before ``expiring_before`` and can no longer be safely reused."""
+    return select(RfpRemoteFile).where(RfpRemoteFile.expires_at.isnot(None), RfpRemoteFile.expires_at < expiring_before)
+
+
+def rfp_parse_cache_lookup_stmt(rfp_hash: str, prompt_version: str, model_name: str) -> Select:
+    return select(RfpParseCacheEntry.questions).where(
+        RfpParseCacheEntry.rfp_hash == rfp_hash,
+        RfpParseCacheEntry.prompt_version == prompt_version,
+        RfpParseCacheEntry.model_name == model_name,
+    )
+
+
+def answer_by_id_stmt(answer_id: int) -> Select:
+    return select(Answer).where(Answer.id == answer_id)
+
+
+def answer_version_by_name_stmt(version_name: str) -> Select:
+    return select(AnswerVersion).where(AnswerVersion.version_name == version_name)
+
+
+def chunks_by_doc_and_version_stmt(doc_id: int, chunk_version_id: int) -> Select:
+    return (
+        select(Chunk)
+        .where(Chunk.doc_id == doc_id, Chunk.chunk_version_id == chunk_version_id)
+        .order_by(Chunk.order.asc())
+    )
+
+
+def chunk_version_by_name_stmt(version_name: str) -> Select:
+    return select(ChunkVersion).where(ChunkVersion.version_name == version_name)
+
+
+def embedding_cache_lookup_stmt(model_name: str, normalize: bool, text_hashes: list[str]) -> Select:
+    return select(EmbeddingCacheEntry.text_hash, EmbeddingCacheEntry.embedding).where(
+        EmbeddingCacheEntry.model_name == model_name,
+        EmbeddingCacheEntry.normalize == normalize,
+        EmbeddingCacheEntry.text_hash.in_(text_hashes),
+    )
+
+
+def embedding_cache_insert_stmt(model_name: str, normalize: bool, entries: dict[str, list[float]]):
+    """Insert cache rows, leaving rows another worker already wrote untouched."""
+    rows = [
+        {"model_name": model_name, "normalize": normalize, "text_hash": text_hash, "embedding": embedding}
+        for text_hash, embedding in entries.items()
+    ]
+    return pg_insert(EmbeddingCacheEntry).values(rows).on_conflict_do_nothing()
+
+
+def llm_response_cache_lookup_stmt(fingerprint: str, fresh_after=None) -> Select:
+    stmt = select(LlmResponseCacheEntry.response_text).where(LlmResponseCacheEntry.fingerprint == fingerprint)
+    if fresh_after is not None:
+        stmt = stmt.where(LlmResponseCacheEntry.created_at >= fresh_after)
+    return stmt
+
+
+def llm_response_cache_upsert_stmt(fingerprint: str, model_name: str, response_text: str, now):
+    """Insert or refresh one cached response; the newest successful response wins."""
+    stmt = pg_insert(LlmResponseCacheEntry).values(
+        fingerprint=fingerprint, model_name=model_name, response_text=response_text, created_at=now
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[LlmResponseCacheEntry.fingerprint],
+        set_={"response_text": stmt.excluded.response_text, "created_at": stmt.excluded.created_at},
+    )
+
+
+def most_similar_chunks_stmt(
+    query_embedding: list[float],
+    limit: int,
+    chunk_version_id: int | None = None,
+) -> Select:
+    """Index-ordered nearest chunks as `(Chunk, similarity)` rows.
+
+    The similarity threshold is deliberately *not* part of the WHERE clause: a predicate on the
+    distance expression prevents an ordered ANN index scan, so callers post-filter instead.
+    """
+    distance = Chunk.embedding.cosine_distance(query_embedding)
+    similarity = (1 - distance).label("similarity")
+
+    stmt = select(Chunk, similarity).where(Chunk.embedding.isnot(None))
+    if chunk_version_id is not None:
+        # Rendered inline so the planner can match the per-version partial index at plan time.
+        stmt = stmt.where(Chunk.chunk_version_id == bindparam("chunk_version_id", int(chunk_version_id), literal_execute=True))
+
+    return stmt.order_by(distance.asc()).limit(limit)
+
+
+def filter_similar_chunks(rows, min_similarity: float, top_k: int) -> list[tuple[Chunk, float]]:
+    """Apply the similarity threshold to index-ordered rows and keep the best ``top_k``."""
+    return [(chunk, float(score)) for chunk, score in rows if score >= min_similarity][:top_k]
+
+
+def most_similar_chunks_batch_stmt(
+    query_embeddings,
+    limit: int,
+    chunk_version_id: int | None = None,
+) -> Select:
+    """Nearest chunks for many query vectors in one round trip, as `(query_index, Chunk, similarity)` rows.
+
+    The query vectors are unnested into a derived table and each one drives its own
+    index-ordered LATERAL top-``limit`` subquery. ``query_index`` is 1-based (WITH ORDINALITY).
+    """
+    query_vectors = _query_vectors(query_embeddings)
+
+    candidate = aliased(Chunk, name="candidate")
+    distance = candidate.embedding.cosine_distance(query_vectors.c.embedding)
+    nearest = select(candidate.id.label("chunk_id"), distance.label("distance")).where(candidate.embedding.isnot(None))
+    if chunk_version_id is not None:
+        nearest = nearest.where(
+            candidate.chunk_version_id == bindparam("chunk_version_id", int(chunk_version_id), literal_execute=True)
+        )
+    nearest = nearest.order_by(distance.asc()).limit(limit).lateral("nearest")
+
+    return (
+        select(query_vectors.c.query_index, Chunk, (1 - nearest.c.distance).label("similarity"))
+        .select_from(query_vectors)
+        .join(nearest, true())
+        .join(Chunk, Chunk.id == nearest.c.chunk_id)
+        .order_by(query_vectors.c.query_index, nearest.c.distance)
+    )
+
+
+def group_similar_chunks(rows, query_count: int, min_similarity: float, top_k: int) -> list[list[tuple[Chunk, float]]]:
+    """Split batch rows back into one post-filtered result list per query vector."""
+    grouped = defaultdict(list)
+    for query_index, chunk, score in rows:
+        grouped[int(query_index) - 1].append((chunk, score))
+    return [filter_similar_chunks(grouped[i], min_similarity, top_k) for i in range(query_count)]
+
+
+def corpus_stamp_stmt(chunk_version_id: int | None = None) -> Select:
+    """Chunk count and newest chunk id; adding or deleting a document changes at least one."""
+    stmt = select(func.count(Chunk.id), func.max(Chunk.id))
+    if chunk_version_id is not None:
+        stmt = stmt.where(Chunk.chunk_version_id == chunk_version_id)
+    return stmt
+
+
+def similar_answers_batch_stmt(
+    query_embeddings,
+    limit: int,
+    chunk_version_id: int | None,
+    corpus_stamp: str,
+    exclude_question_ids: Sequence[int] = (),
+    exclude_content_prefix: str | None = None,
+) -> Select:
+    """Answers of the nearest prior questions per query vector, as `(query_index, Answer, similarity)` rows.
+
+    Each query vector drives an index-ordered LATERAL top-``limit`` scan over `questions.embedding`
+    that only admits questions with a reusable answer: grounded on the same chunk version and corpus
+    stamp, and not starting with ``exclude_content_prefix``. The querying questions themselves
+    (``exclude_question_ids``) never take a candidate slot.
+    """
+    query_vectors = _query_vectors(query_embeddings)
+
+    def reusable(answer):
+        conditions = [answer.chunk_version_id.is_not_distinct_from(chunk_version_id), answer.corpus_stamp == corpus_stamp]
+        if exclude_content_prefix:
+            conditions.append(not_(answer.content.startswith(exclude_content_prefix, autoescape=True)))
+        return and_(*conditions)
+
+    candidate = aliased(Question, name="candidate")
+    prior = aliased(Answer, name="prior")
+    distance = candidate.embedding.cosine_distance(query_vectors.c.embedding)
+    nearest = (
+        select(candidate.id.label("question_id"), distance.label("distance"))
+        .where(
+            candidate.embedding.isnot(None),
+            exists().where(prior.question_id == candidate.id, reusable(prior)),
+        )
+        .order_by(distance.asc())
+        .limit(limit)
+    )
+    if exclude_question_ids:
+        nearest = nearest.where(candidate.id.notin_(list(exclude_question_ids)))
+    nearest = nearest.lateral("nearest")
+
+    return (
+        select(query_vectors.c.query_index, Answer, (1 - nearest.c.distance).label("similarity"))
+        .select_from(query_vectors)
+        .join(nearest, true())
+        .join(Answer, Answer.question_id == nearest.c.question_id)
+        .where(reusable(Answer))
+        .order_by(query_vectors.c.query_index, nearest.c.distance, Answer.id)
+    )
+
+
+def group_similar_answers(rows, query_count: int, min_similarity: float) -> list[tuple[Answer, float] | None]:
+    """Best answer at or above ``min_similarity`` for each query vector, or None."""
+    best: list[tuple[Answer, float] | None] = [None] * query_count
+    for query_index, answer, score in rows:
+        index = int(query_index) - 1
+        if best[index] is None and score >= min_similarity:
+            best[index] = (answer, float(score))
+    return best
+
+
+def _query_vectors(query_embeddings):
+    """Unnest query vectors into a `(embedding, query_index)` derived table; ``query_index`` is 1-based."""
+    vectors = cast(
+        bindparam("query_embeddings", [_vector_literal(e) for e in query_embeddings], type_=ARRAY(Text)),
+        ARRAY(Vector(EMBEDDING_DIM)),
+    )
+    return (
+        func.unnest(vectors)
+        .table_valued(column("embedding", Vector(EMBEDDING_DIM)), with_ordinality="query_index")
+        .render_derived(name="query_vectors")
+    )
+
+
+def _vector_literal(embedding) -> str:
+    """Render one embedding in pgvector's text input format."""
+    return "[" + ",".join(str(float(v)) for v in embedding) + "]"
+
+
+def vector_search_settings_stmts(ef_search: int | None = None, probes: int | None = None) -> list[Select]:
+    """Transaction-local pgvector search knobs (`SET LOCAL` cannot take bind parameters)."""
+    stmts = []
+    if ef_search:
+        stmts.append(select(func.set_config("hnsw.ef_search", str(int(ef_search)), True)))
+    if probes:
+        stmts.append(select(func.set_config("ivfflat.probes", str(int(probes)), True)))
+    return stmts
+
+
+# ---- Jobs ----
+def claim_job_stmt(kinds: list[str]) -> Select:
+    """Oldest queued job of the given kinds, locked so concurrent runners never claim the same row."""
+    return (
+        select(Job)
+        .where(Job.status == JOB_QUEUED, Job.kind.in_(kinds))
+        .order_by(Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def requeue_stale_jobs_stmt(kinds: list[str], stale_before) -> Update:
+    """Return running jobs whose runner stopped heartbeating (e.g. a restart) to the queue."""
+    return (
+        update(Job)
+        .where(Job.status == JOB_RUNNING, Job.kind.in_(kinds), Job.heartbeat_at < stale_before)
+        .values(status=JOB_QUEUED)
+    )
+
+
+def job_by_id_stmt(job_id: int) -> Select:
+    return (
+        select(Job)
+        .where(Job.id == job_id)
+        .options(selectinload(Job.documents).options(defer(JobDocument.content)))
+    )
+
+
+def job_heartbeat_stmt(job_id: int, now) -> Update:
+    return update(Job).where(Job.id == job_id).values(heartbeat_at=now)
+
+
+def job_progress_stmt(job_id: int, now, done: int = 0, failed: int = 0, chunks: int = 0) -> Update:
+    """Increment progress counters in place so concurrent readers always see consistent totals."""
+    return (
+        update(Job)
+        .where(Job.id == job_id)
+        .values(
+            items_done=Job.items_done + done,
+            items_failed=Job.items_failed + failed,
+            chunks_done=Job.chunks_done + chunks,
+            heartbeat_at=now,
+        )
+    )
+
+
+def job_total_stmt(job_id: int, total_items: int) -> Update:
+    return update(Job).where(Job.id == job_id).values(total_items=total_items)
+
+
+def job_result_stmt(job_id: int, result: dict | None) -> Update:
+    return update(Job).where(Job.id == job_id).values(result=result)
+
+
+def pending_job_document_ids_stmt(job_id: int) -> Select:
+    return (
+        select(JobDocument.id)
+        .where(JobDocument.job_id == job_id, JobDocument.status == JOB_DOCUMENT_PENDING)
+        .order_by(JobDocument.id)
+    )
+
+
+def job_document_by_id_stmt(job_document_id: int) -> Select:
+    return select(JobDocument).where(JobDocument.id == job_document_id)
@@ -1,7 +1,8 @@
+from pgvector.sqlalchemy import Vector
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func, UniqueConstraint
 from sqlalchemy.orm import relationship
 
-from . import Base
+from . import Base, EMBEDDING_DIM
 
 
 class Question(Base):
@@ -14,6 +15,8 @@ class Question(Base):
     content = Column(String(600), nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     rfp_id = Column(Integer, ForeignKey("rfps.id"), nullable=False)
+    # Filled at parse time when `[question_parsing] embed_questions` is on; answering reuses it.
+    embedding = Column(Vector(EMBEDDING_DIM), nullable=True)
 
     rfp = relationship("RFP", back_populates="questions")
     answers = relationship("Answer", back_populates="question", cascade="all, delete-orphan")
@@ -0,0 +1,18 @@
+from sqlalchemy import JSON, Column, DateTime, String, func
+
+from . import Base
+
+
+class RfpParseCacheEntry(Base):
+    """Raw question list parsed from one RFP by one parsing prompt version and model."""
+
+    __tablename__ = "rfp_parse_cache"
+
+    rfp_hash = Column(String(32), primary_key=True)
+    prompt_version = Column(String(16), primary_key=True)
+    model_name = Column(String(255), primary_key=True)
+    questions = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<RfpParseCacheEntry rfp_hash={self.rfp_hash} prompt_version={self.prompt_version} model={self.model_name!r}>"
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, DateTime, String, func
+
+from . import Base
+
+
+class RfpRemoteFile(Base):
+    """Provider file id of an uploaded RFP, reused by later parses of the same bytes."""
+
+    __tablename__ = "rfp_remote_files"
+
+    rfp_hash = Column(String(32), primary_key=True)
+    file_id = Column(String(255), nullable=False)
+    uploaded_at = Column(DateTime, nullable=False, server_default=func.now())
+    # None when the provider keeps the file until it is deleted.
+    expires_at = Column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<RfpRemoteFile rfp_hash={self.rfp_hash} file_id={self.file_id!r}>"
@@ -0,0 +1,128 @@
+"""Manage pgvector ANN indexes on chunk embeddings (one partial index per chunk version) and question embeddings."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+from dotenv import load_dotenv
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+
+from answer_gen.storage import ChunkVersion, EMBEDDING_DIM
+from answer_gen.storage.db import build_engine
+from answer_gen.utils.config.vector_index_config import VectorIndexConfig
+
+logger = logging.getLogger(__name__)
+
+_INDEX_METHODS = ("hnsw", "ivfflat")
+
+
+def chunk_index_name(method: str, chunk_version_id: int) -> str:
+    """Name of the partial ANN index covering one chunk version."""
+    return f"ix_chunks_embedding_{method}_v{int(chunk_version_id)}"
+
+
+def ensure_embedding_dimension(conn: Connection, dim: int = EMBEDDING_DIM) -> None:
+    """Pin `chunks.embedding` to a fixed width; pgvector cannot index an untyped `vector` column."""
+    current = conn.execute(
+        text(
+            "SELECT format_type(a.atttypid, a.atttypmod) FROM pg_attribute a "
+            "WHERE a.attrelid = 'chunks'::regclass AND a.attname = 'embedding'"
+        )
+    ).scalar_one_or_none()
+
+    expected = f"vector({int(dim)})"
+    if current is None or current == expected:
+        return
+
+    logger.info("Altering chunks.embedding type from=%s to=%s", current, expected)
+    conn.execute(text(f"ALTER TABLE chunks ALTER COLUMN embedding TYPE {expected}"))
+
+
+def question_index_name(method: str) -> str:
+    """Name of the ANN index over question embeddings (semantic answer cache lookups)."""
+    return f"ix_questions_embedding_{method}"
+
+
+def _index_params(config: VectorIndexConfig) -> str:
+    if config.index_method == "hnsw":
+        return f"m = {int(config.hnsw_m)}, ef_construction = {int(config.hnsw_ef_construction)}"
+    # IVFFlat centroids are trained on existing rows; rebuild after large ingestions.
+    return f"lists = {int(config.ivfflat_lists)}"
+
+
+def create_question_embedding_index(conn: Connection, config: VectorIndexConfig) -> str:
+    """Create the configured ANN index on `questions.embedding` and drop the other method's index."""
+    name = question_index_name(config.index_method)
+    conn.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS {name} ON questions "
+            f"USING {config.index_method} (embedding vector_cosine_ops) WITH ({_index_params(config)}) "
+            f"WHERE embedding IS NOT NULL"
+        )
+    )
+
+    for method in _INDEX_METHODS:
+        if method != config.index_method:
+            conn.execute(text(f"DROP INDEX IF EXISTS {question_index_name(method)}"))
+
+    logger.info("Ensured question embedding index name=%s", name)
+    return name
+
+
+def create_chunk_embedding_index(conn: Connection, config: VectorIndexConfig, chunk_version_id: int) -> str:
+    """Create the configured ANN index for one chunk version and drop the other method's index."""
+    name = chunk_index_name(config.index_method, chunk_version_id)
+    conn.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS {name} ON chunks "
+            f"USING {config.index_method} (embedding vector_cosine_ops) WITH ({_index_params(config)}) "
+            f"WHERE chunk_version_id = {int(chunk_version_id)} AND embedding IS NOT NULL"
+        )
+    )
+
+    for method in _INDEX_METHODS:
+        if method != config.index_method:
+            conn.execute(text(f"DROP INDEX IF EXISTS {chunk_index_name(method, chunk_version_id)}"))
+
+    logger.info("Ensured chunk embedding index name=%s", name)
+    return name
+
+
+def build_chunk_embedding_indexes(conn: Connection, config: VectorIndexConfig) -> list[str]:
+    """Ensure the column width, one ANN index per known chunk version and the question index.
+
+    Columns added since a table was created are migrated by `answer_gen.storage.db` beforehand.
+    """
+    ensure_embedding_dimension(conn)
+    version_ids = conn.execute(select(ChunkVersion.id)).scalars().all()
+    names = [create_chunk_embedding_index(conn, config, version_id) for version_id in version_ids]
+    return names + [create_question_embedding_index(conn, config)]
+
+
+def main(argv: list[str]) -> int:
+    load_dotenv()
+
+    if len(argv) < 2:
+        print("Usage: python -m answer_gen.storage.vector_index <config_path> <db_url> ")
+        return 2
+
+    config_path = argv[1]
+    db_url = argv[2] if len(argv) >= 3 else os.getenv("DATABASE_URL")
+    if not db_url:
+        raise RuntimeError('No database URL provided.')
+
+    config = VectorIndexConfig.from_config(config_path)
+    engine = build_engine(db_url)
+    with engine.begin() as conn:
+        names = build_chunk_embedding_indexes(conn, config)
+    engine.dispose()
+
+    print(f"Ensured {len(names)} embedding index(es): {', '.join(names) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
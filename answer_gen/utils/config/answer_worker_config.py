@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from answer_gen.utils.config.config_utils import read_config, get_config_str, get_config_int, get_config_float
+from answer_gen.utils.config.config_utils import read_config, get_config_str, get_config_int, get_config_float, get_config_bool
 
 @dataclass(frozen=True, slots=True)
 class AnswerWorkerConfig:
@@ -16,6 +16,14 @@ class AnswerWorkerConfig:
     top_k: int
     chunk_version_name: str | None
     answer_version_name: str | None
+    ef_search: int | None = None
+    probes: int | None = None
+    retrieval_oversample: int = 1
+    embedding_batch_window_ms: float = 5.0
+    max_context_tokens: int = 3000
+    # None disables reuse of answers from near-duplicate questions (semantic answer cache).
+    semantic_cache_min_similarity: float | None = None
+    semantic_cache_candidates: int = 5
 
     @classmethod
     def from_config(cls) -> "AnswerWorkerConfig":
@@ -23,13 +31,22 @@ class AnswerWorkerConfig:
         embedding_model = get_config_str("embedding", "embedding_model", "sentence-transformers/all-MiniLM-L6-v2")
         embedding_batch_size = get_config_int("embedding", "embedding_batch_size", fallback=32)
         min_similarity = get_config_float("embedding", "min_similarity", fallback=0.5)
+        embedding_batch_window_ms = get_config_float("embedding", "embedding_batch_window_ms", fallback=5.0)
 
         top_k = get_config_int("database", "top_k_similar", fallback=3)
+        retrieval_oversample = get_config_int("database", "retrieval_oversample", fallback=1)
         chunk_version_name = get_config_str("chunking", "chunking_version", "v1")
 
         answer_prompt_path = get_config_str("answers", "answer_prompt_path", "config/answer_prompt.txt")
         answer_model = get_config_str("answers", "answer_model", "gpt-4o-mini")
         answer_version_name = get_config_str("answers", "answer_version", "v1")
+        max_context_tokens = get_config_int("answers", "max_context_tokens", fallback=3000)
+        semantic_cache = get_config_bool("answers", "semantic_cache", fallback=False)
+        semantic_cache_min_similarity = get_config_float("answers", "semantic_cache_min_similarity", fallback=0.92)
+        semantic_cache_candidates = get_config_int("answers", "semantic_cache_candidates", fallback=5)
+
+        ef_search = get_config_int("vector_index", "ef_search", fallback=0) or None
+        probes = get_config_int("vector_index", "probes", fallback=0) or None
 
         return cls(
             embedding_model=embedding_model,
@@ -40,6 +57,13 @@ class AnswerWorkerConfig:
             top_k=top_k,
             chunk_version_name=chunk_version_name,
             answer_version_name=answer_version_name,
+            ef_search=ef_search,
+            probes=probes,
+            retrieval_oversample=retrieval_oversample,
+            embedding_batch_window_ms=embedding_batch_window_ms,
+            max_context_tokens=max_context_tokens,
+            semantic_cache_min_similarity=semantic_cache_min_similarity if semantic_cache else None,
+            semantic_cache_candidates=semantic_cache_candidates,
         )
 
 
@@ -47,11 +71,32 @@ class AnswerWorkerConfig:
 class BulkAnswerWorkerConfig(AnswerWorkerConfig):
     """Answer worker config variant that uses the bulk-answer prompt path."""
 
+    bulk_shard_size: int = 8
+    bulk_max_input_tokens: int = 24000
+    bulk_max_output_tokens: int = 8000
+    bulk_output_tokens_per_answer: int = 300
+    bulk_concurrency: int = 4
+    # Stream each shard's completion and persist answers as their JSON objects close.
+    bulk_streaming: bool = False
+    # Bulk jobs submit their shards as one Batch API batch and poll until it finishes.
+    bulk_batch_mode: bool = False
+    bulk_batch_poll_interval_seconds: float = 60.0
+    bulk_batch_max_wait_seconds: float = 90000.0
+
     @classmethod
     def from_config(cls) -> "BulkAnswerWorkerConfig":
         """Build bulk answer config from base answer config plus bulk prompt override."""
         base = AnswerWorkerConfig.from_config()
         bulk_prompt = get_config_str("answers", "bulk_answer_prompt", "config/bulk_answer_prompt.txt")
+        bulk_shard_size = get_config_int("answers", "bulk_shard_size", fallback=8)
+        bulk_max_input_tokens = get_config_int("answers", "bulk_max_input_tokens", fallback=24000)
+        bulk_max_output_tokens = get_config_int("answers", "bulk_max_output_tokens", fallback=8000)
+        bulk_output_tokens_per_answer = get_config_int("answers", "bulk_output_tokens_per_answer", fallback=300)
+        bulk_concurrency = get_config_int("answers", "bulk_concurrency", fallback=4)
+        bulk_streaming = get_config_bool("answers", "bulk_streaming", fallback=False)
+        bulk_batch_mode = get_config_bool("answers", "bulk_batch_mode", fallback=False)
+        bulk_batch_poll_interval_seconds = get_config_float("answers", "bulk_batch_poll_interval_seconds", fallback=60.0)
+        bulk_batch_max_wait_seconds = get_config_float("answers", "bulk_batch_max_wait_seconds", fallback=90000.0)
         return cls(
             embedding_model=base.embedding_model,
             embedding_batch_size=base.embedding_batch_size,
@@ -61,4 +106,20 @@ class BulkAnswerWorkerConfig(AnswerWorkerConfig):
             top_k=base.top_k,
             chunk_version_name=base.chunk_version_name,
             answer_version_name=base.answer_version_name,
+            ef_search=base.ef_search,
+            probes=base.probes,
+            retrieval_oversample=base.retrieval_oversample,
+            embedding_batch_window_ms=base.embedding_batch_window_ms,
+            max_context_tokens=base.max_context_tokens,
+            semantic_cache_min_similarity=base.semantic_cache_min_similarity,
+            semantic_cache_candidates=base.semantic_cache_candidates,
+            bulk_shard_size=bulk_shard_size,
+            bulk_max_input_tokens=bulk_max_input_tokens,
+            bulk_max_output_tokens=bulk_max_output_tokens,
+            bulk_output_tokens_per_answer=bulk_output_tokens_per_answer,
+            bulk_concurrency=bulk_concurrency,
+            bulk_streaming=bulk_streaming,
+            bulk_batch_mode=bulk_batch_mode,
+            bulk_batch_poll_interval_seconds=bulk_batch_poll_interval_seconds,
+            bulk_batch_max_wait_seconds=bulk_batch_max_wait_seconds,
         )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import (
+    read_config,
+    get_config_bool,
+    get_config_int,
+    get_config_float,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CallPolicyConfig:
+    """Typed configuration container for LLM request deadlines, retry budgets and hedging."""
+
+    request_timeout_seconds: float = 120.0
+    bulk_request_timeout_seconds: float = 900.0
+    extraction_request_timeout_seconds: float = 900.0
+    request_max_retries: int = 6
+    call_timeout_seconds: float = 60.0
+    hedge: bool = True
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "CallPolicyConfig":
+        """Build LLM call policy settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            request_timeout_seconds=get_config_float("generative", "request_timeout_seconds", fallback=120.0),
+            bulk_request_timeout_seconds=get_config_float("generative", "bulk_request_timeout_seconds", fallback=900.0),
+            extraction_request_timeout_seconds=get_config_float("generative", "extraction_request_timeout_seconds", fallback=900.0),
+            request_max_retries=get_config_int("generative", "request_max_retries", fallback=6),
+            call_timeout_seconds=get_config_float("generative", "llm_call_timeout_seconds", fallback=60.0),
+            hedge=get_config_bool("generative", "hedge_requests", fallback=True),
+            hedge_percentile=get_config_float("generative", "hedge_percentile", fallback=0.95),
+            hedge_min_samples=get_config_int("generative", "hedge_min_samples", fallback=20),
+        )
@@ -47,3 +47,9 @@ def get_config_float(section: str, key: str, fallback: float) -> float:
     """Fetch a config value and cast it to a float."""
     cfg = _ensure_loaded()
     return float(cfg.get(section, key, fallback=fallback))
+
+
+def get_config_bool(section: str, key: str, fallback: bool) -> bool:
+    """Fetch a config value and interpret it as a boolean flag."""
+    cfg = _ensure_loaded()
+    return cfg.getboolean(section, key, fallback=fallback)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import read_config, get_config_int, get_config_bool
+
+
+@dataclass(frozen=True, slots=True)
+class DatabasePoolConfig:
+    """Typed configuration container for the shared SQLAlchemy connection pool."""
+
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    pool_timeout: int = 30
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "DatabasePoolConfig":
+        """Build connection pool settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            pool_size=get_config_int("database", "pool_size", fallback=10),
+            max_overflow=get_config_int("database", "pool_max_overflow", fallback=10),
+            pool_pre_ping=get_config_bool("database", "pool_pre_ping", fallback=True),
+            pool_recycle=get_config_int("database", "pool_recycle_seconds", fallback=1800),
+            pool_timeout=get_config_int("database", "pool_timeout_seconds", fallback=30),
+        )
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from answer_gen.utils.config.config_utils import read_config, get_config_str, get_config_int
+from answer_gen.utils.config.config_utils import (
+    read_config,
+    get_config_str,
+    get_config_int,
+    get_config_float,
+    get_config_bool,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,7 +20,19 @@ class DocumentIngestorConfig:
     chunk_overlap: int
     chunk_token_model_name: str
     chunk_version_name: str
-    embed_buffer_size: int | None
+    embed_buffer_size: int | None = None
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_batch_size: int = 32
+    embedding_batch_window_ms: float = 5.0
+    ingestion_workers: int = 0
+    pages_per_task: int = 16
+    chunk_insert_method: str = "orm"
+    streaming_ingestion: bool = False
+    memory_budget_bytes: int = 256 * 1024 * 1024
+
+    def __post_init__(self):
+        if self.chunk_insert_method not in ("orm", "copy"):
+            raise ValueError(f"Unsupported chunk insert method {self.chunk_insert_method!r}; expected 'orm' or 'copy'")
 
     @classmethod
     def from_config(cls, config_path: str = "config/global.ini") -> "DocumentIngestorConfig":
@@ -29,4 +47,12 @@ class DocumentIngestorConfig:
             chunk_token_model_name=get_config_str("chunking", "chunk_token_model_name", "gpt-4"),
             chunk_version_name=get_config_str("chunking", "chunking_version", "v1"),
             embed_buffer_size=get_config_int("chunking", "embed_buffer_size", fallback=512),
+            embedding_model=get_config_str("embedding", "embedding_model", "sentence-transformers/all-MiniLM-L6-v2"),
+            embedding_batch_size=get_config_int("embedding", "embedding_batch_size", fallback=32),
+            embedding_batch_window_ms=get_config_float("embedding", "embedding_batch_window_ms", fallback=5.0),
+            ingestion_workers=get_config_int("documents", "ingestion_workers", fallback=0),
+            pages_per_task=get_config_int("documents", "pages_per_task", fallback=16),
+            chunk_insert_method=get_config_str("database", "chunk_insert_method", "orm").lower(),
+            streaming_ingestion=get_config_bool("documents", "streaming_ingestion", fallback=False),
+            memory_budget_bytes=get_config_int("documents", "ingestion_memory_budget_mb", fallback=256) * 1024 * 1024,
         )
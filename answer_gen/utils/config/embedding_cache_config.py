@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import read_config, get_config_int, get_config_bool
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingCacheConfig:
+    """Typed configuration container for the shared embedding cache."""
+
+    max_bytes: int = 64 * 1024 * 1024
+    persist: bool = True
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "EmbeddingCacheConfig":
+        """Build embedding cache settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            max_bytes=get_config_int("embedding", "embedding_cache_max_mb", fallback=64) * 1024 * 1024,
+            persist=get_config_bool("embedding", "embedding_cache_persist", fallback=True),
+        )
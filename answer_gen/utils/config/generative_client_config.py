@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import (
+    read_config,
+    get_config_str,
+    get_config_int,
+    get_config_float,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class GenerativeClientConfig:
+    """Which registered generative client backend the workers use."""
+
+    backend: str = "openai"
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "GenerativeClientConfig":
+        """Build generative client selection from the configured INI file."""
+        read_config(config_path)
+        return cls(backend=get_config_str("generative", "client", "openai").lower())
+
+
+@dataclass(frozen=True, slots=True)
+class LocalGenerativeConfig:
+    """Simulation settings for the local, offline generative client."""
+
+    latency_ms: float = 800.0
+    latency_sigma: float = 0.5
+    tail_probability: float = 0.0
+    tail_multiplier: float = 8.0
+    tokens_per_second: float = 80.0
+    rate_limit_rpm: int = 0
+    rate_limit_tpm: int = 0
+    malformed_rate: float = 0.0
+    questions_per_file: int = 25
+    batch_completion_seconds: float = 5.0
+    seed: int = 0
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "LocalGenerativeConfig":
+        """Build local generative client settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            latency_ms=get_config_float("local_generative", "latency_ms", fallback=800.0),
+            latency_sigma=get_config_float("local_generative", "latency_sigma", fallback=0.5),
+            tail_probability=get_config_float("local_generative", "tail_probability", fallback=0.0),
+            tail_multiplier=get_config_float("local_generative", "tail_multiplier", fallback=8.0),
+            tokens_per_second=get_config_float("local_generative", "tokens_per_second", fallback=80.0),
+            rate_limit_rpm=get_config_int("local_generative", "rate_limit_rpm", fallback=0),
+            rate_limit_tpm=get_config_int("local_generative", "rate_limit_tpm", fallback=0),
+            malformed_rate=get_config_float("local_generative", "malformed_rate", fallback=0.0),
+            questions_per_file=get_config_int("local_generative", "questions_per_file", fallback=25),
+            batch_completion_seconds=get_config_float("local_generative", "batch_completion_seconds", fallback=5.0),
+            seed=get_config_int("local_generative", "seed", fallback=0),
+        )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import read_config, get_config_int, get_config_float
+
+
+@dataclass(frozen=True, slots=True)
+class JobRunnerConfig:
+    """Typed configuration container for the Postgres-backed background job runner."""
+
+    workers: int = 2
+    poll_interval: float = 2.0
+    heartbeat_interval: float = 10.0
+    stale_after: float = 120.0
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "JobRunnerConfig":
+        """Build job runner settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            workers=get_config_int("jobs", "workers", fallback=2),
+            poll_interval=get_config_float("jobs", "poll_interval_seconds", fallback=2.0),
+            heartbeat_interval=get_config_float("jobs", "heartbeat_interval_seconds", fallback=10.0),
+            stale_after=get_config_float("jobs", "stale_after_seconds", fallback=120.0),
+        )
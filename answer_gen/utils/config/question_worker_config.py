@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from answer_gen.utils.config.config_utils import read_config, get_config_str
+from answer_gen.utils.config.config_utils import (
+    read_config,
+    get_config_str,
+    get_config_int,
+    get_config_float,
+    get_config_bool,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -11,6 +17,16 @@ class QuestionWorkerConfig:
 
     prompt_path: str
     model: str
+    embed_questions: bool = False
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_batch_size: int = 32
+    embedding_batch_window_ms: float = 5.0
+    parse_cache: bool = True
+    # Uploaded RFP files expire this long after upload (0 keeps them until cleanup deletes them).
+    remote_file_ttl_seconds: int = 7 * 24 * 3600
+    # A remote file this close to expiry is neither reused nor kept by the cleanup task.
+    remote_file_reuse_margin_seconds: int = 3600
+    remote_file_cleanup_interval_seconds: int = 3600
 
     @classmethod
     def from_config(cls, config_path: str = "config/global.ini") -> "QuestionWorkerConfig":
@@ -18,4 +34,15 @@ class QuestionWorkerConfig:
         read_config(config_path)
         prompt = get_config_str("question_parsing", "parsing_prompt_path", "")
         model = get_config_str("question_parsing", "model", "gpt-4o-mini")
-        return cls(prompt_path=prompt, model=model)
+        return cls(
+            prompt_path=prompt,
+            model=model,
+            embed_questions=get_config_bool("question_parsing", "embed_questions", fallback=False),
+            embedding_model=get_config_str("embedding", "embedding_model", "sentence-transformers/all-MiniLM-L6-v2"),
+            embedding_batch_size=get_config_int("embedding", "embedding_batch_size", fallback=32),
+            embedding_batch_window_ms=get_config_float("embedding", "embedding_batch_window_ms", fallback=5.0),
+            parse_cache=get_config_bool("question_parsing", "parse_cache", fallback=True),
+            remote_file_ttl_seconds=get_config_int("question_parsing", "remote_file_ttl_seconds", fallback=7 * 24 * 3600),
+            remote_file_reuse_margin_seconds=get_config_int("question_parsing", "remote_file_reuse_margin_seconds", fallback=3600),
+            remote_file_cleanup_interval_seconds=get_config_int("question_parsing", "remote_file_cleanup_interval_seconds", fallback=3600),
+        )
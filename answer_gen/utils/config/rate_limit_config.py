@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import (
+    read_config,
+    get_config_bool,
+    get_config_int,
+    get_config_float,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitConfig:
+    """Typed configuration container for the per-model LLM rate limiters."""
+
+    enabled: bool = True
+    initial_concurrency: int = 8
+    min_concurrency: int = 1
+    max_concurrency: int = 32
+    additive_increase: float = 1.0
+    decrease_factor: float = 0.5
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "RateLimitConfig":
+        """Build rate limiter settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            enabled=get_config_bool("generative", "rate_limit_enabled", fallback=True),
+            initial_concurrency=get_config_int("generative", "rate_limit_initial_concurrency", fallback=8),
+            min_concurrency=get_config_int("generative", "rate_limit_min_concurrency", fallback=1),
+            max_concurrency=get_config_int("generative", "rate_limit_max_concurrency", fallback=32),
+            additive_increase=get_config_float("generative", "rate_limit_additive_increase", fallback=1.0),
+            decrease_factor=get_config_float("generative", "rate_limit_decrease_factor", fallback=0.5),
+        )
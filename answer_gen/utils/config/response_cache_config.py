@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import read_config, get_config_str, get_config_int
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseCacheConfig:
+    """Typed configuration container for the shared LLM response cache."""
+
+    backend: str = "memory"
+    max_entries: int = 1024
+    ttl_seconds: int = 86400
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "ResponseCacheConfig":
+        """Build LLM response cache settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            backend=get_config_str("generative", "response_cache_backend", "memory").lower(),
+            max_entries=get_config_int("generative", "response_cache_max_entries", fallback=1024),
+            ttl_seconds=get_config_int("generative", "response_cache_ttl_seconds", fallback=86400),
+        )
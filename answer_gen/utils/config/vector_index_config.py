@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from answer_gen.utils.config.config_utils import read_config, get_config_str, get_config_int
+
+
+@dataclass(frozen=True, slots=True)
+class VectorIndexConfig:
+    """Typed configuration container for the pgvector ANN index on chunk embeddings."""
+
+    index_method: str = "hnsw"
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    ivfflat_lists: int = 100
+    ef_search: int | None = None
+    probes: int | None = None
+
+    def __post_init__(self):
+        if self.index_method not in ("hnsw", "ivfflat"):
+            raise ValueError(f"Unsupported vector index method {self.index_method!r}; expected 'hnsw' or 'ivfflat'")
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/global.ini") -> "VectorIndexConfig":
+        """Build vector index settings from the configured INI file."""
+        read_config(config_path)
+        return cls(
+            index_method=get_config_str("vector_index", "index_method", "hnsw").lower(),
+            hnsw_m=get_config_int("vector_index", "hnsw_m", fallback=16),
+            hnsw_ef_construction=get_config_int("vector_index", "hnsw_ef_construction", fallback=64),
+            ivfflat_lists=get_config_int("vector_index", "ivfflat_lists", fallback=100),
+            ef_search=get_config_int("vector_index", "ef_search", fallback=0) or None,
+            probes=get_config_int("vector_index", "probes", fallback=0) or None,
+        )
@@ -4,7 +4,7 @@ from hashlib import md5
 from answer_gen.exceptions import FileReadError
 from io import BytesIO
 
-def get_document_text(doc_content : BytesIO | bytes) -> Iterable[str]:
+def _read_pdf(doc_content : BytesIO | bytes):
     # Keep pypdf as a soft dependency for modules that only need hashing.
     from pypdf import PdfReader
 
@@ -12,13 +12,23 @@ def get_document_text(doc_content : BytesIO | bytes) -> Iterable[str]:
         doc_content = BytesIO(doc_content)
 
     try:
-        reader = PdfReader(doc_content)
+        return PdfReader(doc_content)
     except:
         raise FileReadError('Unable to read document content')
 
-    for i, page in enumerate(reader.pages):
+
+def get_document_text(doc_content : BytesIO | bytes, start : int = 0, stop : int | None = None) -> Iterable[str]:
+    """Yield `(page_number, text)` for pages ``start`` up to ``stop`` (all pages by default)."""
+    reader = _read_pdf(doc_content)
+    pages = reader.pages[start:stop]
+
+    for i, page in enumerate(pages, start=start):
         yield i, page.extract_text()
 
 
+def get_document_page_count(doc_content : BytesIO | bytes) -> int:
+    return len(_read_pdf(doc_content).pages)
+
+
 def get_document_hash(document : bytes) -> str:
     return md5(document).hexdigest()
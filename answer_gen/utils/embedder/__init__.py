@@ -0,0 +1,9 @@
+from .embedder import Embedder, DEFAULT_EMBEDDING_MODEL
+from .cache import EmbeddingCache
+from .registry import (
+    get_embedder,
+    get_embedder_stats,
+    clear_embedders,
+    init_embedding_cache,
+    get_embedding_cache_stats,
+)
@@ -0,0 +1,131 @@
+"""Dynamic micro-batching of embedding requests on a dedicated executor thread."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent `submit` calls into batches of up to ``batch_size`` texts.
+
+    The first queued request opens a window of ``max_wait_ms``; every request arriving
+    within it joins the same batch until ``batch_size`` texts are collected. ``encode_fn``
+    gets the batch's texts and, per text, whether its request allows caching. Batches run on
+    a single-thread executor (torch releases the GIL during inference), so the event loop
+    keeps serving other requests while the model is busy.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[Sequence[str], Sequence[bool]], Sequence],
+        batch_size: int,
+        max_wait_ms: float = 5.0,
+        executor: Executor | None = None,
+    ):
+        self._encode_fn = encode_fn
+        self._batch_size = max(1, batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedder")
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+        self._batches = 0
+        self._texts = 0
+        self._fill_ratio_total = 0.0
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
+        self._last_latency_ms = 0.0
+
+    async def submit(self, texts: Sequence[str], cache: bool = True) -> list:
+        """Queue ``texts`` for the next batch and return their embeddings in order."""
+        if not texts:
+            return []
+
+        self._ensure_running()
+        future = self._loop.create_future()
+        await self._queue.put((list(texts), cache, future))
+        return await future
+
+    def stats(self) -> dict:
+        """Queue depth, batch fill ratio and per-batch latency counters."""
+        batches = self._batches or 1
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "batches": self._batches,
+            "texts": self._texts,
+            "avg_batch_fill_ratio": round(self._fill_ratio_total / batches, 4),
+            "avg_batch_latency_ms": round(self._latency_total_ms / batches, 2),
+            "max_batch_latency_ms": round(self._latency_max_ms, 2),
+            "last_batch_latency_ms": round(self._last_latency_ms, 2),
+        }
+
+    def _ensure_running(self) -> None:
+        """Start the collector task on the current loop (restarting it if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._task = loop.create_task(self._collect())
+
+    async def _collect(self) -> None:
+        while True:
+            pending = [await self._queue.get()]
+            total = len(pending[0][0])
+            deadline = self._loop.time() + self._max_wait
+
+            while total < self._batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                total += len(item[0])
+
+            await self._dispatch(pending)
+
+    async def _dispatch(self, pending: list) -> None:
+        """Encode one coalesced batch off the event loop and fan results back out."""
+        texts = [text for request_texts, _, _ in pending for text in request_texts]
+        cacheable = [cache for request_texts, cache, _ in pending for _ in request_texts]
+        started = time.perf_counter()
+
+        try:
+            vectors = await self._loop.run_in_executor(self._executor, self._encode_fn, texts, cacheable)
+        except Exception as e:
+            logger.exception("Embedding batch failed size=%s", len(texts))
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._record(len(texts), latency_ms)
+
+        offset = 0
+        for request_texts, _, future in pending:
+            end = offset + len(request_texts)
+            if not future.done():
+                future.set_result(vectors[offset:end])
+            offset = end
+
+    def _record(self, size: int, latency_ms: float) -> None:
+        self._batches += 1
+        self._texts += size
+        self._fill_ratio_total += min(1.0, size / self._batch_size)
+        self._latency_total_ms += latency_ms
+        self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+        self._last_latency_ms = latency_ms
+        logger.debug("Encoded embedding batch size=%s latency_ms=%.2f", size, latency_ms)
@@ -0,0 +1,131 @@
+"""Embedding cache keyed by `(model_name, normalize, sha256(text))`.
+
+An in-process LRU bounded by bytes sits in front of the optional `embedding_cache` table,
+so identical texts (retried questions, re-uploaded RFPs, bulk re-runs) are embedded once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from threading import Lock
+from typing import Sequence
+
+import numpy as np
+
+from answer_gen.storage import queries
+from answer_gen.storage.db import build_connection
+
+logger = logging.getLogger(__name__)
+
+# Rough per-entry bookkeeping cost (key tuple, hash string, dict slot) on top of the vector.
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, db_url: str | None = None):
+        self._max_bytes = max(0, max_bytes)
+        self._db_url = db_url
+        self._entries: OrderedDict[tuple[str, bool, str], np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+        self._hits = 0
+        self._db_hits = 0
+        self._misses = 0
+
+    def get_many(self, model_name: str, normalize: bool, texts: Sequence[str]) -> list[np.ndarray | None]:
+        """Return the cached float32 vector for each text, or None where it is not cached."""
+        hashes = [text_hash(t) for t in texts]
+        found: dict[str, np.ndarray] = {}
+
+        with self._lock:
+            for h in hashes:
+                key = (model_name, normalize, h)
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[h] = vector
+            self._hits += sum(1 for h in hashes if h in found)
+
+        missing = [h for h in dict.fromkeys(hashes) if h not in found]
+        if missing and self._db_url:
+            from_db = self._load(model_name, normalize, missing)
+            for h, vector in from_db.items():
+                self._remember(model_name, normalize, h, vector)
+            found.update(from_db)
+            with self._lock:
+                self._db_hits += sum(1 for h in hashes if h in from_db)
+
+        with self._lock:
+            self._misses += sum(1 for h in hashes if h not in found)
+        return [found.get(h) for h in hashes]
+
+    def put_many(self, model_name: str, normalize: bool, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store freshly computed vectors in memory and, when configured, in Postgres."""
+        entries = {text_hash(t): v for t, v in zip(texts, vectors)}
+        for h, vector in entries.items():
+            self._remember(model_name, normalize, h, vector)
+        if entries and self._db_url:
+            self._store(model_name, normalize, entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._db_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "db_hits": self._db_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._hits + self._db_hits) / lookups, 4) if lookups else 0.0,
+                "persistent": bool(self._db_url),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remember(self, model_name: str, normalize: bool, h: str, vector: Sequence[float]) -> None:
+        # Own copy: a row view would keep the caller's whole batch array alive.
+        packed = np.array(vector, dtype=np.float32, copy=True)
+        packed.flags.writeable = False
+        size = packed.nbytes + _ENTRY_OVERHEAD_BYTES
+        if size > self._max_bytes:
+            return
+
+        key = (model_name, normalize, h)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes + _ENTRY_OVERHEAD_BYTES
+            self._entries[key] = packed
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes + _ENTRY_OVERHEAD_BYTES
+
+    def _load(self, model_name: str, normalize: bool, hashes: list[str]) -> dict[str, np.ndarray]:
+        try:
+            with build_connection(self._db_url) as session:
+                rows = session.execute(queries.embedding_cache_lookup_stmt(model_name, normalize, hashes)).all()
+        except Exception:
+            # The cache is an optimization; a lookup failure just means recomputing.
+            logger.warning("Embedding cache lookup failed model=%s count=%s", model_name, len(hashes), exc_info=True)
+            return {}
+        return {h: np.asarray(vector, dtype=np.float32) for h, vector in rows}
+
+    def _store(self, model_name: str, normalize: bool, entries: dict[str, np.ndarray]) -> None:
+        try:
+            with build_connection(self._db_url) as session:
+                session.execute(queries.embedding_cache_insert_stmt(model_name, normalize, entries))
+                session.commit()
+        except Exception:
+            logger.warning("Embedding cache write failed model=%s count=%s", model_name, len(entries), exc_info=True)
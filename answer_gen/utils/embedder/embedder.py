@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+from threading import Lock
+from typing import Iterable, Sequence, Tuple, Any, List
+
+import numpy as np
+
+from answer_gen.exceptions import EmbeddingError
+from answer_gen.utils.embedder.batcher import EmbeddingBatcher
+from answer_gen.utils.embedder.cache import EmbeddingCache
+from answer_gen.storage import EMBEDDING_DIM
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def resolve_device(device: str | None = None) -> str:
+    """Return the explicit device, or CUDA when available and CPU otherwise."""
+    if device:
+        return device
+    import torch  # type: ignore
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+class Embedder:
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        device: str | None = None,
+        batch_size: int = 32,
+        normalize: bool = True,
+        batch_window_ms: float = 5.0,
+        cache: EmbeddingCache | None = None,
+    ) -> None:
+        # Soft dependency: only import heavy ML deps when the embedder is constructed.
+        import torch  # type: ignore
+        from sentence_transformers import SentenceTransformer  # type: ignore
+
+        # Resolve device early to avoid surprising CPU fallback mid-flight.
+        resolved_device = resolve_device(device)
+        self._model = SentenceTransformer(model_name, device=resolved_device)
+
+        # The chunks.embedding column is fixed-width, so a mismatched model must fail fast.
+        dimension = self._model.get_sentence_embedding_dimension()
+        if dimension != EMBEDDING_DIM:
+            raise EmbeddingError(
+                f'Embedding model {model_name} produces {dimension}-d vectors but EMBEDDING_DIM is {EMBEDDING_DIM}.'
+            )
+        self._model_name = model_name
+        self._dimension = dimension
+        self._batch_size = batch_size
+        self._batch_window_ms = batch_window_ms
+        self._normalize = normalize
+        self._device = resolved_device
+        self._torch = torch
+        self._cache = cache
+        # One model instance is shared by every worker; serialize access to it.
+        self._lock = Lock()
+        self._batcher = EmbeddingBatcher(self._encode_batch, batch_size, max_wait_ms=batch_window_ms)
+        logger.info("Embedder initialized with model=%s device=%s", model_name, resolved_device)
+
+    def encode(self, texts: Sequence[str], cache: bool = True) -> np.ndarray:
+        """Embed ``texts`` into a contiguous ``(len(texts), dim)`` float32 array.
+
+        With a cache attached only the misses are run through the model. Pass ``cache=False``
+        for texts that will not repeat (document chunks) so they neither hit nor fill it.
+        """
+        return self._encode_batch(texts, [cache] * len(texts))
+
+    def _encode_batch(self, texts: Sequence[str], cacheable: Sequence[bool]) -> np.ndarray:
+        """Encode ``texts`` in one model call, consulting the cache only where ``cacheable``."""
+        if not texts:
+            return np.empty((0, self._dimension), dtype=np.float32)
+        if self._cache is None or not any(cacheable):
+            return self._encode_uncached(texts)
+
+        cached_rows = [i for i, allowed in enumerate(cacheable) if allowed]
+        cached = self._cache.get_many(self._model_name, self._normalize, [texts[i] for i in cached_rows])
+        vectors = np.empty((len(texts), self._dimension), dtype=np.float32)
+        missing = [i for i, allowed in enumerate(cacheable) if not allowed]
+        for i, vector in zip(cached_rows, cached):
+            if vector is None:
+                missing.append(i)
+            else:
+                vectors[i] = vector
+
+        if missing:
+            miss_texts = list(dict.fromkeys(texts[i] for i in missing))
+            computed = self._encode_uncached(miss_texts)
+            row_by_text = {text: row for row, text in enumerate(miss_texts)}
+            to_cache = list(dict.fromkeys(texts[i] for i in missing if cacheable[i]))
+            if to_cache:
+                self._cache.put_many(self._model_name, self._normalize, to_cache, computed[[row_by_text[t] for t in to_cache]])
+            for i in missing:
+                vectors[i] = computed[row_by_text[texts[i]]]
+        return vectors
+
+    def encode_as_lists(self, texts: Sequence[str]) -> List[List[float]]:
+        """Compatibility shim for callers that need plain Python lists."""
+        return self.encode(texts).tolist()
+
+    def _encode_uncached(self, texts: Sequence[str]) -> np.ndarray:
+        torch = self._torch
+        with self._lock, torch.inference_mode():
+            try:
+                embeddings = self._model.encode(
+                    list(texts),
+                    batch_size=self._batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=self._normalize,
+                    show_progress_bar=False,
+                )
+            except Exception as e:
+                raise EmbeddingError('An error occured while embedding text.')
+
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def device(self) -> str:
+        return self._device
+
+    @property
+    def normalize(self) -> bool:
+        return self._normalize
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def batch_window_ms(self) -> float:
+        return self._batch_window_ms
+
+    def memory_bytes(self) -> int:
+        """Approximate resident size of the model weights and buffers."""
+        tensors = list(self._model.parameters()) + list(self._model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+
+    async def aencode(self, texts: Sequence[str], cache: bool = True) -> np.ndarray:
+        """Encode off the event loop, coalescing with concurrent requests into shared batches."""
+        return await self._batcher.submit(texts, cache=cache)
+
+    def batching_stats(self) -> dict:
+        return self._batcher.stats()
+
+    def encode_with_ids(self, items: Iterable[Tuple[Any, str]]) -> List[Tuple[Any, np.ndarray]]:
+        ids: List[Any] = []
+        texts: List[str] = []
+        for item_id, text in items:
+            ids.append(item_id)
+            texts.append(text)
+        vectors = self.encode(texts)
+        return list(zip(ids, vectors))
+
+    def __call__(self, texts: Sequence[str]) -> List[List[float]]:
+        return self.encode_as_lists(texts)
@@ -0,0 +1,93 @@
+"""Process-wide registry so every worker shares one loaded embedding model."""
+
+from __future__ import annotations
+
+import logging
+from threading import Lock
+
+from answer_gen.utils.embedder.cache import EmbeddingCache
+from answer_gen.utils.embedder.embedder import Embedder, DEFAULT_EMBEDDING_MODEL, resolve_device
+
+logger = logging.getLogger(__name__)
+
+_EMBEDDERS: dict[tuple[str, str, bool], Embedder] = {}
+_REGISTRY_LOCK = Lock()
+_CACHE: EmbeddingCache | None = None
+
+
+def init_embedding_cache(max_bytes: int, db_url: str | None = None) -> EmbeddingCache:
+    """Create the process-wide embedding cache; embedders registered afterwards use it."""
+    global _CACHE
+    with _REGISTRY_LOCK:
+        if _CACHE is None:
+            _CACHE = EmbeddingCache(max_bytes, db_url=db_url)
+            logger.info("Initialized embedding cache max_bytes=%s persistent=%s", max_bytes, bool(db_url))
+        return _CACHE
+
+
+def get_embedding_cache_stats() -> dict | None:
+    """Hit-rate and size counters for the shared embedding cache, if one is configured."""
+    return _CACHE.stats() if _CACHE is not None else None
+
+
+def get_embedder(
+    model_name: str = DEFAULT_EMBEDDING_MODEL,
+    device: str | None = None,
+    batch_size: int = 32,
+    normalize: bool = True,
+    batch_window_ms: float = 5.0,
+) -> Embedder:
+    """Return the shared embedder for `(model_name, device, normalize)`, loading it on first use.
+
+    Batching settings come from the first caller; later callers asking for different ones are
+    warned, since they share the existing batcher.
+    """
+    key = (model_name, resolve_device(device), normalize)
+
+    with _REGISTRY_LOCK:
+        embedder = _EMBEDDERS.get(key)
+        if embedder is None:
+            embedder = Embedder(
+                model_name,
+                device=key[1],
+                batch_size=batch_size,
+                normalize=normalize,
+                batch_window_ms=batch_window_ms,
+                cache=_CACHE,
+            )
+            _EMBEDDERS[key] = embedder
+            logger.info("Registered shared embedder model=%s device=%s normalize=%s", *key)
+        elif (embedder.batch_size, embedder.batch_window_ms) != (batch_size, batch_window_ms):
+            logger.warning(
+                "Reusing embedder model=%s with batch_size=%s batch_window_ms=%s (requested %s, %s); "
+                "configure the same embedding batching for every worker",
+                model_name,
+                embedder.batch_size,
+                embedder.batch_window_ms,
+                batch_size,
+                batch_window_ms,
+            )
+    return embedder
+
+
+def get_embedder_stats() -> list[dict]:
+    """Describe every loaded embedder and the memory held by its weights."""
+    return [
+        {
+            "model_name": embedder.model_name,
+            "device": embedder.device,
+            "normalize": embedder.normalize,
+            "batch_size": embedder.batch_size,
+            "memory_bytes": embedder.memory_bytes(),
+            "batching": embedder.batching_stats(),
+        }
+        for embedder in list(_EMBEDDERS.values())
+    ]
+
+
+def clear_embedders() -> None:
+    """Drop all shared embedders so their weights can be garbage collected."""
+    global _CACHE
+    with _REGISTRY_LOCK:
+        _EMBEDDERS.clear()
+        _CACHE = None
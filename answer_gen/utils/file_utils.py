@@ -1,4 +1,7 @@
 import aiofiles
+from hashlib import md5
+
+UPLOAD_READ_BLOCK_BYTES = 1024 * 1024
 
 def is_pdf(file : bytes) -> bool:
     return file.startswith(b'%PDF')
@@ -6,3 +9,15 @@ def is_pdf(file : bytes) -> bool:
 async def read_file_async(filepath):
     async with aiofiles.open(filepath, 'r', encoding="utf-8") as f:
         return await f.read()
+
+async def hash_upload(upload, block_size : int = UPLOAD_READ_BLOCK_BYTES) -> tuple[str, bytes]:
+    """Stream a spooled upload once, returning its md5 and leading bytes without loading it whole."""
+    digest = md5()
+    header = b""
+    await upload.seek(0)
+    while block := await upload.read(block_size):
+        if not header:
+            header = block[:8]
+        digest.update(block)
+    await upload.seek(0)
+    return digest.hexdigest(), header
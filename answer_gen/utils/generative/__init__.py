@@ -1,2 +1,8 @@
 from .generative import generate_questions
-from .generative import generate_answers, generate_single_answer
+from .generative import generate_answers, generate_single_answer, stream_answers, submit_answer_batch
+from .response_cache import (
+    build_response_cache,
+    init_response_cache,
+    get_response_cache,
+    get_response_cache_stats,
+)
@@ -1 +1,20 @@
+from .base import GenerativeClient, BatchStatus
 from .openai_client import OpenAIClient
+from .local_client import LocalGenerativeClient
+from .rate_limiter import (
+    RequestPriority,
+    RateLimiterRegistry,
+    init_rate_limiters,
+    get_rate_limiter_stats,
+)
+from .call_policy import (
+    CallPolicy,
+    init_call_policy,
+    request_budget,
+    get_call_policy_stats,
+)
+from .registry import (
+    register_generative_client,
+    build_generative_client,
+    get_generative_client,
+)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Protocol, runtime_checkable
+
+from answer_gen.utils.generative.clients.rate_limiter import RequestPriority
+
+# Batch request lines target the Responses API, like the synchronous calls.
+BATCH_ENDPOINT = "/v1/responses"
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+@dataclass(frozen=True, slots=True)
+class BatchStatus:
+    """State of a submitted batch; ``outputs`` maps each finished request's custom id to its text."""
+
+    status: str
+    outputs: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in BATCH_TERMINAL_STATUSES
+
+
+@runtime_checkable
+class GenerativeClient(Protocol):
+    """What the workers need from an LLM backend; `OpenAIClient` and `LocalGenerativeClient` implement it."""
+
+    async def generate_text(self, model: str, prompt: str, retries: int = 3, hard_wait: int = 4,
+                            priority: RequestPriority = RequestPriority.INTERACTIVE) -> str:
+        """Return the complete text output for ``prompt``."""
+        ...
+
+    async def generate_text_with_file(self, model: str, prompt: str, file: bytes | None = None,
+                                      retries: int = 3, hard_wait: int = 4, file_id: str | None = None,
+                                      priority: RequestPriority = RequestPriority.INTERACTIVE) -> str:
+        """Return the text output for ``prompt`` over an attached (or previously uploaded) PDF."""
+        ...
+
+    def stream_text(self, model: str, prompt: str, retries: int = 3, hard_wait: int = 4,
+                    priority: RequestPriority = RequestPriority.INTERACTIVE) -> AsyncIterator[str]:
+        """Yield output text deltas as they are generated."""
+        ...
+
+    async def upload_file(self, file_bytes: bytes, expires_after_seconds: int | None = None) -> str:
+        """Upload a PDF for reuse across calls and return its file id."""
+        ...
+
+    async def delete_file(self, file_id: str) -> bool:
+        """Delete an uploaded file; False when it was already gone."""
+        ...
+
+    async def submit_batch(self, requests_jsonl: bytes) -> str:
+        """Submit Batch API request lines (one JSON object with a ``custom_id`` each) and return the batch id."""
+        ...
+
+    async def get_batch(self, batch_id: str) -> BatchStatus:
+        """Return the batch's status, with per-request outputs once it has finished."""
+        ...
+
+    async def cancel_batch(self, batch_id: str) -> bool:
+        """Stop a batch that is no longer wanted; False when it was already gone."""
+        ...
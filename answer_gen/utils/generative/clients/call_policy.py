@@ -0,0 +1,221 @@
+"""Per-request deadlines and retry budgets, and latency-based hedging of LLM calls.
+
+An API request opens a `request_budget`; every LLM call made while serving it (including calls
+in tasks it spawns) draws on the same deadline and retry allowance through a context variable.
+Hedging fires a duplicate call once the primary has run longer than the model's recent p95.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Awaitable, Callable, Iterator, TypeVar
+
+from answer_gen.exceptions import GenerativeDeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestBudget:
+    """Deadline and retry allowance shared by every LLM call serving one API request."""
+
+    def __init__(self, timeout_seconds: float | None = None, max_retries: int | None = None):
+        self.deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+        self._retries_left = max_retries
+
+    def remaining(self) -> float | None:
+        """Seconds until the deadline (never negative), or None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self) -> None:
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise GenerativeDeadlineExceeded("The request deadline passed before the LLM call completed.")
+
+    def take_retry(self) -> bool:
+        """Spend one retry; False once the request's retries are used up."""
+        if self._retries_left is None:
+            return True
+        if self._retries_left <= 0:
+            return False
+        self._retries_left -= 1
+        return True
+
+
+_BUDGET: ContextVar[RequestBudget | None] = ContextVar("llm_request_budget", default=None)
+
+
+def current_request_budget() -> RequestBudget | None:
+    return _BUDGET.get()
+
+
+@contextmanager
+def request_budget(timeout_seconds: float | None = None, max_retries: int | None = None) -> Iterator[RequestBudget]:
+    """Bound the LLM calls made inside this block; unset arguments fall back to the call policy."""
+    policy = get_call_policy()
+    if policy is not None:
+        timeout_seconds = timeout_seconds or policy.request_timeout_seconds
+        max_retries = policy.request_max_retries if max_retries is None else max_retries
+
+    budget = RequestBudget(timeout_seconds, max_retries)
+    token = _BUDGET.set(budget)
+    try:
+        yield budget
+    finally:
+        _BUDGET.reset(token)
+
+
+async def with_deadline(awaitable: Awaitable[T], budget: RequestBudget | None) -> T:
+    """Await ``awaitable``, raising `GenerativeDeadlineExceeded` if the budget's deadline passes first."""
+    if budget is None or budget.deadline is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout=budget.remaining())
+    except asyncio.TimeoutError:
+        raise GenerativeDeadlineExceeded("The request deadline passed before the LLM call completed.") from None
+
+
+class _LatencyWindow:
+    """Most recent successful call latencies for one model."""
+
+    def __init__(self, size: int):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float, min_samples: int) -> float | None:
+        if len(self._samples) < max(1, min_samples):
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class CallPolicy:
+    """Default request deadlines and retries, the per-call SDK timeout and hedging settings.
+
+    Bulk-answer and RFP-extraction requests get their own, longer deadlines.
+    """
+
+    def __init__(
+        self,
+        request_timeout_seconds: float | None = None,
+        request_max_retries: int | None = None,
+        call_timeout_seconds: float | None = None,
+        hedge: bool = False,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        latency_window: int = 200,
+        bulk_request_timeout_seconds: float | None = None,
+        extraction_request_timeout_seconds: float | None = None,
+    ):
+        self.request_timeout_seconds = request_timeout_seconds
+        self.bulk_request_timeout_seconds = bulk_request_timeout_seconds
+        self.extraction_request_timeout_seconds = extraction_request_timeout_seconds
+        self.request_max_retries = request_max_retries
+        self.call_timeout_seconds = call_timeout_seconds
+        self._hedge = hedge
+        self._hedge_percentile = hedge_percentile
+        self._hedge_min_samples = hedge_min_samples
+        self._latency_window = latency_window
+        self._windows: dict[str, _LatencyWindow] = {}
+        self._lock = Lock()
+        self._hedges = 0
+        self._hedges_won = 0
+
+    def record_latency(self, model: str, seconds: float) -> None:
+        with self._lock:
+            window = self._windows.get(model)
+            if window is None:
+                window = self._windows[model] = _LatencyWindow(self._latency_window)
+            window.record(seconds)
+
+    def hedge_delay(self, model: str | None) -> float | None:
+        """How long to wait before hedging a call to ``model``; None disables hedging for it."""
+        if not self._hedge or not model:
+            return None
+        with self._lock:
+            window = self._windows.get(model)
+            return window.percentile(self._hedge_percentile, self._hedge_min_samples) if window else None
+
+    async def hedged(self, model: str | None, make_call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``make_call``; past the hedge delay, race a duplicate and keep the first success."""
+        primary = asyncio.ensure_future(make_call())
+        delay = self.hedge_delay(model)
+        if delay is None:
+            return await primary
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            return primary.result()
+
+        logger.info("Hedging slow LLM call model=%s after_seconds=%.2f", model, delay)
+        hedge = asyncio.ensure_future(make_call())
+        with self._lock:
+            self._hedges += 1
+        result, winner = await _first_success([primary, hedge])
+        if winner is hedge:
+            with self._lock:
+                self._hedges_won += 1
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hedging": self._hedge,
+                "hedges": self._hedges,
+                "hedges_won": self._hedges_won,
+                "p95_latency_seconds": {
+                    model: window.percentile(0.95, 1) for model, window in self._windows.items()
+                },
+            }
+
+
+async def _first_success(tasks: list[asyncio.Future]) -> tuple[object, asyncio.Future]:
+    """Return the first successful task's result; raise the first error if every task fails."""
+    pending = set(tasks)
+    error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), task
+                error = error or task.exception()
+        raise error
+    finally:
+        # The loser (or every task, if the caller was cancelled) must not keep running.
+        for task in pending:
+            task.cancel()
+
+
+_POLICY: CallPolicy | None = None
+
+
+def init_call_policy(policy: CallPolicy | None) -> CallPolicy | None:
+    """Install the process-wide call policy used by every `OpenAIClient`."""
+    global _POLICY
+    _POLICY = policy
+    return _POLICY
+
+
+def get_call_policy() -> CallPolicy | None:
+    return _POLICY
+
+
+def get_call_policy_stats() -> dict | None:
+    """Hedge counters and recent p95 latency per model, if a call policy is installed."""
+    return _POLICY.stats() if _POLICY is not None else None
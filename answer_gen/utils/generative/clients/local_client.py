@@ -0,0 +1,284 @@
+"""Offline, deterministic stand-in for `OpenAIClient`, for load tests and benchmarks.
+
+Outputs are derived from a hash of the prompt (or uploaded file), so repeated runs see the same
+answers. Latency (log-normal with an optional slow tail), output token throughput, per-minute
+request/token limits and a malformed-output rate are simulated from `[local_generative]`. Calls go
+through the shared per-model rate limiters just like real ones, with ``x-ratelimit-*`` style feedback.
+Batches complete ``batch_completion_seconds`` after submission, outside those limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import random
+import re
+import time
+from collections import deque
+from contextlib import nullcontext
+from threading import Lock
+from typing import AsyncIterator
+
+from answer_gen.exceptions import GenerativeOutputError, GenerativeFileNotFound
+from answer_gen.utils.generative.clients.base import BatchStatus
+from answer_gen.utils.generative.clients.call_policy import current_request_budget, with_deadline
+from answer_gen.utils.generative.clients.rate_limiter import (
+    RequestPriority,
+    estimate_request_tokens,
+    get_rate_limiter,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bulk prompts embed `json.dumps` question items; template examples do not have a "question" key next.
+_QUESTION_ITEM = re.compile(r'"question_id":\s*(\d+),\s*"question":')
+_STREAM_CHUNK_CHARS = 16
+_WINDOW_SECONDS = 60.0
+
+
+class LocalGenerativeClient:
+    """Simulated LLM backend implementing `GenerativeClient` without any network access."""
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        latency_sigma: float = 0.5,
+        tail_probability: float = 0.0,
+        tail_multiplier: float = 8.0,
+        tokens_per_second: float = 80.0,
+        rate_limit_rpm: int = 0,
+        rate_limit_tpm: int = 0,
+        malformed_rate: float = 0.0,
+        questions_per_file: int = 25,
+        batch_completion_seconds: float = 5.0,
+        seed: int = 0,
+    ):
+        self._latency_ms = latency_ms
+        self._latency_sigma = latency_sigma
+        self._tail_probability = tail_probability
+        self._tail_multiplier = tail_multiplier
+        self._tokens_per_second = tokens_per_second
+        self._rate_limit_rpm = rate_limit_rpm
+        self._rate_limit_tpm = rate_limit_tpm
+        self._malformed_rate = malformed_rate
+        self._questions_per_file = questions_per_file
+        self._batch_completion_seconds = batch_completion_seconds
+        self._rng = random.Random(seed)
+
+        self._window: deque[tuple[float, int]] = deque()
+        self._files: dict[str, bytes] = {}
+        self._file_ids = itertools.count(1)
+        self._batches: dict[str, tuple[float, dict[str, str]]] = {}
+        self._batch_ids = itertools.count(1)
+        self._cancelled_batches: set[str] = set()
+        self._lock = Lock()
+        self._stats = {"calls": 0, "rate_limited": 0, "malformed": 0, "output_tokens": 0, "batches": 0, "batch_requests": 0}
+
+    @classmethod
+    def from_config(cls, config) -> "LocalGenerativeClient":
+        """Build from a `LocalGenerativeConfig`."""
+        return cls(
+            latency_ms=config.latency_ms,
+            latency_sigma=config.latency_sigma,
+            tail_probability=config.tail_probability,
+            tail_multiplier=config.tail_multiplier,
+            tokens_per_second=config.tokens_per_second,
+            rate_limit_rpm=config.rate_limit_rpm,
+            rate_limit_tpm=config.rate_limit_tpm,
+            malformed_rate=config.malformed_rate,
+            questions_per_file=config.questions_per_file,
+            batch_completion_seconds=config.batch_completion_seconds,
+            seed=config.seed,
+        )
+
+    async def generate_text(self, model : str, prompt : str, retries = 3, hard_wait = 4,
+                            priority : RequestPriority = RequestPriority.INTERACTIVE):
+        """Return a simulated answer payload for ``prompt`` once it has been fully "generated"."""
+        output = self._answers_output(model, prompt)
+        return await with_deadline(self._collect(model, prompt, output, retries, priority), current_request_budget())
+
+    async def stream_text(self, model : str, prompt : str, retries = 3, hard_wait = 4,
+                          priority : RequestPriority = RequestPriority.INTERACTIVE) -> AsyncIterator[str]:
+        """Yield a simulated answer payload in small deltas at the configured token throughput."""
+        output = self._answers_output(model, prompt)
+        budget = current_request_budget()
+        async for delta in self._generate(model, prompt, output, retries, priority, stream=True):
+            if budget is not None:
+                budget.check()
+            yield delta
+
+    async def generate_text_with_file(self, model : str, prompt : str, file : bytes | None = None, retries = 3, hard_wait = 4, file_id : str | None = None,
+                                      priority : RequestPriority = RequestPriority.INTERACTIVE):
+        """Return ``questions_per_file`` synthetic questions derived from the file's contents."""
+        if file_id is not None:
+            file = self._files.get(file_id)
+            if file is None:
+                raise GenerativeFileNotFound(f"Unknown local file id {file_id}")
+        output = self._questions_output(file or b"")
+        return await with_deadline(self._collect(model, prompt, output, retries, priority), current_request_budget())
+
+    async def upload_file(self, file_bytes: bytes, expires_after_seconds: int | None = None) -> str:
+        file_id = f"local-file-{next(self._file_ids)}"
+        self._files[file_id] = file_bytes
+        return file_id
+
+    async def delete_file(self, file_id: str) -> bool:
+        return self._files.pop(file_id, None) is not None
+
+    async def submit_batch(self, requests_jsonl: bytes) -> str:
+        """Accept Batch API request lines; every output is ready ``batch_completion_seconds`` later."""
+        outputs: dict[str, str] = {}
+        for line in requests_jsonl.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request["body"]
+            outputs[request["custom_id"]] = self._answers_output(body["model"], body["input"])
+
+        batch_id = f"local-batch-{next(self._batch_ids)}"
+        self._batches[batch_id] = (time.monotonic() + self._batch_completion_seconds, outputs)
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["batch_requests"] += len(outputs)
+        return batch_id
+
+    async def get_batch(self, batch_id: str) -> BatchStatus:
+        if batch_id in self._cancelled_batches:
+            return BatchStatus("cancelled")
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            # Like a batch OpenAI no longer has; local batches do not survive a restart.
+            return BatchStatus("expired")
+        ready_at, outputs = batch
+        if time.monotonic() < ready_at:
+            return BatchStatus("in_progress")
+        return BatchStatus("completed", outputs=dict(outputs))
+
+    async def cancel_batch(self, batch_id: str) -> bool:
+        if self._batches.pop(batch_id, None) is None:
+            return False
+        self._cancelled_batches.add(batch_id)
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    async def _collect(self, model, prompt, output, retries, priority) -> str:
+        return "".join([delta async for delta in self._generate(model, prompt, output, retries, priority, stream=False)])
+
+    async def _generate(self, model, prompt, output, retries, priority, stream):
+        """Admit one call against the simulated limits, then emit ``output`` at the simulated pace."""
+        limiter = get_rate_limiter(model)
+        cost = estimate_request_tokens(prompt) + estimate_request_tokens(output)
+
+        for attempt in range(1, retries + 1):
+            async with (limiter.slot(priority, cost) if limiter is not None else nullcontext()) as epoch:
+                retry_after = self._take_quota(cost)
+                if retry_after is None:
+                    if limiter is not None:
+                        limiter.on_success(self._headers())
+                    async for delta in self._emit(output, stream):
+                        yield delta
+                    return
+
+            with self._lock:
+                self._stats["rate_limited"] += 1
+            if limiter is not None:
+                limiter.on_rate_limited({"retry-after": f"{retry_after:.3f}"}, epoch)
+            if attempt >= retries:
+                break
+            logger.info("Local LLM rate limited model=%s retry_after=%.2f", model, retry_after)
+            await asyncio.sleep(retry_after)
+
+        raise GenerativeOutputError("Failed to complete local LLM request after retries.")
+
+    async def _emit(self, output: str, stream: bool):
+        output_tokens = estimate_request_tokens(output)
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["output_tokens"] += output_tokens
+            first_token = self._latency_ms / 1000 * self._rng.lognormvariate(0.0, self._latency_sigma)
+            if self._rng.random() < self._tail_probability:
+                first_token *= self._tail_multiplier
+
+        await asyncio.sleep(first_token)
+        seconds_per_token = 1 / self._tokens_per_second if self._tokens_per_second > 0 else 0.0
+        if not stream:
+            await asyncio.sleep(output_tokens * seconds_per_token)
+            yield output
+            return
+
+        chunk_delay = estimate_request_tokens(output[:_STREAM_CHUNK_CHARS]) * seconds_per_token
+        for start in range(0, len(output), _STREAM_CHUNK_CHARS):
+            yield output[start:start + _STREAM_CHUNK_CHARS]
+            await asyncio.sleep(chunk_delay)
+
+    def _take_quota(self, tokens: int) -> float | None:
+        """Record a request in the one-minute window, or return seconds until it would fit."""
+        with self._lock:
+            now = time.monotonic()
+            while self._window and now - self._window[0][0] >= _WINDOW_SECONDS:
+                self._window.popleft()
+
+            over_requests = self._rate_limit_rpm and len(self._window) >= self._rate_limit_rpm
+            used_tokens = sum(t for _at, t in self._window)
+            over_tokens = self._rate_limit_tpm and self._window and used_tokens + tokens > self._rate_limit_tpm
+            if over_requests or over_tokens:
+                return max(0.001, _WINDOW_SECONDS - (now - self._window[0][0]))
+
+            self._window.append((now, tokens))
+            return None
+
+    def _headers(self) -> dict[str, str]:
+        with self._lock:
+            headers: dict[str, str] = {}
+            if not self._window:
+                return headers
+            reset = f"{max(0.0, _WINDOW_SECONDS - (time.monotonic() - self._window[0][0])):.3f}s"
+            if self._rate_limit_rpm:
+                headers["x-ratelimit-remaining-requests"] = str(max(0, self._rate_limit_rpm - len(self._window)))
+                headers["x-ratelimit-reset-requests"] = reset
+            if self._rate_limit_tpm:
+                used_tokens = sum(t for _at, t in self._window)
+                headers["x-ratelimit-remaining-tokens"] = str(max(0, self._rate_limit_tpm - used_tokens))
+                headers["x-ratelimit-reset-tokens"] = reset
+            return headers
+
+    def _answers_output(self, model: str, prompt: str) -> str:
+        """One answer per bulk question item in the prompt, or a single answer for a single prompt."""
+        question_ids = list(dict.fromkeys(int(qid) for qid in _QUESTION_ITEM.findall(prompt)))
+        digest = hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+        answers = []
+        for question_id in question_ids or [None]:
+            answer = {
+                "answer": f"Simulated answer {digest[:12]} for question {question_id if question_id is not None else 'in prompt'}.",
+                "confidence": "medium",
+                "sources_used": [],
+                "coverage": "partial",
+                "notes": "Generated by the local generative client.",
+            }
+            if question_id is not None:
+                answer = {"question_id": question_id, **answer}
+            answers.append(answer)
+        return self._maybe_malformed(json.dumps(answers))
+
+    def _questions_output(self, file: bytes) -> str:
+        digest = hashlib.sha256(file).hexdigest()[:8]
+        questions = [
+            f"Question {i} of synthetic RFP {digest}: describe how you meet requirement {i}."
+            for i in range(1, self._questions_per_file + 1)
+        ]
+        return self._maybe_malformed(json.dumps({"questions": questions}))
+
+    def _maybe_malformed(self, text: str) -> str:
+        with self._lock:
+            if self._rng.random() >= self._malformed_rate:
+                return text
+            self._stats["malformed"] += 1
+        # Cut off mid-output, like a completion that hit its token limit.
+        return text[: max(1, len(text) * 2 // 3)]
@@ -1,14 +1,52 @@
 import openai
 import asyncio
+import json
 import random
 from io import BytesIO
 import uuid
 import logging
+import time
+from typing import AsyncIterator, Callable
 
-from answer_gen.exceptions import MissingGenerativeAction, GenerativeOutputError
+from answer_gen.exceptions import MissingGenerativeAction, GenerativeOutputError, GenerativeDeadlineExceeded, GenerativeFileNotFound
+from answer_gen.utils.generative.clients.base import BATCH_ENDPOINT, BatchStatus
+from answer_gen.utils.generative.clients.call_policy import current_request_budget, get_call_policy, with_deadline
+from answer_gen.utils.generative.clients.rate_limiter import (
+    RequestPriority,
+    estimate_request_tokens,
+    get_rate_limiter,
+)
 
 logger = logging.getLogger(__name__)
 
+
+def _is_missing_file_error(error: openai.APIStatusError, file_id: str) -> bool:
+    """True when OpenAI rejected a request because ``file_id`` is gone or unusable."""
+    if isinstance(error, openai.NotFoundError):
+        return True
+    return "file_id" in (getattr(error, "param", None) or "") or file_id in str(error)
+
+
+class _HeldStream:
+    """An open response stream that keeps its rate-limiter slot until it is closed."""
+
+    def __init__(self, stream, finish: Callable[[bool], None]):
+        self._stream = stream
+        self._finish = finish
+
+    def __aiter__(self):
+        return self._stream.__aiter__()
+
+    async def close(self, completed: bool = False) -> None:
+        """Close the stream and free its slot; ``completed`` streams count as successful calls."""
+        finish, self._finish = self._finish, None
+        try:
+            await self._stream.close()
+        finally:
+            if finish is not None:
+                finish(completed)
+
+
 class OpenAIClient:
     def __init__(self, api_key : str):
         """Create an async OpenAI client wrapper."""
@@ -20,22 +58,80 @@ class OpenAIClient:
                             hard_wait = 4,
                             max_wait = 60,
                             client = None,
-                            *args, **kwargs):
-        """Execute a retried OpenAI SDK `.create()` call with backoff."""
+                            *args,
+                            priority : RequestPriority = RequestPriority.INTERACTIVE,
+                            interactive : bool = False,
+                            **kwargs):
+        """Execute a retried OpenAI SDK `.create()` call with backoff.
+
+        Calls naming a model are admitted through that model's shared rate limiter at ``priority``.
+        Only ``interactive`` calls get the policy's short SDK timeout and may be hedged; uploads,
+        batches, file-backed extraction and bulk shards keep the SDK default and are never duplicated.
+        Retries and waits draw on the current request budget, if one is open.
+        """
         client = client or self._client
 
         if not hasattr(client, method):
             raise MissingGenerativeAction(self, method)
 
         resource = getattr(client, method)
+        model = kwargs.get("model")
+        limiter = get_rate_limiter(model)
+        policy = get_call_policy()
+        budget = current_request_budget()
+        estimated_tokens = estimate_request_tokens(kwargs.get("input")) if limiter is not None else 0
+        # A hedged duplicate stream would be left open, so streams are never hedged; they are
+        # returned holding their limiter slot until drained. Only hedgeable calls feed the
+        # latency window, so long streams and bulk shards do not skew the hedge threshold.
+        streaming = bool(kwargs.get("stream"))
+        hedge = interactive and not streaming
+        if interactive and policy is not None and policy.call_timeout_seconds:
+            kwargs.setdefault("timeout", policy.call_timeout_seconds)
         last_exc: Exception | None = None
 
+        async def _create_once():
+            epoch = await limiter.acquire(priority, estimated_tokens) if limiter is not None else None
+            started = time.monotonic()
+            headers = None
+            try:
+                if limiter is None:
+                    out = await resource.create(*args, **kwargs)
+                else:
+                    raw = await resource.with_raw_response.create(*args, **kwargs)
+                    headers, out = raw.headers, raw.parse()
+            except BaseException as e:
+                if limiter is not None:
+                    limiter.release()
+                    if isinstance(e, openai.RateLimitError):
+                        limiter.on_rate_limited(e.response.headers, epoch)
+                raise
+
+            def finish(completed: bool) -> None:
+                if limiter is not None:
+                    limiter.release()
+                    if completed:
+                        limiter.on_success(headers)
+                if completed and policy is not None and model and hedge:
+                    policy.record_latency(model, time.monotonic() - started)
+
+            if streaming:
+                # The slot stays taken until the caller has drained (or abandoned) the stream.
+                return _HeldStream(out, finish)
+            finish(True)
+            return out
+
         # attempts are 1-indexed for backoff math
         for attempt in range(1, retries + 1):
             try:
                 if attempt == 1:
                     logger.debug("Calling openai.%s.create retries=%s", method, retries)
-                return await resource.create(*args, **kwargs)
+                if budget is not None:
+                    budget.check()
+                call = policy.hedged(model, _create_once) if policy is not None and hedge else _create_once()
+                return await with_deadline(call, budget)
+            except GenerativeDeadlineExceeded:
+                logger.warning("OpenAI call hit the request deadline method=%s attempt=%s/%s", method, attempt, retries)
+                raise
             except openai.APITimeoutError as e:
                 logger.warning("OpenAI timeout method=%s attempt=%s/%s", method, attempt, retries)
                 last_exc = e
@@ -60,26 +156,38 @@ class OpenAIClient:
 
             if attempt >= retries:
                 break
+            if budget is not None and not budget.take_retry():
+                logger.warning("Request retry budget exhausted method=%s", method)
+                break
+            # The limiter already holds the retry until the server-reported reset.
+            if limiter is not None and limiter.is_paused:
+                continue
 
             # Exponential backoff with jitter; rate limits get a slightly higher base.
             base = hard_wait * (2 if isinstance(last_exc, openai.RateLimitError) else 1)
             timeout = min(max_wait, base * (2 ** (attempt - 1)))
             timeout *= random.uniform(0.5, 1.5)
+            remaining = budget.remaining() if budget is not None else None
+            if remaining is not None and timeout >= remaining:
+                raise GenerativeDeadlineExceeded("The request deadline leaves no time to retry the LLM call.") from last_exc
             logger.info("Retrying OpenAI call after backoff seconds=%.2f", timeout)
             await asyncio.sleep(timeout)
 
         logger.error("OpenAI call failed after retries method=%s retries=%s", method, retries)
         raise GenerativeOutputError("Failed to complete OpenAI request after retries.") from last_exc
 
-    async def generate_text(self, model : str, prompt : str, retries = 3, hard_wait = 4):
+    async def generate_text(self, model : str, prompt : str, retries = 3, hard_wait = 4,
+                            priority : RequestPriority = RequestPriority.INTERACTIVE):
         """Generate plain text output from the OpenAI Responses API."""
-        logger.info("Generating text with OpenAI model=%s", model)
+        logger.info("Generating text with OpenAI model=%s priority=%s", model, priority.name)
 
         try:
             out = await self._send_request(
                 "responses",
                 retries,
                 hard_wait,
+                priority = priority,
+                interactive = priority == RequestPriority.INTERACTIVE,
                 model = model,
                 input = prompt
             )
@@ -89,16 +197,57 @@ class OpenAIClient:
 
         return out.output_text
 
-    async def generate_text_with_file(self, model : str, prompt : str, file : bytes, retries = 3, hard_wait = 4):
-        """Generate text by sending both prompt text and an uploaded file."""
-        logger.info("Generating text with file using OpenAI model=%s", model)
+    async def stream_text(self, model : str, prompt : str, retries = 3, hard_wait = 4,
+                          priority : RequestPriority = RequestPriority.INTERACTIVE) -> AsyncIterator[str]:
+        """Yield output text deltas from the Responses streaming API.
+
+        Opening the stream is retried like any other call; an error once text has arrived
+        propagates, since the caller may already have used the partial output.
+        """
+        logger.info("Streaming text with OpenAI model=%s priority=%s", model, priority.name)
+        stream = await self._send_request(
+            "responses",
+            retries,
+            hard_wait,
+            priority = priority,
+            interactive = priority == RequestPriority.INTERACTIVE,
+            model = model,
+            input = prompt,
+            stream = True,
+        )
+
+        budget = current_request_budget()
+        events = stream.__aiter__()
+        completed = False
+        try:
+            while True:
+                try:
+                    event = await with_deadline(events.__anext__(), budget)
+                except StopAsyncIteration:
+                    completed = True
+                    return
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+                elif event.type in ("error", "response.failed"):
+                    raise GenerativeOutputError(f"OpenAI stream failed event={event.type}")
+        finally:
+            await stream.close(completed)
+
+    async def generate_text_with_file(self, model : str, prompt : str, file : bytes | None = None, retries = 3, hard_wait = 4, file_id : str | None = None,
+                                      priority : RequestPriority = RequestPriority.INTERACTIVE):
+        """Generate text by sending both prompt text and a file, reusing ``file_id`` when given."""
+        logger.info("Generating text with file using OpenAI model=%s reused_file=%s", model, file_id is not None)
+        reused_file_id = file_id
         try:
-            file_id = await self._upload_file(file)
+            if file_id is None:
+                file_id = await self._upload_file(file)
 
             out = await self._send_request(
                 "responses",
                 retries,
                 hard_wait,
+                # Whole-RFP extraction runs far longer than answers: no short timeout, no hedging.
+                priority=priority,
                 model=model,
                 input=[
                     {
@@ -110,17 +259,103 @@ class OpenAIClient:
                     }
                 ],
             )
+        except (openai.NotFoundError, openai.BadRequestError) as e:
+            if reused_file_id is not None and _is_missing_file_error(e, reused_file_id):
+                logger.warning("OpenAI no longer has file file_id=%s", reused_file_id)
+                raise GenerativeFileNotFound(f"OpenAI file {reused_file_id} is missing or invalid") from e
+            logger.exception("OpenAI file-backed generation failed model=%s", model)
+            raise
         except Exception:
             logger.exception("OpenAI file-backed generation failed model=%s", model)
             raise
 
         return out.output_text
 
-    async def _upload_file(self, file_bytes: bytes, retries: int = 2, hard_wait: int = 20):
+    async def upload_file(self, file_bytes: bytes, expires_after_seconds: int | None = None) -> str:
+        """Upload a PDF for reuse across calls; OpenAI deletes it ``expires_after_seconds`` after upload."""
+        return await self._upload_file(file_bytes, expires_after_seconds=expires_after_seconds)
+
+    async def delete_file(self, file_id: str) -> bool:
+        """Delete an uploaded file; returns False when OpenAI no longer has it."""
+        try:
+            await self._client.files.delete(file_id)
+        except openai.NotFoundError:
+            logger.info("OpenAI file already gone file_id=%s", file_id)
+            return False
+        logger.info("Deleted OpenAI file file_id=%s", file_id)
+        return True
+
+    async def submit_batch(self, requests_jsonl: bytes, completion_window: str = "24h") -> str:
+        """Upload Batch API request lines and create a batch; batches use their own, separate quota."""
+        payload = (f"{uuid.uuid4()}.jsonl", BytesIO(requests_jsonl), "application/jsonl")
+        try:
+            uploaded = await self._send_request("files", 2, 20, file=payload, purpose="batch")
+            batch = await self._send_request(
+                "batches",
+                3,
+                4,
+                input_file_id=uploaded.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window=completion_window,
+            )
+        except Exception:
+            logger.exception("OpenAI batch submission failed")
+            raise
+
+        logger.info("Submitted OpenAI batch batch_id=%s input_file_id=%s", batch.id, uploaded.id)
+        return batch.id
+
+    async def get_batch(self, batch_id: str) -> BatchStatus:
+        """Return the batch's status; finished batches include outputs and errors by custom id."""
+        try:
+            batch = await self._client.batches.retrieve(batch_id)
+        except openai.NotFoundError:
+            logger.warning("OpenAI batch not found batch_id=%s", batch_id)
+            return BatchStatus("expired")
+
+        status = BatchStatus(batch.status)
+        if not status.is_finished:
+            return status
+
+        outputs: dict[str, str] = {}
+        errors: dict[str, str] = {}
+        # Expired and cancelled batches still deliver the requests that completed in time.
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for record in await self._read_jsonl_file(file_id):
+                custom_id = record.get("custom_id")
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    outputs[custom_id] = _response_output_text(response.get("body") or {})
+                else:
+                    errors[custom_id] = json.dumps(record.get("error") or response.get("body"))
+
+        logger.info("OpenAI batch finished batch_id=%s status=%s outputs=%s errors=%s", batch_id, batch.status, len(outputs), len(errors))
+        return BatchStatus(batch.status, outputs, errors)
+
+    async def cancel_batch(self, batch_id: str) -> bool:
+        """Cancel a batch; requests it already finished stay billed, the rest are dropped."""
+        try:
+            await self._client.batches.cancel(batch_id)
+        except openai.NotFoundError:
+            logger.info("OpenAI batch already gone batch_id=%s", batch_id)
+            return False
+        logger.info("Cancelled OpenAI batch batch_id=%s", batch_id)
+        return True
+
+    async def _read_jsonl_file(self, file_id: str) -> list[dict]:
+        content = await self._client.files.content(file_id)
+        return [json.loads(line) for line in content.text.splitlines() if line.strip()]
+
+    async def _upload_file(self, file_bytes: bytes, retries: int = 2, hard_wait: int = 20, expires_after_seconds: int | None = None):
         """Upload bytes to OpenAI Files API and return the file identifier."""
         # OpenAI expects a filename + content-type when uploading raw bytes.
         fn = str(uuid.uuid4())
         payload = (f"{fn}.pdf", BytesIO(file_bytes), "application/pdf")
+        extra = {}
+        if expires_after_seconds:
+            extra["expires_after"] = {"anchor": "created_at", "seconds": int(expires_after_seconds)}
 
         try:
             uploaded = await self._send_request(
@@ -129,6 +364,7 @@ class OpenAIClient:
                 hard_wait,
                 file=payload,
                 purpose="user_data",
+                **extra,
             )
         except Exception:
             logger.exception("OpenAI file upload failed payload_mime=application/pdf")
@@ -139,3 +375,14 @@ class OpenAIClient:
             raise GenerativeOutputError("Failed to upload file to OpenAI.")
 
         return uploaded.id
+
+
+def _response_output_text(body: dict) -> str:
+    """Concatenate the ``output_text`` parts of a raw Responses API body, like the SDK's ``output_text``."""
+    return "".join(
+        part.get("text", "")
+        for item in body.get("output") or ()
+        if item.get("type") == "message"
+        for part in item.get("content") or ()
+        if part.get("type") == "output_text"
+    )
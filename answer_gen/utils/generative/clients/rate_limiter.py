@@ -0,0 +1,304 @@
+"""Client-side, per-model admission control for LLM requests.
+
+Each model gets an AIMD concurrency limit (grown by successes, halved by 429s) and a
+request/token bucket refreshed from OpenAI's ``x-ratelimit-*`` response headers. Waiting
+requests are admitted strictly by priority, so interactive answers overtake queued bulk shards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import re
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from threading import Lock
+from typing import Mapping
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_SECONDS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+class RequestPriority(IntEnum):
+    """Lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+def parse_reset_seconds(value: str | None) -> float | None:
+    """Parse an ``x-ratelimit-reset-*`` duration such as ``"1s"``, ``"6m0s"`` or ``"20ms"``."""
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value.strip())
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_SECONDS[unit] for amount, unit in parts)
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def estimate_request_tokens(payload) -> int:
+    """Rough token cost of a request (~4 characters per token), used for the token bucket."""
+    return max(1, len(str(payload)) // 4)
+
+
+class _Bucket:
+    """Remaining requests or tokens as last reported by the server, drawn down locally."""
+
+    __slots__ = ("remaining", "reset_at")
+
+    def __init__(self):
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+
+    def update(self, remaining: int | None, reset_seconds: float | None, now: float) -> None:
+        if remaining is None:
+            return
+        self.remaining = remaining
+        self.reset_at = now + (reset_seconds or 0.0)
+
+    def blocked_until(self, cost: int, now: float) -> float | None:
+        """Monotonic time the bucket refills if ``cost`` does not fit, else None."""
+        if self.remaining is None or now >= self.reset_at:
+            # Unknown or refilled since the last report: admit until the server says otherwise.
+            self.remaining = None
+            return None
+        return self.reset_at if self.remaining < cost else None
+
+    def consume(self, cost: int) -> None:
+        if self.remaining is not None:
+            self.remaining -= cost
+
+
+class ModelRateLimiter:
+    """Admission control for one model; see the module docstring."""
+
+    def __init__(
+        self,
+        model: str,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        additive_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        self.model = model
+        self._min = max(1, min_concurrency)
+        self._max = max(self._min, max_concurrency)
+        self._limit = float(min(self._max, max(self._min, initial_concurrency)))
+        self._additive_increase = additive_increase
+        self._decrease_factor = decrease_factor
+
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future, int]] = []
+        self._seq = itertools.count()
+        self._requests = _Bucket()
+        self._tokens = _Bucket()
+        self._paused_until = 0.0
+        self._wake_handle: asyncio.TimerHandle | None = None
+        # Only the first 429 among requests admitted under the same limit shrinks it.
+        self._epoch = 0
+
+        self._lock = Lock()
+        self._admitted = {priority.name.lower(): 0 for priority in RequestPriority}
+        self._rate_limited = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def is_paused(self) -> bool:
+        """True while admission waits for a server-reported rate limit reset."""
+        return time.monotonic() < self._paused_until
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority = RequestPriority.INTERACTIVE, estimated_tokens: int = 1):
+        """Hold one admitted request; yields the admission epoch for `on_rate_limited`."""
+        epoch = await self._acquire(priority, estimated_tokens)
+        try:
+            yield epoch
+        finally:
+            self._release()
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.INTERACTIVE, estimated_tokens: int = 1) -> int:
+        """Take a slot that outlives one block (e.g. an open stream); pair with `release`."""
+        return await self._acquire(priority, estimated_tokens)
+
+    def release(self) -> None:
+        self._release()
+
+    def on_success(self, headers: Mapping[str, str] | None) -> None:
+        """Additive increase, plus a bucket refresh from the response headers."""
+        self._update_buckets(headers)
+        self._limit = min(self._max, self._limit + self._additive_increase / self._limit)
+        self._dispatch()
+
+    def on_rate_limited(self, headers: Mapping[str, str] | None, epoch: int) -> float | None:
+        """Multiplicative decrease and pause admission; returns the server's reset delay if known."""
+        now = time.monotonic()
+        self._update_buckets(headers)
+        with self._lock:
+            self._rate_limited += 1
+            if epoch == self._epoch:
+                self._epoch += 1
+                self._decreases += 1
+                self._limit = max(self._min, self._limit * self._decrease_factor)
+                logger.info("Lowered LLM concurrency model=%s limit=%s", self.model, self.limit)
+
+        headers = headers or {}
+        delay = parse_reset_seconds(headers.get("retry-after"))
+        if delay is None:
+            resets = [
+                parse_reset_seconds(headers.get("x-ratelimit-reset-requests")),
+                parse_reset_seconds(headers.get("x-ratelimit-reset-tokens")),
+            ]
+            resets = [r for r in resets if r is not None]
+            delay = max(resets) if resets else None
+        if delay is not None:
+            self._paused_until = max(self._paused_until, now + delay)
+        self._dispatch()
+        return delay
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "model": self.model,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "queued": sum(1 for *_rest, fut, _cost in self._waiters if not fut.done()),
+                "remaining_requests": self._requests.remaining,
+                "remaining_tokens": self._tokens.remaining,
+                "admitted": dict(self._admitted),
+                "rate_limited": self._rate_limited,
+                "decreases": self._decreases,
+            }
+
+    async def _acquire(self, priority: RequestPriority, estimated_tokens: int) -> int:
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), fut, max(1, estimated_tokens)))
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Admitted just as the caller was cancelled: hand the slot back.
+                self._release()
+            raise
+        with self._lock:
+            self._admitted[RequestPriority(priority).name.lower()] += 1
+        return fut.result()
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _update_buckets(self, headers: Mapping[str, str] | None) -> None:
+        if not headers:
+            return
+        now = time.monotonic()
+        self._requests.update(
+            _header_int(headers, "x-ratelimit-remaining-requests"),
+            parse_reset_seconds(headers.get("x-ratelimit-reset-requests")),
+            now,
+        )
+        self._tokens.update(
+            _header_int(headers, "x-ratelimit-remaining-tokens"),
+            parse_reset_seconds(headers.get("x-ratelimit-reset-tokens")),
+            now,
+        )
+
+    def _dispatch(self) -> None:
+        """Admit waiters in priority order while concurrency and both buckets allow."""
+        now = time.monotonic()
+        while self._waiters:
+            _priority, _seq, fut, cost = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._in_flight >= self.limit:
+                return
+
+            blocked = [t for t in (
+                self._paused_until if now < self._paused_until else None,
+                self._requests.blocked_until(1, now),
+                self._tokens.blocked_until(cost, now),
+            ) if t is not None]
+            if blocked:
+                self._schedule_wake(max(blocked) - now)
+                return
+
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            self._requests.consume(1)
+            self._tokens.consume(cost)
+            fut.set_result(self._epoch)
+
+    def _schedule_wake(self, delay: float) -> None:
+        if self._wake_handle is not None and not self._wake_handle.cancelled():
+            return
+
+        def _wake():
+            self._wake_handle = None
+            self._dispatch()
+
+        self._wake_handle = asyncio.get_running_loop().call_later(max(0.0, delay), _wake)
+
+
+class RateLimiterRegistry:
+    """One `ModelRateLimiter` per model, created on first use with shared settings."""
+
+    def __init__(self, **limiter_kwargs):
+        self._limiter_kwargs = limiter_kwargs
+        self._limiters: dict[str, ModelRateLimiter] = {}
+        self._lock = Lock()
+
+    def get(self, model: str) -> ModelRateLimiter:
+        with self._lock:
+            limiter = self._limiters.get(model)
+            if limiter is None:
+                limiter = ModelRateLimiter(model, **self._limiter_kwargs)
+                self._limiters[model] = limiter
+            return limiter
+
+    def stats(self) -> list[dict]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.stats() for limiter in limiters]
+
+
+_REGISTRY: RateLimiterRegistry | None = None
+
+
+def init_rate_limiters(registry: RateLimiterRegistry | None) -> RateLimiterRegistry | None:
+    """Install the process-wide limiters shared by every `OpenAIClient`; None disables limiting."""
+    global _REGISTRY
+    _REGISTRY = registry
+    return _REGISTRY
+
+
+def get_rate_limiter(model: str | None) -> ModelRateLimiter | None:
+    if _REGISTRY is None or not model:
+        return None
+    return _REGISTRY.get(model)
+
+
+def get_rate_limiter_stats() -> list[dict]:
+    """Concurrency limit, queue depth and bucket state per model."""
+    return _REGISTRY.stats() if _REGISTRY is not None else []
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+import os
+from typing import Callable
+
+from answer_gen.utils.config.generative_client_config import GenerativeClientConfig, LocalGenerativeConfig
+from answer_gen.utils.generative.clients.base import GenerativeClient
+from answer_gen.utils.generative.clients.local_client import LocalGenerativeClient
+from answer_gen.utils.generative.clients.openai_client import OpenAIClient
+
+logger = logging.getLogger(__name__)
+
+_FACTORIES: dict[str, Callable[[], GenerativeClient]] = {}
+_CLIENT: GenerativeClient | None = None
+
+
+def register_generative_client(name: str, factory: Callable[[], GenerativeClient]) -> None:
+    """Make a backend selectable through `[generative] client`."""
+    _FACTORIES[name.lower()] = factory
+
+
+def build_generative_client(backend: str | None = None) -> GenerativeClient:
+    """Build a client for ``backend``, defaulting to the configured `[generative] client`."""
+    config_path = os.getenv("CONFIG_FILE", "config/global.ini")
+    backend = (backend or GenerativeClientConfig.from_config(config_path).backend).lower()
+    factory = _FACTORIES.get(backend)
+    if factory is None:
+        raise ValueError(f"generative client must be one of {sorted(_FACTORIES)}, got {backend!r}")
+
+    logger.info("Using generative client backend=%s", backend)
+    return factory()
+
+
+def get_generative_client() -> GenerativeClient:
+    """Return the process-wide generative client shared by every worker, building it on first access."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = build_generative_client()
+    return _CLIENT
+
+
+register_generative_client(
+    "openai",
+    lambda: OpenAIClient(os.getenv("LLM_API_KEY") or os.getenv("OPENAI_API_KEY")),
+)
+register_generative_client(
+    "local",
+    lambda: LocalGenerativeClient.from_config(LocalGenerativeConfig.from_config(os.getenv("CONFIG_FILE", "config/global.ini"))),
+)
@@ -1,22 +1,65 @@
+import hashlib
+import json
 import logging
 
 from answer_gen.utils.file_utils import read_file_async
-from answer_gen.utils.generative.parsers import parse_questions_json, parse_answer_json
-from answer_gen.exceptions import GenerativeOutputError, GenerativeExecutionError
+from answer_gen.utils.generative.parsers import (
+    IncrementalJsonArrayParser,
+    parse_answer_item,
+    parse_answer_json,
+    parse_questions_json,
+)
+from answer_gen.utils.generative.response_cache import get_response_cache, prompt_fingerprint
+from answer_gen.utils.generative.clients.base import BATCH_ENDPOINT
+from answer_gen.utils.generative.clients.rate_limiter import RequestPriority
+from answer_gen.exceptions import GenerativeOutputError, GenerativeExecutionError, GenerativeDeadlineExceeded, GenerativeFileNotFound
 
 logger = logging.getLogger(__name__)
 
+
+async def _cached_response(use_cache : bool, fingerprint_parts : tuple, parse):
+    """Return `(cache, fingerprint, parsed)` for a cached response; ``parsed`` is None on a miss."""
+    cache = get_response_cache()
+    if cache is None:
+        return None, None, None
+    if not use_cache:
+        cache.record_bypass()
+        return None, None, None
+
+    fingerprint = prompt_fingerprint(*fingerprint_parts)
+    cached_text = await cache.get(fingerprint)
+    if cached_text is None:
+        return cache, fingerprint, None
+
+    try:
+        return cache, fingerprint, parse(cached_text)
+    except Exception:
+        logger.warning("Discarding unparseable cached LLM response fingerprint=%s", fingerprint[:12])
+        cache.record_discard()
+        return cache, fingerprint, None
+
+
 async def generate_questions(generative_client, prompt_path : str,
-                             model : str, file : bytes):
-    """Generate and parse RFP questions from an uploaded file."""
+                             model : str, file : bytes, use_cache : bool = True,
+                             file_id : str | None = None):
+    """Generate and parse RFP questions from a file, reusing an uploaded ``file_id`` when given."""
     prompt = await read_file_async(prompt_path)
 
+    file_hash = hashlib.sha256(file).hexdigest()
+    cache, fingerprint, questions = await _cached_response(use_cache, (model, prompt, prompt, file_hash), parse_questions_json)
+    if questions is not None:
+        logger.info("Reusing cached LLM question output model=%s", model)
+        return questions
+
     try:
         questions_json_text = await generative_client.generate_text_with_file(
             model=model,
             prompt=prompt,
             file=file,
+            file_id=file_id,
         )
+    except (GenerativeDeadlineExceeded, GenerativeFileNotFound):
+        raise
     except Exception as e:
         logger.exception(f'LLM question generation call failed model={model}: {str(e)}')
         raise GenerativeExecutionError('An error occurred when calling Generative model')
@@ -27,6 +70,10 @@ async def generate_questions(generative_client, prompt_path : str,
         logger.exception("Failed to parse LLM question output")
         raise GenerativeOutputError('An error occured while parsing LLM output.')
 
+    # Only responses that parsed are cached, so a malformed output is never replayed.
+    if cache is not None:
+        await cache.set(fingerprint, model, questions_json_text)
+
     return questions
 
 
@@ -36,6 +83,8 @@ async def generate_answers(
     model: str,
     question_text: str,
     formatting_args : dict | None = None,
+    use_cache : bool = True,
+    priority : RequestPriority = RequestPriority.INTERACTIVE,
 ) -> list:
     """Generate and parse answer objects for the provided question payload."""
     prompt = await read_file_async(prompt_path)
@@ -43,11 +92,19 @@ async def generate_answers(
 
     filled_prompt = prompt.format(question = question_text, **formatting_args)
 
+    cache, fingerprint, answers = await _cached_response(use_cache, (model, prompt, filled_prompt), parse_answer_json)
+    if answers is not None:
+        logger.info("Reusing cached LLM answer output model=%s", model)
+        return answers
+
     try:
         answers_json_text = await generative_client.generate_text(
             model=model,
             prompt=filled_prompt,
+            priority=priority,
         )
+    except GenerativeDeadlineExceeded:
+        raise
     except Exception as e:
         logger.exception(f'LLM answer generation call failed model={model}: {str(e)}')
         raise GenerativeExecutionError('An error occured when calling Generative model')
@@ -58,14 +115,120 @@ async def generate_answers(
         logger.exception(f'Failed to parse LLM answer output: {str(e)}')
         raise GenerativeOutputError("Failed to parse LLM answers.")
 
+    # Only responses that parsed are cached, so a malformed output is never replayed.
+    if cache is not None:
+        await cache.set(fingerprint, model, answers_json_text)
+
     return answers
 
+async def stream_answers(
+    generative_client,
+    prompt_path: str,
+    model: str,
+    question_text: str,
+    formatting_args : dict | None = None,
+    use_cache : bool = True,
+    priority : RequestPriority = RequestPriority.INTERACTIVE,
+):
+    """Yield parsed answer objects as the streamed LLM output closes each one.
+
+    Falls back to `generate_answers` for clients without ``stream_text``. If nothing could be
+    parsed incrementally, the complete output is parsed once the stream ends.
+    """
+    if not hasattr(generative_client, "stream_text"):
+        for answer in await generate_answers(generative_client, prompt_path, model, question_text,
+                                             formatting_args, use_cache=use_cache, priority=priority):
+            yield answer
+        return
+
+    prompt = await read_file_async(prompt_path)
+    formatting_args = formatting_args or {}
+
+    filled_prompt = prompt.format(question = question_text, **formatting_args)
+
+    cache, fingerprint, answers = await _cached_response(use_cache, (model, prompt, filled_prompt), parse_answer_json)
+    if answers is not None:
+        logger.info("Reusing cached LLM answer output model=%s", model)
+        for answer in answers:
+            yield answer
+        return
+
+    parser = IncrementalJsonArrayParser()
+    chunks: list[str] = []
+    yielded = 0
+    try:
+        async for delta in generative_client.stream_text(model=model, prompt=filled_prompt, priority=priority):
+            chunks.append(delta)
+            for item in parser.feed(delta):
+                try:
+                    answer = parse_answer_item(item)
+                except Exception:
+                    logger.warning("Skipping invalid streamed answer item model=%s", model)
+                    continue
+                yielded += 1
+                yield answer
+    except (GenerativeDeadlineExceeded, GenerativeExecutionError):
+        raise
+    except Exception as e:
+        logger.exception(f'LLM answer stream failed model={model} yielded={yielded}: {str(e)}')
+        raise GenerativeExecutionError('An error occured when streaming from Generative model')
+
+    answers_json_text = "".join(chunks)
+    try:
+        answers = parse_answer_json(answers_json_text)
+    except Exception as e:
+        if not yielded:
+            logger.exception(f'Failed to parse LLM answer output: {str(e)}')
+            raise GenerativeOutputError("Failed to parse LLM answers.")
+        # Items already yielded stand; an unparseable tail is just not cached.
+        logger.warning("Streamed LLM answer output did not parse as a whole model=%s yielded=%s", model, yielded)
+        return
+
+    if not yielded:
+        for answer in answers:
+            yield answer
+
+    # Only responses that parse are cached, so a malformed output is never replayed.
+    if cache is not None:
+        await cache.set(fingerprint, model, answers_json_text)
+
+async def submit_answer_batch(
+    generative_client,
+    prompt_path: str,
+    model: str,
+    question_texts: dict[str, str],
+    formatting_args : dict | None = None,
+) -> str:
+    """Write one Batch API request line per custom id -> question payload and submit them as one batch.
+
+    Batch outputs bypass the response cache; parse each with `parse_answer_json`.
+    """
+    prompt = await read_file_async(prompt_path)
+    formatting_args = formatting_args or {}
+
+    lines = [
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {"model": model, "input": prompt.format(question = question_text, **formatting_args)},
+        })
+        for custom_id, question_text in question_texts.items()
+    ]
+
+    try:
+        return await generative_client.submit_batch("\n".join(lines).encode("utf-8"))
+    except Exception as e:
+        logger.exception(f'LLM answer batch submission failed model={model} requests={len(lines)}: {str(e)}')
+        raise GenerativeExecutionError('An error occured when submitting a batch to the Generative model')
+
 async def generate_single_answer(generative_client,
     prompt_path: str,
     model: str,
     question_text: str,
-    context: str):
+    context: str,
+    use_cache : bool = True):
         """Generate a single answer object by selecting the first parsed answer."""
-        answers = await generate_answers(generative_client, prompt_path, model, question_text, {"context" : context})
+        answers = await generate_answers(generative_client, prompt_path, model, question_text, {"context" : context}, use_cache=use_cache)
         if answers:
              return answers[0]
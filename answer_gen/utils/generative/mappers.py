@@ -11,11 +11,14 @@ def map_answers(
     responses: Sequence[GenerativeAnswerResponse],
     question_ids: int | Sequence[int],
     answer_version_id: int | None = None,
+    chunk_version_id: int | None = None,
+    corpus_stamp: str | None = None,
 ) -> List[Answer]:
     """Convert parsed LLM answers into Answer ORM instances.
 
     - If ``question_ids`` is a single int, all responses map to that question.
     - If it's a sequence, it must align 1:1 with responses.
+    - ``chunk_version_id``/``corpus_stamp`` record the corpus the answers were grounded on.
     """
 
     if isinstance(question_ids, int):
@@ -30,6 +33,8 @@ def map_answers(
             content=resp.answer,
             question_id=qid,
             answer_version_id=answer_version_id,
+            chunk_version_id=chunk_version_id,
+            corpus_stamp=corpus_stamp,
         )
         for qid, resp in zip(ids, responses)
     ]
@@ -1,2 +1,3 @@
 from .question_parser import parse_questions_json
-from .answer_parser import parse_answer_json
+from .answer_parser import parse_answer_json, parse_answer_item
+from .stream_parser import IncrementalJsonArrayParser
@@ -11,6 +11,7 @@ class GenerativeAnswerResponse(BaseModel):
     sources : list[int] | int | str
     coverage : str | None
     notes : str | None
+    question_id : int | None = None
 
     @classmethod
     def from_dict(cls, data : dict):
@@ -20,9 +21,27 @@ class GenerativeAnswerResponse(BaseModel):
             confidence = data.get("confidence", None),
             sources = data.get("sources_used", []),
             coverage = data.get("coverage", None),
-            notes = data.get("notes", None)
+            notes = data.get("notes", None),
+            question_id = _as_question_id(data.get("question_id", None)),
         )
 
+def _as_question_id(value) -> int | None:
+    """Coerce an echoed question id to int, ignoring values the model mangled."""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def parse_answer_item(item) -> GenerativeAnswerResponse:
+    """Validate one decoded answer item, as found in the LLM's answer list."""
+    if isinstance(item, str):
+        raise InvalidGenerativeResponseStructure('Answers must a list of dictionaries. Got list of strings.')
+    try:
+        return GenerativeAnswerResponse.from_dict(item)
+    except ValidationError as e:
+        err_msg = e.errors()[0]['type']
+        raise InvalidGenerativeResponseStructure('Failed to validate structure of answer: ' + str(err_msg))
+
 def parse_answer_json(text: str) -> list[GenerativeAnswerResponse]:
     """Parse LLM output into a list of GenerativeAnswerResponse."""
     try:
@@ -38,15 +57,7 @@ def parse_answer_json(text: str) -> list[GenerativeAnswerResponse]:
     out: list[str] = []
     if isinstance(answers, list):
         for item in answers:
-            if isinstance(item, str):
-                raise InvalidGenerativeResponseStructure('Answers must a list of dictionaries. Got list of strings.')
-            elif isinstance(item, dict):
-                try:
-                    response = GenerativeAnswerResponse.from_dict(item)
-                except ValidationError as e:
-                    err_msg = e.errors()[0]['type']
-                    raise InvalidGenerativeResponseStructure('Failed to validate structure of answer: ' + str(err_msg))
-
-                out.append(response)
+            if isinstance(item, (str, dict)):
+                out.append(parse_answer_item(item))
 
     return out
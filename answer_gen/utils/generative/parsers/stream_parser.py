@@ -0,0 +1,83 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJsonArrayParser:
+    """Yield the objects of a streamed JSON array as soon as each one closes.
+
+    The first array in the stream is taken to be the item list, so both a bare ``[...]`` and a
+    wrapper such as ``{"answers": [...]}`` work, as does text or a code fence around them.
+    Objects that fail to decode are skipped; the caller can still parse the full text at the end.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        # Stack of open "[" / "{" characters, and where the current item object started.
+        self._stack: list[str] = []
+        self._items_depth: int | None = None
+        self._item_start: int | None = None
+        self._in_string = False
+        self._escaped = False
+        self._done = False
+
+    def feed(self, text: str) -> list[dict]:
+        """Consume the next chunk of streamed text and return the items it completed."""
+        if self._done or not text:
+            return []
+        self._buffer += text
+
+        items: list[dict] = []
+        buffer = self._buffer
+        while self._pos < len(buffer):
+            char = buffer[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._stack:
+                    self._in_string = True
+            elif char in "[{":
+                if char == "[" and self._items_depth is None:
+                    self._items_depth = len(self._stack) + 1
+                elif char == "{" and len(self._stack) == self._items_depth:
+                    self._item_start = self._pos
+                self._stack.append(char)
+            elif char in "]}" and self._stack:
+                self._stack.pop()
+                if char == "}" and self._item_start is not None and len(self._stack) == self._items_depth:
+                    item = self._decode(buffer[self._item_start:self._pos + 1])
+                    if item is not None:
+                        items.append(item)
+                    self._item_start = None
+                elif char == "]" and self._items_depth is not None and len(self._stack) < self._items_depth:
+                    self._done = True
+                    self._pos += 1
+                    break
+            self._pos += 1
+
+        self._compact()
+        return items
+
+    def _decode(self, raw: str) -> dict | None:
+        try:
+            item = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("Skipping undecodable streamed JSON item length=%s", len(raw))
+            return None
+        return item if isinstance(item, dict) else None
+
+    def _compact(self) -> None:
+        """Drop text before the current item so long streams are not rescanned or retained."""
+        keep_from = self._item_start if self._item_start is not None else self._pos
+        if keep_from:
+            self._buffer = self._buffer[keep_from:]
+            self._pos -= keep_from
+            if self._item_start is not None:
+                self._item_start = 0
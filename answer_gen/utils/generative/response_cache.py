@@ -0,0 +1,194 @@
+"""Content-addressed cache of raw LLM responses keyed by a prompt fingerprint.
+
+The key hashes the model, the prompt template version, the filled prompt and any attached
+file, so UI retries, re-runs after a partial failure and re-uploaded RFPs skip the LLM call.
+Backends are an in-process LRU with TTL or the `llm_response_cache` table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Protocol
+
+from answer_gen.storage.async_persistence import AsyncPersistence
+from answer_gen.storage.db import build_async_connection
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_BACKENDS = ("memory", "postgres", "off")
+
+
+def template_version(template: str) -> str:
+    """Short, stable version id for a prompt template's text."""
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+
+def prompt_fingerprint(model: str, template: str, filled_prompt: str, file_hash: str | None = None) -> str:
+    """Cache key for one LLM call."""
+    digest = hashlib.sha256()
+    for part in (model, template_version(template), filled_prompt, file_hash or ""):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCacheBackend(Protocol):
+    async def get(self, fingerprint: str) -> str | None: ...
+
+    async def set(self, fingerprint: str, model: str, response_text: str) -> None: ...
+
+
+class MemoryResponseCacheBackend:
+    """In-process LRU bounded by entry count; entries expire ``ttl_seconds`` after being written."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None):
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = Lock()
+
+    async def get(self, fingerprint: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+            written_at, response_text = entry
+            if self._ttl_seconds and time.monotonic() - written_at > self._ttl_seconds:
+                del self._entries[fingerprint]
+                return None
+            self._entries.move_to_end(fingerprint)
+            return response_text
+
+    async def set(self, fingerprint: str, model: str, response_text: str) -> None:
+        with self._lock:
+            self._entries[fingerprint] = (time.monotonic(), response_text)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PostgresResponseCacheBackend:
+    """`llm_response_cache` table shared by every process; rows older than ``ttl_seconds`` are ignored."""
+
+    def __init__(self, db_url: str, ttl_seconds: float | None = None):
+        self._db_url = db_url
+        self._ttl_seconds = ttl_seconds
+
+    async def get(self, fingerprint: str) -> str | None:
+        fresh_after = datetime.utcnow() - timedelta(seconds=self._ttl_seconds) if self._ttl_seconds else None
+        try:
+            async with build_async_connection(self._db_url) as session:
+                return await AsyncPersistence(session).get_cached_llm_response(fingerprint, fresh_after)
+        except Exception:
+            # The cache is an optimization; a lookup failure just means calling the LLM.
+            logger.warning("LLM response cache lookup failed fingerprint=%s", fingerprint[:12], exc_info=True)
+            return None
+
+    async def set(self, fingerprint: str, model: str, response_text: str) -> None:
+        try:
+            async with build_async_connection(self._db_url) as session:
+                store = AsyncPersistence(session)
+                await store.put_cached_llm_response(fingerprint, model, response_text)
+                await store.commit()
+        except Exception:
+            logger.warning("LLM response cache write failed fingerprint=%s", fingerprint[:12], exc_info=True)
+
+
+class ResponseCache:
+    """Hit/miss accounting in front of a `ResponseCacheBackend`."""
+
+    def __init__(self, backend: ResponseCacheBackend):
+        self._backend = backend
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._bypassed = 0
+        self._discarded = 0
+
+    @property
+    def backend_name(self) -> str:
+        return type(self._backend).__name__
+
+    async def get(self, fingerprint: str) -> str | None:
+        response_text = await self._backend.get(fingerprint)
+        with self._lock:
+            if response_text is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return response_text
+
+    async def set(self, fingerprint: str, model: str, response_text: str) -> None:
+        await self._backend.set(fingerprint, model, response_text)
+        with self._lock:
+            self._writes += 1
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self._bypassed += 1
+
+    def record_discard(self) -> None:
+        """A cached response failed to parse and was replaced by a fresh call."""
+        with self._lock:
+            self._discarded += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": self.backend_name,
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "bypassed": self._bypassed,
+                "discarded": self._discarded,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_CACHE: ResponseCache | None = None
+
+
+def build_response_cache(
+    backend: str,
+    max_entries: int = 1024,
+    ttl_seconds: float | None = None,
+    db_url: str | None = None,
+) -> ResponseCache | None:
+    """Build a response cache for ``backend`` (one of `RESPONSE_CACHE_BACKENDS`); ``off`` returns None."""
+    if backend not in RESPONSE_CACHE_BACKENDS:
+        raise ValueError(f"response cache backend must be one of {RESPONSE_CACHE_BACKENDS}, got {backend!r}")
+    if backend == "off":
+        return None
+    if backend == "postgres":
+        if not db_url:
+            raise ValueError("The postgres response cache backend requires a database URL")
+        return ResponseCache(PostgresResponseCacheBackend(db_url, ttl_seconds))
+    return ResponseCache(MemoryResponseCacheBackend(max_entries, ttl_seconds))
+
+
+def init_response_cache(cache: ResponseCache | None) -> ResponseCache | None:
+    """Install the process-wide response cache used by `generate_answers` and `generate_questions`."""
+    global _CACHE
+    _CACHE = cache
+    if cache is not None:
+        logger.info("Initialized LLM response cache backend=%s", cache.backend_name)
+    return _CACHE
+
+
+def get_response_cache() -> ResponseCache | None:
+    return _CACHE
+
+
+def get_response_cache_stats() -> dict | None:
+    """Hit/miss counters for the shared LLM response cache, if one is configured."""
+    return _CACHE.stats() if _CACHE is not None else None
@@ -85,3 +85,97 @@ export async function postJson<T>(url: string, body: unknown): Promise<T> {
   if (!resp.ok) throw new Error(await readErrorBody(resp));
   return (await resp.json()) as T;
 }
+
+export type JobDocument = {
+  id: number;
+  filename: string;
+  status: "pending" | "succeeded" | "skipped" | "failed";
+  document_id: number | null;
+  chunk_count: number;
+  error: string | null;
+};
+
+export type Job<R = unknown> = {
+  id: number;
+  kind: string;
+  status: "queued" | "running" | "succeeded" | "failed";
+  result: R | null;
+  error: string | null;
+  total_items: number;
+  items_done: number;
+  items_failed: number;
+  chunks_done: number;
+  documents?: JobDocument[];
+};
+
+const JOB_POLL_INTERVAL_MS = 2_000;
+
+function isFinished(job: Job): boolean {
+  return job.status === "succeeded" || job.status === "failed";
+}
+
+export function watchJob<R>(jobUrl: string, onUpdate: (job: Job<R>) => void): Promise<Job<R>> {
+  // Prefer the server-sent event stream; fall back to polling if it cannot be opened or drops.
+  return new Promise((resolve, reject) => {
+    let settled = false;
+    const finish = (job: Job<R>) => {
+      settled = true;
+      resolve(job);
+    };
+
+    const poll = async () => {
+      while (!settled) {
+        try {
+          const job = await getJson<Job<R>>(jobUrl);
+          onUpdate(job);
+          if (isFinished(job)) return finish(job);
+        } catch (e) {
+          settled = true;
+          return reject(e);
+        }
+        await new Promise((r) => setTimeout(r, JOB_POLL_INTERVAL_MS));
+      }
+    };
+
+    if (typeof EventSource === "undefined") {
+      void poll();
+      return;
+    }
+
+    const source = new EventSource(`${jobUrl}/events`);
+    source.onmessage = (event) => {
+      const job = JSON.parse(event.data) as Job<R>;
+      onUpdate(job);
+      if (isFinished(job)) {
+        source.close();
+        finish(job);
+      }
+    };
+    source.onerror = () => {
+      source.close();
+      if (!settled) void poll();
+    };
+  });
+}
+
+export async function streamNdjson<T>(url: string, onLine: (line: T) => void): Promise<void> {
+  // Long-running streams: no request timeout, read newline-delimited JSON as it arrives.
+  const resp = await fetch(url, { method: "GET" });
+  if (!resp.ok) throw new Error(await readErrorBody(resp));
+  if (!resp.body) throw new Error("Streaming responses are not supported by this browser.");
+
+  const reader = resp.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffered += decoder.decode(value, { stream: !done });
+    const lines = buffered.split("\n");
+    buffered = lines.pop() ?? "";
+    for (const line of lines) {
+      if (line.trim()) onLine(JSON.parse(line) as T);
+    }
+    if (done) break;
+  }
+  if (buffered.trim()) onLine(JSON.parse(buffered) as T);
+}
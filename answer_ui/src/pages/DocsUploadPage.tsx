@@ -1,30 +1,34 @@
 import { useMemo, useState } from "react";
-import { getApiBases, postForm } from "../api/client";
+import { getApiBases, postForm, watchJob, type Job } from "../api/client";
 import PdfPicker from "../components/PdfPicker";
 import LoadingOverlay from "../components/LoadingOverlay";
 
-type UploadResp = { inserted_document_ids: number[]; received: number };
+type UploadResp = { inserted_document_ids: number[]; failed: Record<string, string> };
+type SubmitResp = { job_id: number; status: string };
 
 export default function DocsUploadPage() {
   const { docApiBase } = getApiBases();
   const [files, setFiles] = useState<File[]>([]);
   const [busy, setBusy] = useState(false);
   const [result, setResult] = useState<UploadResp | null>(null);
+  const [job, setJob] = useState<Job<UploadResp> | null>(null);
   const [err, setErr] = useState<string | null>(null);
 
   // Computed once per base URL change so UI always points to the active backend.
-  const uploadUrl = useMemo(() => `${docApiBase}/api/documents/upload`, [docApiBase]);
+  const uploadUrl = useMemo(() => `${docApiBase}/api/jobs/documents`, [docApiBase]);
 
   function onFilesChange(nextFiles: File[]) {
     // New selection starts a new upload attempt, so clear stale status cards.
     setFiles(nextFiles);
     setResult(null);
+    setJob(null);
     setErr(null);
   }
 
   async function onSubmit() {
     setErr(null);
     setResult(null);
+    setJob(null);
     if (!files.length) {
       setErr("Pick one or more PDF files.");
       return;
@@ -34,10 +38,12 @@ export default function DocsUploadPage() {
 
     setBusy(true);
     try {
-      // Backend handles per-document dedupe/chunk/embed; UI just submits selected files.
-      const resp = await postForm<UploadResp>(uploadUrl, form);
-      setResult(resp);
-      setFiles([]); // clear selected files; success banner stays visible
+      // Upload returns as soon as the files are queued; ingestion runs as a background job.
+      const submitted = await postForm<SubmitResp>(uploadUrl, form);
+      setFiles([]); // clear selected files; progress and success banners stay visible
+      const finished = await watchJob<UploadResp>(`${docApiBase}/api/jobs/${submitted.job_id}`, setJob);
+      if (finished.status === "failed") throw new Error(finished.error || "Ingestion job failed");
+      setResult(finished.result);
     } catch (e) {
       setErr(e instanceof Error ? e.message : String(e));
     } finally {
@@ -47,7 +53,14 @@ export default function DocsUploadPage() {
 
   return (
     <section className="panel">
-      <LoadingOverlay message="Ingesting company documents..." visible={busy} />
+      <LoadingOverlay
+        message={
+          job
+            ? `Ingesting company documents... ${job.items_done + job.items_failed}/${job.total_items} done, ${job.chunks_done} chunks`
+            : "Uploading company documents..."
+        }
+        visible={busy}
+      />
       <h1 className="h1">Upload company documents</h1>
       <p className="muted">Sends PDFs to the document ingestion API for chunking + embedding.</p>
 
@@ -81,6 +94,11 @@ export default function DocsUploadPage() {
           <div className="alert__title">Upload complete</div>
           <div className="alert__body">
             Inserted document IDs: <code>{JSON.stringify(result.inserted_document_ids)}</code>
+            {Object.keys(result.failed || {}).length ? (
+              <div>
+                Failed: <code>{JSON.stringify(result.failed)}</code>
+              </div>
+            ) : null}
           </div>
         </div>
       ) : null}
@@ -1,5 +1,5 @@
 import { useMemo, useState } from "react";
-import { getApiBases, postForm, postJson } from "../api/client";
+import { getApiBases, postForm, postJson, streamNdjson, type Job } from "../api/client";
 import PdfPicker from "../components/PdfPicker";
 import LoadingOverlay from "../components/LoadingOverlay";
 
@@ -12,11 +12,19 @@ type AnswerDict = {
   answer_version_id: number | null;
 };
 
+type AnsweredQuestion = { id: number; content: string; answers: AnswerDict[] };
+
 type BulkAnswersResp = {
   rfp_id: number;
-  questions: { id: number; content: string; answers: AnswerDict[] }[];
+  questions: AnsweredQuestion[];
 };
 
+type BulkJobResp = { job_id: number; status: string };
+
+type BulkStreamLine =
+  | { type: "answer"; question: AnsweredQuestion }
+  | { type: "done"; job: Job<{ rfp_id: number; answered: number }> };
+
 export default function RfpUploadPage() {
   const { docApiBase, answerApiBase } = getApiBases();
   const [files, setFiles] = useState<File[]>([]);
@@ -31,7 +39,7 @@ export default function RfpUploadPage() {
   // Keep endpoint wiring local to the page so env/base changes are reflected immediately.
   const uploadUrl = useMemo(() => `${docApiBase}/api/rfp/upload`, [docApiBase]);
   const bulkAnswersUrl = useMemo(
-    () => `${answerApiBase}/api/answers/bulk-generate`,
+    () => `${answerApiBase}/api/answers/bulk-jobs`,
     [answerApiBase],
   );
 
@@ -69,9 +77,19 @@ export default function RfpUploadPage() {
       // Immediately generate answers for the ingested RFP.
       setGenBusy(true);
       try {
-        // Step 2: trigger bulk generation for all unanswered questions in that RFP.
-        const bulk = await postJson<BulkAnswersResp>(bulkAnswersUrl, { rfp_id: resp.rfp_id });
-        setAnswers(bulk);
+        // Step 2: queue bulk generation and render answers shard by shard as they are committed.
+        const { job_id } = await postJson<BulkJobResp>(bulkAnswersUrl, { rfp_id: resp.rfp_id });
+        setAnswers({ rfp_id: resp.rfp_id, questions: [] });
+        await streamNdjson<BulkStreamLine>(`${bulkAnswersUrl}/${job_id}/stream`, (line) => {
+          if (line.type === "answer") {
+            setAnswers((prev) => ({
+              rfp_id: resp.rfp_id,
+              questions: [...(prev?.questions ?? []), line.question],
+            }));
+          } else if (line.job.status === "failed") {
+            setGenErr(line.job.error || "Answer generation failed.");
+          }
+        });
       } catch (e) {
         setGenErr(e instanceof Error ? e.message : String(e));
       } finally {
@@ -87,8 +105,8 @@ export default function RfpUploadPage() {
   return (
     <section className="panel">
       <LoadingOverlay
-        message={busy ? "Extracting questions from RFP document..." : "Generating answers for RFP..."}
-        visible={busy || genBusy}
+        message="Extracting questions from RFP document..."
+        visible={busy && !genBusy}
       />
       <h1 className="h1">Upload an RFP</h1>
       <p className="muted">Parses questions via LLM and writes them to the DB.</p>
@@ -141,7 +159,9 @@ export default function RfpUploadPage() {
       {answers ? (
         <div className="qa">
           <div className="actions">
-            <h2 className="h2">Generated answers</h2>
+            <h2 className="h2">
+              Generated answers{genBusy ? ` (${answers.questions.length} so far...)` : ""}
+            </h2>
             <button
               className="btn btn--ghost"
               type="button"
@@ -0,0 +1,77 @@
+"""Benchmark chunk inserts: ORM bulk INSERT vs binary COPY, reported as rows per second.
+
+Every run happens inside a transaction that is rolled back, so the database is left unchanged.
+
+Usage: python -m benchmarks.bench_chunk_insert <db_url> [rows] [chunk_version_name]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+
+from answer_gen.storage import EMBEDDING_DIM, Chunk
+from answer_gen.storage.db import build_connection
+from answer_gen.storage.factories import chunk_factory, document_factory
+from answer_gen.storage.persistence import Persistence
+from answer_gen.utils.document_utils import get_document_hash
+
+
+def _synthetic_chunks(doc_id: int, chunk_version_id: int, rows: int) -> list[Chunk]:
+    rng = np.random.default_rng(0)
+    vectors = rng.random((rows, EMBEDDING_DIM), dtype=np.float32)
+    chunks = []
+    for i in range(rows):
+        chunk = chunk_factory(
+            doc_id=doc_id,
+            order=i,
+            content=f"benchmark chunk {i} " * 40,
+            chunk_version_id=chunk_version_id,
+        )
+        chunk.embedding = vectors[i]
+        chunks.append(chunk)
+    return chunks
+
+
+def _run(db_url: str, method: str, rows: int, version_name: str) -> float:
+    with build_connection(db_url) as session:
+        store = Persistence(session)
+        version = store.get_chunk_version(version_name)
+        if version is None:
+            raise RuntimeError(f"Chunk version {version_name!r} does not exist; seed chunk versions first.")
+
+        doc_hash = get_document_hash(f"bench-{method}-{time.time_ns()}".encode())
+        document = document_factory(f"bench-{method}.pdf", f"bench-{method}.pdf", doc_hash)
+        store.insert_document(document)
+        store.flush()
+        chunks = _synthetic_chunks(document.id, version.id, rows)
+
+        started = time.perf_counter()
+        store.bulk_insert_chunks(chunks, method=method)
+        session.flush()
+        elapsed = time.perf_counter() - started
+        session.rollback()
+    return rows / elapsed
+
+
+def main(argv: list[str]) -> int:
+    load_dotenv()
+    db_url = argv[1] if len(argv) > 1 else os.getenv("DATABASE_URL")
+    if not db_url:
+        print("Usage: python -m benchmarks.bench_chunk_insert <db_url> [rows] [chunk_version_name]")
+        return 2
+    rows = int(argv[2]) if len(argv) > 2 else 5000
+    version_name = argv[3] if len(argv) > 3 else "v1"
+
+    for method in ("orm", "copy"):
+        rate = _run(db_url, method, rows, version_name)
+        print(f"{method:<5} rows={rows} rows_per_second={rate:,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -28,6 +28,9 @@ echo -e "\n (3) SEEDING VERSION TABLES \n"
 python -u -m answer_gen.storage.seed_chunk_versions "$CONFIG_PATH"
 python -u -m answer_gen.storage.seed_answer_versions "$CONFIG_PATH"
 
+echo -e "\n (3b) BUILDING VECTOR INDEXES \n"
+python -u -m answer_gen.storage.vector_index "$CONFIG_PATH"
+
 echo -e "\n (4) Installing node dependencies \n"
 cd answer_ui/
 npm install
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from answer_gen.server import answer_api
+
+
+def test_bulk_answer_stream_rejects_other_job_kinds(monkeypatch):
+    class _FakeRunner:
+        async def fetch_job(self, job_id):
+            return {"id": job_id, "kind": "document_ingestion", "status": "running", "payload": None}
+
+    monkeypatch.setattr(answer_api, "get_job_runner", lambda: _FakeRunner())
+    monkeypatch.setattr(answer_api, "get_rfp_bulk_answer_worker", lambda: object())
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(answer_api.stream_bulk_answer_job(5, request=None))
+
+    assert error.value.status_code == 404
+
+
+def test_bulk_generate_takes_its_deadline_from_the_installed_call_policy(monkeypatch):
+    from answer_gen.server.models import BulkAnswerRequest
+    from answer_gen.utils.generative.clients import call_policy
+    from answer_gen.utils.generative.clients.call_policy import CallPolicy
+
+    timeouts = []
+
+    async def _fake_worker(rfp_id, use_cache=True):
+        return {"rfp_id": rfp_id}
+
+    async def _fake_run_for_request(_request, work, timeout_seconds=None):
+        timeouts.append(timeout_seconds)
+        return await work
+
+    monkeypatch.setattr(call_policy, "_POLICY", CallPolicy(request_timeout_seconds=120.0, bulk_request_timeout_seconds=321.0))
+    monkeypatch.setattr(answer_api, "get_rfp_bulk_answer_worker", lambda: _fake_worker)
+    monkeypatch.setattr(answer_api, "run_for_request", _fake_run_for_request)
+
+    asyncio.run(answer_api.generate_bulk_answers(BulkAnswerRequest(rfp_id=3), request=None))
+    asyncio.run(answer_api.generate_bulk_answers(BulkAnswerRequest(rfp_id=3, timeout_seconds=10.0), request=None))
+
+    assert timeouts == [321.0, 10.0]
@@ -12,10 +12,10 @@ class _DummyContext:
     def __init__(self, session):
         self._session = session
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self._session
 
-    def __exit__(self, exc_type, exc, tb):
+    async def __aexit__(self, exc_type, exc, tb):
         return False
 
 
@@ -32,18 +32,48 @@ def _build_config() -> AnswerWorkerConfig:
     )
 
 
+def _build_bulk_config(**overrides):
+    from answer_gen.utils.config.answer_worker_config import BulkAnswerWorkerConfig
+
+    base = _build_config()
+    return BulkAnswerWorkerConfig(**{f: getattr(base, f) for f in base.__dataclass_fields__}, **overrides)
+
+
+class _FakeBulkStoreBase:
+    async def get_answer_version_by_name(self, _name):
+        return SimpleNamespace(id=1)
+
+    async def get_chunk_version(self, _name):
+        return SimpleNamespace(id=1)
+
+    async def get_most_similar_chunks_batch(self, embeddings, *_args, **_kwargs):
+        return [[] for _ in embeddings]
+
+
+def _patch_bulk_worker(monkeypatch, store):
+    async def _fake_read(_path):
+        return "{question}"
+
+    module = "answer_gen.components.answers.rfp_answer_worker"
+    monkeypatch.setattr(f"{module}.get_embedder", lambda *_a, **_k: object())
+    monkeypatch.setattr(f"{module}.build_async_connection", lambda _db_url: _DummyContext(object()))
+    monkeypatch.setattr(f"{module}.AsyncPersistence", lambda _session: store)
+    monkeypatch.setattr(f"{module}.read_file_async", _fake_read)
+    monkeypatch.setattr(f"{module}.get_token_counter", lambda _model: len)
+
+
 def test_answer_worker_raises_for_missing_question(monkeypatch):
     class _FakeEmbedder:
         def __init__(self, *_args, **_kwargs):
             pass
 
     class _FakeStore:
-        def get_question_by_id(self, _question_id):
+        async def get_question_by_id(self, _question_id):
             return None
 
-    monkeypatch.setattr("answer_gen.components.answers.answer_worker.Embedder", _FakeEmbedder)
-    monkeypatch.setattr("answer_gen.components.answers.answer_worker.build_connection", lambda _db_url: _DummyContext(object()))
-    monkeypatch.setattr("answer_gen.components.answers.answer_worker.Persistence", lambda _session: _FakeStore())
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.get_embedder", _FakeEmbedder)
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.build_async_connection", lambda _db_url: _DummyContext(object()))
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.AsyncPersistence", lambda _session: _FakeStore())
 
     worker = AnswerWorker("sqlite://", generative_client=object(), config=_build_config())
 
@@ -66,15 +96,15 @@ def test_answer_worker_returns_cached_answers_without_generation(monkeypatch):
         answers = [_FakeAnswer()]
 
     class _FakeStore:
-        def get_question_by_id(self, _question_id):
+        async def get_question_by_id(self, _question_id):
             return _FakeQuestion()
 
     def _should_not_be_called(*_args, **_kwargs):
         raise AssertionError("generate_single_answer should not be called for cached answers")
 
-    monkeypatch.setattr("answer_gen.components.answers.answer_worker.Embedder", _FakeEmbedder)
-    monkeypatch.setattr("answer_gen.components.answers.answer_worker.build_connection", lambda _db_url: _DummyContext(object()))
-    monkeypatch.setattr("answer_gen.components.answers.answer_worker.Persistence", lambda _session: _FakeStore())
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.get_embedder", _FakeEmbedder)
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.build_async_connection", lambda _db_url: _DummyContext(object()))
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.AsyncPersistence", lambda _session: _FakeStore())
     monkeypatch.setattr("answer_gen.components.answers.answer_worker.generate_single_answer", _should_not_be_called)
 
     worker = AnswerWorker("sqlite://", generative_client=object(), config=_build_config())
@@ -82,3 +112,349 @@ def test_answer_worker_returns_cached_answers_without_generation(monkeypatch):
 
     assert result["question"] == 7
     assert result["answers"] == [{"id": 10, "content": "cached"}]
+
+
+def test_answer_worker_commits_new_embedding_when_no_chunks_match(monkeypatch):
+    class _FakeEmbedder:
+        async def aencode(self, texts):
+            return [[0.3, 0.4] for _ in texts]
+
+    question = SimpleNamespace(id=7, content="What is your SLA?", answers=[], embedding=None)
+    events = []
+
+    class _FakeStore:
+        async def get_question_by_id(self, _question_id):
+            return question
+
+        async def get_chunk_version(self, _name):
+            return SimpleNamespace(id=1)
+
+        async def get_most_similar_chunks(self, *_args, **_kwargs):
+            return []
+
+        async def commit(self):
+            events.append(("commit", question.embedding))
+
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.get_embedder", lambda *_a, **_k: _FakeEmbedder())
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.build_async_connection", lambda _db_url: _DummyContext(object()))
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.AsyncPersistence", lambda _session: _FakeStore())
+
+    worker = AnswerWorker("sqlite://", generative_client=object(), config=_build_config())
+    result = asyncio.run(worker(7))
+
+    assert result == {"question": 7, "answers": []}
+    assert events == [("commit", [0.3, 0.4])]
+
+
+def test_answer_worker_reuses_semantic_cache_hit_without_generation(monkeypatch):
+    from dataclasses import replace
+
+    class _FakeQuestion:
+        id = 7
+        content = "Describe your SOC 2 compliance."
+        answers = []
+        embedding = [0.1, 0.2]
+
+    prior = SimpleNamespace(id=3, content="We hold SOC 2 Type II.", answer_version_id=1, chunk_version_id=1, corpus_stamp="5:9")
+    inserted = []
+
+    class _FakeStore:
+        async def get_question_by_id(self, _question_id):
+            return _FakeQuestion()
+
+        async def get_chunk_version(self, _name):
+            return SimpleNamespace(id=1)
+
+        async def get_corpus_stamp(self, _chunk_version_id):
+            return "5:9"
+
+        async def get_similar_answers_batch(self, embeddings, min_similarity, candidates, chunk_version_id, corpus_stamp, ef_search=None, probes=None,
+                                            exclude_question_ids=(), exclude_content_prefix=None):
+            assert (min_similarity, chunk_version_id, corpus_stamp) == (0.9, 1, "5:9")
+            assert list(exclude_question_ids) == [7] and exclude_content_prefix
+            return [(prior, 0.97)]
+
+        async def bulk_insert_answers(self, answers):
+            inserted.extend(answers)
+
+        async def commit(self):
+            pass
+
+    def _should_not_be_called(*_args, **_kwargs):
+        raise AssertionError("the LLM should not be called for a semantic cache hit")
+
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.get_embedder", lambda *_a, **_k: object())
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.build_async_connection", lambda _db_url: _DummyContext(object()))
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.AsyncPersistence", lambda _session: _FakeStore())
+    monkeypatch.setattr("answer_gen.components.answers.answer_worker.generate_single_answer", _should_not_be_called)
+
+    config = replace(_build_config(), semantic_cache_min_similarity=0.9)
+    worker = AnswerWorker("sqlite://", generative_client=object(), config=config)
+    result = asyncio.run(worker(7))
+
+    assert [a["content"] for a in result["answers"]] == ["We hold SOC 2 Type II."]
+    assert [(a.question_id, a.corpus_stamp) for a in inserted] == [(7, "5:9")]
+
+
+def test_answer_worker_regenerate_bypasses_semantic_and_response_caches(monkeypatch):
+    from dataclasses import replace
+
+    question = SimpleNamespace(id=7, content="Describe your SOC 2 compliance.", answers=[], embedding=[0.1, 0.2])
+    generated = []
+
+    class _FakeStore:
+        async def get_question_by_id(self, _question_id):
+            return question
+
+        async def get_chunk_version(self, _name):
+            return SimpleNamespace(id=1)
+
+        async def get_answer_version_by_name(self, _name):
+            return SimpleNamespace(id=1)
+
+        async def get_corpus_stamp(self, _chunk_version_id):
+            return "5:9"
+
+        async def get_similar_answers_batch(self, *_args, **_kwargs):
+            raise AssertionError("a regenerate must not consult the semantic cache")
+
+        async def get_most_similar_chunks(self, *_args, **_kwargs):
+            return [SimpleNamespace(id=1)]
+
+        async def bulk_insert_answers(self, _answers):
+            pass
+
+        async def commit(self):
+            pass
+
+    async def _fake_generate(*_args, use_cache=True, **_kwargs):
+        generated.append(use_cache)
+        return SimpleNamespace()
+
+    module = "answer_gen.components.answers.answer_worker"
+    monkeypatch.setattr(f"{module}.get_embedder", lambda *_a, **_k: object())
+    monkeypatch.setattr(f"{module}.build_async_connection", lambda _db_url: _DummyContext(object()))
+    monkeypatch.setattr(f"{module}.AsyncPersistence", lambda _session: _FakeStore())
+    monkeypatch.setattr(f"{module}.generate_single_answer", _fake_generate)
+    monkeypatch.setattr(f"{module}.map_answers", lambda *_a, **kw: [SimpleNamespace(to_dict=lambda: {"corpus_stamp": kw["corpus_stamp"]})])
+
+    worker = AnswerWorker("sqlite://", generative_client=object(), config=replace(_build_config(), semantic_cache_min_similarity=0.9))
+    monkeypatch.setattr(worker, "_get_context_builder", lambda: SimpleNamespace(build=lambda _chunks: "context"))
+    result = asyncio.run(worker(7, use_cache=False))
+
+    assert generated == [False]
+    assert result["answers"] == [{"corpus_stamp": "5:9"}]
+
+
+def test_bulk_answer_job_payload_carries_the_cache_bypass():
+    from answer_gen.components.answers.rfp_answer_worker import build_bulk_answer_job
+
+    assert "use_cache" not in build_bulk_answer_job(3).payload
+    assert build_bulk_answer_job(3, use_cache=False).payload == {"rfp_id": 3, "use_cache": False}
+
+
+def test_bulk_answer_job_commits_and_reports_each_shard(monkeypatch):
+    from answer_gen.components.answers.rfp_answer_worker import RfpBulkAnswerWorker
+    from answer_gen.utils.config.answer_worker_config import BulkAnswerWorkerConfig
+
+    questions = [SimpleNamespace(id=i, content=f"q{i}", answers=[], embedding=[0.0]) for i in range(5)]
+    events = []
+
+    class _FakeStore(_FakeBulkStoreBase):
+        async def get_job(self, job_id):
+            return SimpleNamespace(id=job_id, payload={"rfp_id": 3})
+
+        async def get_questions_with_answers(self, _rfp_id):
+            return questions
+
+        async def set_job_total(self, _job_id, total):
+            events.append(("total", total))
+
+        async def bulk_insert_answers(self, answers):
+            events.append(("insert", len(answers)))
+
+        async def add_job_progress(self, _job_id, done=0, failed=0, chunks=0):
+            events.append(("progress", done))
+
+        async def commit(self):
+            events.append(("commit",))
+
+    async def _fake_generate(self, shard, _items, _sources, _answer_version_id, use_cache=True):
+        answers = [SimpleNamespace(question_id=q.id) for q in shard]
+        return answers, {q.id: [a] for q, a in zip(shard, answers)}
+
+    _patch_bulk_worker(monkeypatch, _FakeStore())
+    monkeypatch.setattr(RfpBulkAnswerWorker, "_generate_new_answers", _fake_generate)
+
+    # One shard in flight at a time keeps the commit order deterministic.
+    config = _build_bulk_config(bulk_shard_size=2, bulk_concurrency=1)
+    worker = RfpBulkAnswerWorker("sqlite://", config=config, generative_client=object())
+
+    result = asyncio.run(worker.run_job(11))
+
+    assert result == {"rfp_id": 3, "answered": 5}
+    assert events == [
+        ("total", 5), ("commit",),
+        ("insert", 2), ("commit",), ("progress", 2), ("commit",),
+        ("insert", 2), ("commit",), ("progress", 2), ("commit",),
+        ("insert", 1), ("commit",), ("progress", 1), ("commit",),
+    ]
+
+
+def test_bulk_answer_shards_merge_by_question_id(monkeypatch):
+    from answer_gen.components.answers.rfp_answer_worker import RfpBulkAnswerWorker
+    from answer_gen.utils.generative.parsers.answer_parser import GenerativeAnswerResponse
+
+    questions = [SimpleNamespace(id=i, content=f"q{i}", answers=[], embedding=[0.0]) for i in range(1, 6)]
+    inserted = []
+
+    class _FakeStore(_FakeBulkStoreBase):
+        async def bulk_insert_answers(self, answers):
+            inserted.extend(answers)
+
+        async def commit(self):
+            pass
+
+    calls = []
+
+    async def _fake_call_llm(self, items, _sources, use_cache=True):
+        calls.append([item["question_id"] for item in items])
+        # Answer in reverse order and leave out question 2 on its first pass.
+        return [
+            GenerativeAnswerResponse(answer=f"a{item['question_id']}", confidence="high", sources=[], coverage="full", notes=None, question_id=item["question_id"])
+            for item in reversed(items)
+            if item["question_id"] != 2 or len(items) == 1
+        ]
+
+    _patch_bulk_worker(monkeypatch, _FakeStore())
+    monkeypatch.setattr(RfpBulkAnswerWorker, "_call_llm", _fake_call_llm)
+
+    worker = RfpBulkAnswerWorker("sqlite://", config=_build_bulk_config(bulk_shard_size=2, bulk_concurrency=3), generative_client=object())
+    result = asyncio.run(worker._answer_in_shards(_FakeStore(), 9, questions))
+
+    assert sorted(result) == [1, 2, 3, 4, 5]
+    assert {qid: answers[0].content for qid, answers in result.items()} == {i: f"a{i}" for i in range(1, 6)}
+    assert sorted(a.question_id for a in inserted) == [1, 2, 3, 4, 5]
+    assert [2] in calls
+
+
+def test_bulk_streaming_commits_answers_before_the_shard_finishes(monkeypatch):
+    from answer_gen.components.answers.rfp_answer_worker import RfpBulkAnswerWorker
+    from answer_gen.utils.generative.parsers.answer_parser import GenerativeAnswerResponse
+
+    questions = [SimpleNamespace(id=i, content=f"q{i}", answers=[], embedding=[0.0]) for i in range(1, 4)]
+    inserted = []
+
+    class _FakeStore(_FakeBulkStoreBase):
+        async def bulk_insert_answers(self, answers):
+            inserted.append([a.question_id for a in answers])
+
+        async def commit(self):
+            pass
+
+    def _response(question_id):
+        return GenerativeAnswerResponse(answer=f"a{question_id}", confidence="high", sources=[], coverage="full", notes=None, question_id=question_id)
+
+    async def _fake_stream_llm(self, items, _sources, use_cache=True):
+        # The stream skips question 2; yielding control lets the commit loop run in between.
+        for item in items:
+            if item["question_id"] != 2:
+                yield _response(item["question_id"])
+                await asyncio.sleep(0)
+
+    retried = []
+
+    async def _fake_call_llm(self, items, _sources, use_cache=True):
+        retried.append([item["question_id"] for item in items])
+        return [_response(item["question_id"]) for item in items]
+
+    _patch_bulk_worker(monkeypatch, _FakeStore())
+    monkeypatch.setattr(RfpBulkAnswerWorker, "_stream_llm", _fake_stream_llm)
+    monkeypatch.setattr(RfpBulkAnswerWorker, "_call_llm", _fake_call_llm)
+
+    config = _build_bulk_config(bulk_shard_size=3, bulk_streaming=True)
+    worker = RfpBulkAnswerWorker("sqlite://", config=config, generative_client=object())
+    result = asyncio.run(worker._answer_in_shards(_FakeStore(), 9, questions))
+
+    assert inserted == [[1], [3], [2]]
+    assert retried == [[2]]
+    assert {qid: answers[0].content for qid, answers in result.items()} == {1: "a1", 2: "a2", 3: "a3"}
+
+
+def test_bulk_batch_job_maps_outputs_by_custom_id_and_resumes_the_same_batch(monkeypatch):
+    from answer_gen.components.answers.rfp_answer_worker import RfpBulkAnswerWorker
+    from answer_gen.utils.generative.clients.local_client import LocalGenerativeClient
+
+    questions = [SimpleNamespace(id=i, content=f"q{i}", answers=[], embedding=[0.0]) for i in range(1, 6)]
+    job = SimpleNamespace(id=11, payload={"rfp_id": 3, "batch": True}, result=None)
+    inserted = []
+
+    class _FakeStore(_FakeBulkStoreBase):
+        async def get_job(self, _job_id):
+            return job
+
+        async def get_questions_with_answers(self, _rfp_id):
+            return questions
+
+        async def set_job_total(self, _job_id, _total):
+            pass
+
+        async def set_job_result(self, _job_id, result):
+            job.result = result
+
+        async def bulk_insert_answers(self, answers):
+            inserted.extend(answers)
+
+        async def add_job_progress(self, _job_id, done=0, failed=0, chunks=0):
+            pass
+
+        async def commit(self):
+            pass
+
+    async def _fake_read(_path):
+        return "{question}"
+
+    _patch_bulk_worker(monkeypatch, _FakeStore())
+    monkeypatch.setattr("answer_gen.utils.generative.generative.read_file_async", _fake_read)
+
+    client = LocalGenerativeClient(batch_completion_seconds=0.0)
+    config = _build_bulk_config(bulk_shard_size=2, bulk_batch_poll_interval_seconds=0.0)
+    worker = RfpBulkAnswerWorker("sqlite://", config=config, generative_client=client)
+
+    assert asyncio.run(worker.run_job(11)) == {"rfp_id": 3, "answered": 5}
+    assert job.result["shards"] == {"job-11-shard-0": [1, 2], "job-11-shard-1": [3, 4], "job-11-shard-2": [5]}
+    assert all(a.content.endswith(f"for question {a.question_id}.") for a in inserted)
+    assert client.stats()["calls"] == 0
+
+    # A requeued job polls the checkpointed batch instead of submitting another one.
+    inserted.clear()
+    asyncio.run(worker.run_job(11))
+    assert sorted(a.question_id for a in inserted) == [1, 2, 3, 4, 5]
+    assert client.stats()["batches"] == 1
+    assert client.stats()["calls"] == 0
+
+
+def test_bulk_batch_past_max_wait_is_cancelled_before_falling_back(monkeypatch):
+    from answer_gen.components.answers.rfp_answer_worker import RfpBulkAnswerWorker
+    from answer_gen.utils.generative.clients.base import BatchStatus
+
+    class _SlowBatches:
+        def __init__(self):
+            self.cancelled = []
+
+        async def get_batch(self, _batch_id):
+            return BatchStatus("in_progress")
+
+        async def cancel_batch(self, batch_id):
+            self.cancelled.append(batch_id)
+            return True
+
+    _patch_bulk_worker(monkeypatch, _FakeBulkStoreBase())
+    client = _SlowBatches()
+    config = _build_bulk_config(bulk_batch_max_wait_seconds=0.0, bulk_batch_poll_interval_seconds=0.0)
+    worker = RfpBulkAnswerWorker("sqlite://", config=config, generative_client=client)
+
+    batch = asyncio.run(worker._wait_for_batch("batch-1"))
+
+    assert batch.status == "expired"
+    assert client.cancelled == ["batch-1"]
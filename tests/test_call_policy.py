@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from answer_gen.exceptions import GenerativeDeadlineExceeded
+from answer_gen.utils.generative.clients.call_policy import (
+    CallPolicy,
+    RequestBudget,
+    current_request_budget,
+    request_budget,
+    with_deadline,
+)
+
+
+def _warm_policy(latency=0.01, samples=5):
+    policy = CallPolicy(hedge=True, hedge_min_samples=samples)
+    for _ in range(samples):
+        policy.record_latency("gpt-4o-mini", latency)
+    return policy
+
+
+def test_slow_call_is_hedged_and_loser_cancelled():
+    policy = _warm_policy()
+    delays = [1.0, 0.0]
+    cancelled = []
+
+    async def call():
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return delay
+
+    async def scenario():
+        result = await policy.hedged("gpt-4o-mini", call)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(scenario()) == 0.0
+    assert cancelled == [1.0]
+    stats = policy.stats()
+    assert (stats["hedges"], stats["hedges_won"]) == (1, 1)
+
+
+def test_no_hedge_without_enough_latency_samples():
+    policy = CallPolicy(hedge=True, hedge_min_samples=5)
+    policy.record_latency("gpt-4o-mini", 0.001)
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    assert asyncio.run(policy.hedged("gpt-4o-mini", call)) == "done"
+    assert policy.stats()["hedges"] == 0
+
+
+def test_deadline_cancels_slow_call():
+    async def scenario():
+        await with_deadline(asyncio.sleep(1), RequestBudget(timeout_seconds=0.01))
+
+    with pytest.raises(GenerativeDeadlineExceeded):
+        asyncio.run(scenario())
+
+
+def test_retry_budget_is_shared_by_tasks_of_one_request():
+    async def spend():
+        return current_request_budget().take_retry()
+
+    async def scenario():
+        with request_budget(timeout_seconds=5, max_retries=2):
+            return await asyncio.gather(*(asyncio.create_task(spend()) for _ in range(3)))
+
+    assert asyncio.run(scenario()) == [True, True, False]
+    assert current_request_budget() is None
+
+
+def test_short_call_timeout_applies_to_interactive_answers_only(monkeypatch):
+    from types import SimpleNamespace
+
+    from answer_gen.utils.generative.clients import call_policy, openai_client
+    from answer_gen.utils.generative.clients.openai_client import OpenAIClient
+    from answer_gen.utils.generative.clients.rate_limiter import RequestPriority
+
+    calls = []
+
+    class _Responses:
+        async def create(self, **kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(output_text="[]")
+
+    monkeypatch.setattr(call_policy, "_POLICY", CallPolicy(call_timeout_seconds=60.0))
+    monkeypatch.setattr(openai_client, "get_rate_limiter", lambda _model: None)
+    client = OpenAIClient(api_key="test")
+    client._client = SimpleNamespace(responses=_Responses())
+
+    async def run():
+        await client.generate_text("gpt-4o-mini", "q")
+        await client.generate_text("gpt-4o-mini", "q", priority=RequestPriority.BULK)
+        await client.generate_text_with_file("gpt-4o-mini", "extract", file_id="file-1")
+
+    asyncio.run(run())
+
+    assert [call.get("timeout") for call in calls] == [60.0, None, None]
+
+
+def test_only_interactive_calls_are_hedged_and_feed_the_latency_window(monkeypatch):
+    from types import SimpleNamespace
+
+    from answer_gen.utils.generative.clients import call_policy, openai_client
+    from answer_gen.utils.generative.clients.openai_client import OpenAIClient
+    from answer_gen.utils.generative.clients.rate_limiter import RequestPriority
+
+    policy = CallPolicy(hedge=True)
+    hedged, recorded = [], []
+    real_hedged = policy.hedged
+
+    def _spy_hedged(model, call):
+        hedged.append(model)
+        return real_hedged(model, call)
+
+    class _Stream:
+        async def __aiter__(self):
+            yield SimpleNamespace(type="response.output_text.delta", delta="[]")
+
+        async def close(self):
+            return None
+
+    class _Responses:
+        async def create(self, **kwargs):
+            return _Stream() if kwargs.get("stream") else SimpleNamespace(output_text="[]")
+
+    monkeypatch.setattr(policy, "hedged", _spy_hedged)
+    monkeypatch.setattr(policy, "record_latency", lambda model, _seconds: recorded.append(model))
+    monkeypatch.setattr(call_policy, "_POLICY", policy)
+    monkeypatch.setattr(openai_client, "get_rate_limiter", lambda _model: None)
+    client = OpenAIClient(api_key="test")
+    client._client = SimpleNamespace(responses=_Responses())
+
+    async def run():
+        await client.generate_text("gpt-4o-mini", "q")
+        await client.generate_text("gpt-4o-mini", "q", priority=RequestPriority.BULK)
+        for priority in (RequestPriority.INTERACTIVE, RequestPriority.BULK):
+            [delta async for delta in client.stream_text("gpt-4o-mini", "q", priority=priority)]
+
+    asyncio.run(run())
+
+    assert hedged == ["gpt-4o-mini"]
+    assert recorded == ["gpt-4o-mini"]
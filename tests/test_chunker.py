@@ -0,0 +1,32 @@
+from answer_gen.components.ingestion import chunker as chunker_module
+from answer_gen.components.ingestion.chunker import Chunker
+
+
+def test_chunker_reuses_one_splitter_per_settings(monkeypatch):
+    import langchain_text_splitters
+
+    built = []
+
+    class _FakeSplitter:
+        def split_text(self, text):
+            return text.split()
+
+    def _from_tiktoken_encoder(**kwargs):
+        built.append(kwargs)
+        return _FakeSplitter()
+
+    monkeypatch.setattr(
+        langchain_text_splitters.RecursiveCharacterTextSplitter,
+        "from_tiktoken_encoder",
+        staticmethod(_from_tiktoken_encoder),
+    )
+    chunker_module.get_splitter.cache_clear()
+
+    pages = [(0, "a b"), (1, "c")]
+    first = list(Chunker("gpt-4", 500, 50)(pages))
+    second = list(Chunker("gpt-4", 500, 50)(pages))
+    list(Chunker("gpt-4", 200, 20)(pages))
+
+    assert first == second == [(0, ["a", "b"]), (1, ["c"])]
+    assert [(b["chunk_size"], b["chunk_overlap"]) for b in built] == [(500, 50), (200, 20)]
+    chunker_module.get_splitter.cache_clear()
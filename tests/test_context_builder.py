@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from answer_gen.components.answers.context_builder import ContextBuilder, strip_overlap
+
+
+def _chunk(chunk_id, doc_id, order, content):
+    return SimpleNamespace(id=chunk_id, doc_id=doc_id, order=order, content=content)
+
+
+def test_strip_overlap_removes_repeated_boundary_text():
+    previous = "Apex holds SOC 2 Type II. Audits run every year in March."
+    following = "Audits run every year in March. Findings are tracked in Jira."
+
+    assert strip_overlap(previous, following) == " Findings are tracked in Jira."
+    assert strip_overlap(previous, "Unrelated text that does not overlap.") == "Unrelated text that does not overlap."
+
+
+def test_build_merges_adjacent_chunks_and_numbers_sources():
+    first = _chunk(1, 10, 0, "Apex holds SOC 2 Type II. Audits run every year in March.")
+    second = _chunk(2, 10, 1, "Audits run every year in March. Findings are tracked in Jira.")
+    other = _chunk(3, 11, 4, "Insurance coverage is five million dollars.")
+    builder = ContextBuilder(len, max_context_tokens=10_000)
+
+    context = builder.build([(other, 0.4), (second, 0.9), (first, 0.8), (second, 0.9)])
+
+    assert context == (
+        "[Source 1] Apex holds SOC 2 Type II. Audits run every year in March. Findings are tracked in Jira."
+        "\n\n[Source 2] Insurance coverage is five million dollars."
+    )
+
+
+def test_build_keeps_best_passage_within_token_budget():
+    best = _chunk(1, 10, 0, "a" * 40)
+    worse = _chunk(2, 11, 0, "b" * 40)
+    builder = ContextBuilder(len, max_context_tokens=50)
+
+    assert builder.build([(worse, 0.3), (best, 0.9)]) == "[Source 1] " + "a" * 40
+    assert builder.build([(_chunk(3, 12, 0, "c" * 80), 0.5)]) == "[Source 1] " + "c" * 50
+
+
+def test_build_shared_emits_shared_chunks_once():
+    shared = _chunk(1, 10, 0, "Shared security passage.")
+    only_second = _chunk(2, 11, 0, "Staffing passage.")
+    builder = ContextBuilder(len, max_context_tokens=10_000)
+
+    sources, refs = builder.build_shared([[(shared, 0.9)], [(only_second, 0.8), (shared, 0.7)], []])
+
+    assert sources == {1: "Shared security passage.", 2: "Staffing passage."}
+    assert refs == [[1], [2, 1], []]
@@ -0,0 +1,18 @@
+from answer_gen.storage import db
+
+
+def test_build_connection_reuses_shared_engine(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'pool.db'}"
+
+    try:
+        with db.build_connection(db_url) as first, db.build_bulk_connection(db_url) as second:
+            assert first.get_bind() is second.get_bind()
+
+        assert db.get_engine(db_url) is db.init_engine(db_url)
+        stats = db.get_pool_stats()
+        assert len(stats) == 1
+        assert next(iter(stats.values()))["pool_class"] == "QueuePool"
+    finally:
+        db.dispose_engines()
+
+    assert db.get_pool_stats() == {}
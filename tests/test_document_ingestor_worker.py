@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -25,7 +26,8 @@ def test_dedupe_documents_filters_existing_hashes(monkeypatch):
             pass
 
     class _FakeEmbedder:
-        def encode(self, texts):
+        async def aencode(self, texts, cache=True):
+            assert not cache, "document chunks must bypass the embedding cache"
             return [[0.1] for _ in texts]
 
     class _FakeDoc:
@@ -33,13 +35,13 @@ def test_dedupe_documents_filters_existing_hashes(monkeypatch):
             self.hash = hash_value
 
     class _FakeStore:
-        def get_documents_by_hashes(self, _hashes):
+        async def get_documents_by_hashes(self, _hashes):
             return [_FakeDoc("hash-a")]
 
     hash_map = {b"a": "hash-a", b"b": "hash-b"}
 
     monkeypatch.setattr("answer_gen.components.ingestion.document_ingestor.Chunker", _FakeChunker)
-    monkeypatch.setattr("answer_gen.components.ingestion.document_ingestor.Embedder", _FakeEmbedder)
+    monkeypatch.setattr("answer_gen.components.ingestion.document_ingestor.get_embedder", lambda *_args, **_kwargs: _FakeEmbedder())
     monkeypatch.setattr(
         "answer_gen.components.ingestion.document_ingestor.get_document_hash",
         lambda payload: hash_map[payload],
@@ -47,7 +49,7 @@ def test_dedupe_documents_filters_existing_hashes(monkeypatch):
 
     worker = DocumentIngestorWorker("sqlite://", _build_config())
     docs = [("a.pdf", b"a"), ("b.pdf", b"b")]
-    deduped = worker._dedupe_documents(docs, _FakeStore())
+    deduped = asyncio.run(worker._dedupe_documents(docs, _FakeStore()))
 
     assert deduped == [("b.pdf", b"b", "hash-b")]
 
@@ -58,14 +60,216 @@ def test_attach_embeddings_raises_on_vector_count_mismatch(monkeypatch):
             pass
 
     class _FakeEmbedder:
-        def encode(self, _texts):
+        async def aencode(self, _texts, cache=True):
             return [[0.1, 0.2]]
 
     monkeypatch.setattr("answer_gen.components.ingestion.document_ingestor.Chunker", _FakeChunker)
-    monkeypatch.setattr("answer_gen.components.ingestion.document_ingestor.Embedder", _FakeEmbedder)
+    monkeypatch.setattr("answer_gen.components.ingestion.document_ingestor.get_embedder", lambda *_args, **_kwargs: _FakeEmbedder())
 
     worker = DocumentIngestorWorker("sqlite://", _build_config())
     chunks = [SimpleNamespace(content="c1", embedding=None), SimpleNamespace(content="c2", embedding=None)]
 
     with pytest.raises(RuntimeError, match="Embedding count mismatch"):
-        worker._attach_embeddings(chunks)
+        asyncio.run(worker._attach_embeddings(chunks))
+
+
+def test_parallel_chunk_source_preserves_serial_order(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    import time
+
+    from answer_gen.components.ingestion import parallel
+
+    def _fake_extract(_doc_bytes, start, stop, *_chunker_args):
+        # Earlier ranges finish last, so ordering must come from submission order.
+        time.sleep(0.01 * (10 - start))
+        return [f"p{page}-c{i}" for page in range(start, stop) for i in range(2)]
+
+    monkeypatch.setattr(parallel, "get_document_page_count", lambda _doc: 5)
+    monkeypatch.setattr(parallel, "extract_and_chunk", _fake_extract)
+
+    async def _collect():
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            source = parallel.ParallelChunkSource(pool, b"%PDF", 2, ("gpt-4", 500, 50))
+            return [text async for text in source]
+
+    assert parallel.page_ranges(5, 2) == [(0, 2), (2, 4), (4, 5)]
+    assert asyncio.run(_collect()) == [f"p{page}-c{i}" for page in range(5) for i in range(2)]
+
+
+def test_streaming_stages_batch_per_document_through_bounded_queues(monkeypatch):
+    import io
+
+    import numpy as np
+
+    from answer_gen.components.ingestion import streaming
+
+    pages_by_file = {b"one": [(0, "a b c"), (1, "d")], b"bad": None, b"two": [(0, "e")]}
+
+    def _fake_text(file):
+        pages = pages_by_file[file.read()]
+        if pages is None:
+            raise ValueError("unreadable")
+        return iter(pages)
+
+    class _SplitChunker:
+        def __call__(self, pages):
+            for number, text in pages:
+                yield number, text.split()
+
+    class _FakeEmbedder:
+        async def aencode(self, texts, cache=True):
+            assert not cache, "document chunks must bypass the embedding cache"
+            return np.ones((len(texts), 2), dtype=np.float32)
+
+    monkeypatch.setattr(streaming, "get_document_text", _fake_text)
+    docs = [streaming.StreamedDocument(name, io.BytesIO(name.encode()), name) for name in ("one", "bad", "two")]
+
+    async def _run():
+        text_queue, embedded_queue = asyncio.Queue(maxsize=1), asyncio.Queue(maxsize=1)
+        received = []
+
+        async def _drain():
+            while not streaming.is_done(item := await embedded_queue.get()):
+                received.append(item)
+
+        await asyncio.gather(
+            streaming.produce_chunks(docs, _SplitChunker(), text_queue),
+            streaming.embed_chunks(text_queue, embedded_queue, _FakeEmbedder(), batch_size=3),
+            _drain(),
+        )
+        return received
+
+    received = asyncio.run(_run())
+    summary = [
+        (type(item).__name__, item.index, getattr(item, "texts", None), getattr(item, "error", None) is not None)
+        for item in received
+    ]
+
+    assert summary == [
+        ("DocumentStart", 0, None, False),
+        ("ChunkTexts", 0, ["a", "b", "c"], False),
+        ("ChunkTexts", 0, ["d"], False),
+        ("DocumentEnd", 0, None, False),
+        ("DocumentStart", 1, None, False),
+        ("DocumentEnd", 1, None, True),
+        ("DocumentStart", 2, None, False),
+        ("ChunkTexts", 2, ["e"], False),
+        ("DocumentEnd", 2, None, False),
+    ]
+    assert streaming.plan_queue_sizes(1024 * 1024, 500, 384, 32) == (114, 3)
+
+
+def test_streaming_producer_extracts_through_the_process_pool(monkeypatch):
+    import io
+    from concurrent.futures import ThreadPoolExecutor
+
+    from answer_gen.components.ingestion import parallel, streaming
+
+    def _fake_extract(doc_bytes, start, stop, *_chunker_args):
+        return [f"{doc_bytes.decode()}-p{page}" for page in range(start, stop)]
+
+    def _inline_text(_file):
+        raise AssertionError("pool extraction should not fall back to the inline path")
+
+    monkeypatch.setattr(parallel, "get_document_page_count", lambda _doc: 3)
+    monkeypatch.setattr(parallel, "extract_and_chunk", _fake_extract)
+    monkeypatch.setattr(streaming, "get_document_text", _inline_text)
+    docs = [streaming.StreamedDocument(name, io.BytesIO(name.encode()), name) for name in ("one", "two")]
+
+    async def _run():
+        queue: asyncio.Queue = asyncio.Queue()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            await streaming.produce_chunks(
+                docs, None, queue, lambda content: parallel.ParallelChunkSource(pool, content, 2, ("gpt-4", 500, 50))
+            )
+        items = []
+        while not streaming.is_done(item := queue.get_nowait()):
+            items.append((type(item).__name__, item.index, getattr(item, "texts", None)))
+        return items
+
+    assert asyncio.run(_run()) == [
+        ("DocumentStart", 0, None),
+        ("ChunkTexts", 0, ["one-p0"]), ("ChunkTexts", 0, ["one-p1"]), ("ChunkTexts", 0, ["one-p2"]),
+        ("DocumentEnd", 0, None),
+        ("DocumentStart", 1, None),
+        ("ChunkTexts", 1, ["two-p0"]), ("ChunkTexts", 1, ["two-p1"]), ("ChunkTexts", 1, ["two-p2"]),
+        ("DocumentEnd", 1, None),
+    ]
+
+
+def test_insert_stream_rolls_back_only_the_failing_documents_savepoint(monkeypatch):
+    import numpy as np
+
+    from answer_gen.components.ingestion import streaming
+    from answer_gen.storage.async_persistence import AsyncPersistence
+
+    class _Savepoint:
+        def __init__(self, session):
+            self._session = session
+            self.is_active = True
+
+        async def commit(self):
+            self.is_active = False
+            self._session.nested = None
+
+        async def rollback(self):
+            self.is_active = False
+            self._session.nested = None
+            self._session.events.append("savepoint rollback")
+
+    class _FakeSession:
+        def __init__(self):
+            self.nested = None
+            self.pending = []
+            self.events = []
+            self.next_id = 1
+
+        async def begin_nested(self):
+            self.nested = _Savepoint(self)
+            return self.nested
+
+        def get_nested_transaction(self):
+            return self.nested
+
+        def add(self, obj):
+            self.pending.append(obj)
+
+        async def flush(self):
+            pending, self.pending = self.pending, []
+            if any(obj.filename == "bad.pdf" for obj in pending):
+                raise RuntimeError("duplicate key")
+            for obj in pending:
+                obj.id = self.next_id
+                self.next_id += 1
+
+        async def rollback(self):
+            self.events.append("outer rollback")
+
+    inserted_chunks = []
+
+    async def _fake_bulk_insert(self, _persistence, chunks):
+        inserted_chunks.extend(chunk.doc_id for chunk in chunks)
+
+    monkeypatch.setattr("answer_gen.components.ingestion.document_ingestor.get_embedder", lambda *_args, **_kwargs: object())
+    monkeypatch.setattr(DocumentIngestorWorker, "_bulk_insert_chunks", _fake_bulk_insert)
+    worker = DocumentIngestorWorker("sqlite://", _build_config())
+    session = _FakeSession()
+
+    async def _run():
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, name in enumerate(("good.pdf", "bad.pdf", "other.pdf")):
+            queue.put_nowait(streaming.DocumentStart(index, streaming.StreamedDocument(name, None, name)))
+            queue.put_nowait(streaming.ChunkTexts(index, ["text"], np.ones((1, 2), dtype=np.float32)))
+            queue.put_nowait(streaming.DocumentEnd(index))
+        queue.put_nowait(streaming._DONE)
+
+        inserted_ids, failed_docs = [], {}
+        await worker._insert_stream(AsyncPersistence(session), SimpleNamespace(id=1), queue, inserted_ids, failed_docs)
+        return inserted_ids, failed_docs
+
+    inserted_ids, failed_docs = asyncio.run(_run())
+
+    assert inserted_ids == [1, 2]
+    assert list(failed_docs) == ["bad.pdf"]
+    assert inserted_chunks == [1, 2]
+    assert session.events == ["savepoint rollback"]
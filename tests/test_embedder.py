@@ -0,0 +1,157 @@
+import asyncio
+
+import numpy as np
+
+from answer_gen.utils.embedder import registry
+from answer_gen.utils.embedder import cache as cache_module
+from answer_gen.utils.embedder.batcher import EmbeddingBatcher
+from answer_gen.utils.embedder.cache import EmbeddingCache
+from answer_gen.utils.embedder.embedder import Embedder
+
+
+class _FakeEmbedder:
+    loads = 0
+
+    def __init__(self, model_name, device=None, batch_size=32, normalize=True, batch_window_ms=5.0, cache=None):
+        _FakeEmbedder.loads += 1
+        self.model_name = model_name
+        self.device = device
+        self.batch_size = batch_size
+        self.batch_window_ms = batch_window_ms
+        self.normalize = normalize
+
+    def memory_bytes(self):
+        return 1024
+
+    def batching_stats(self):
+        return {}
+
+
+def test_get_embedder_shares_one_model_per_name_device_and_normalize(monkeypatch):
+    monkeypatch.setattr(registry, "Embedder", _FakeEmbedder)
+    monkeypatch.setattr(registry, "resolve_device", lambda device=None: device or "cpu")
+    monkeypatch.setattr(registry, "_EMBEDDERS", {})
+    _FakeEmbedder.loads = 0
+
+    answer_side = registry.get_embedder("mini", batch_size=32)
+    ingest_side = registry.get_embedder("mini", batch_size=64)
+    unnormalized = registry.get_embedder("mini", normalize=False)
+
+    assert answer_side is ingest_side
+    assert unnormalized is not answer_side
+    assert _FakeEmbedder.loads == 2
+    assert [s["memory_bytes"] for s in registry.get_embedder_stats()] == [1024, 1024]
+
+
+def test_get_embedder_warns_when_batching_settings_conflict(monkeypatch, caplog):
+    monkeypatch.setattr(registry, "Embedder", _FakeEmbedder)
+    monkeypatch.setattr(registry, "resolve_device", lambda device=None: device or "cpu")
+    monkeypatch.setattr(registry, "_EMBEDDERS", {})
+
+    registry.get_embedder("mini", batch_size=32, batch_window_ms=5.0)
+    with caplog.at_level("WARNING", logger=registry.__name__):
+        registry.get_embedder("mini", batch_size=32, batch_window_ms=5.0)
+        assert not caplog.records
+        registry.get_embedder("mini", batch_size=32, batch_window_ms=20.0)
+
+    assert [r.levelname for r in caplog.records] == ["WARNING"]
+    assert "batch_window_ms=5.0 (requested 32, 20.0)" in caplog.records[0].getMessage()
+
+
+def test_batcher_coalesces_concurrent_requests_into_one_encode():
+    calls, flags = [], []
+
+    def _encode(texts, cacheable):
+        calls.append(list(texts))
+        flags.append(list(cacheable))
+        return [[float(len(t))] for t in texts]
+
+    batcher = EmbeddingBatcher(_encode, batch_size=8, max_wait_ms=20)
+
+    async def _run():
+        return await asyncio.gather(
+            batcher.submit(["a"]),
+            batcher.submit(["bb", "ccc"]),
+            batcher.submit(["dddd"], cache=False),
+        )
+
+    results = asyncio.run(_run())
+
+    assert calls == [["a", "bb", "ccc", "dddd"]]
+    assert flags == [[True, True, True, False]]
+    assert results == [[[1.0]], [[2.0], [3.0]], [[4.0]]]
+    stats = batcher.stats()
+    assert stats["batches"] == 1
+    assert stats["texts"] == 4
+    assert stats["avg_batch_fill_ratio"] == 0.5
+
+
+def test_cache_evicts_least_recently_used_entries_by_bytes():
+    entry_bytes = 4 * 4 + cache_module._ENTRY_OVERHEAD_BYTES
+    cache = EmbeddingCache(max_bytes=2 * entry_bytes)
+
+    def _lookup(texts, normalize=True):
+        return [None if v is None else v.tolist() for v in cache.get_many("mini", normalize, texts)]
+
+    cache.put_many("mini", True, ["a", "b"], np.array([[1.0] * 4, [2.0] * 4], dtype=np.float32))
+    assert _lookup(["a"]) == [[1.0] * 4]  # "a" becomes most recent
+    cache.put_many("mini", True, ["c"], [[3.0] * 4])
+
+    assert _lookup(["a", "b", "c"]) == [[1.0] * 4, None, [3.0] * 4]
+    assert _lookup(["a"], normalize=False) == [None]
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 2 * entry_bytes
+    assert (stats["hits"], stats["misses"]) == (3, 2)
+
+
+def test_encode_only_computes_cache_misses():
+    computed = []
+    embedder = Embedder.__new__(Embedder)
+    embedder._model_name = "mini"
+    embedder._normalize = True
+    embedder._dimension = 1
+    embedder._cache = EmbeddingCache()
+
+    def _encode_uncached(texts):
+        computed.append(list(texts))
+        return np.array([[float(len(t))] for t in texts], dtype=np.float32)
+
+    embedder._encode_uncached = _encode_uncached
+
+    first = embedder.encode(["a", "bb"])
+    second = embedder.encode(["bb", "ccc", "ccc"])
+
+    assert first.dtype == np.float32 and first.flags.c_contiguous
+    assert first.tolist() == [[1.0], [2.0]]
+    assert second.tolist() == [[2.0], [3.0], [3.0]]
+    assert embedder.encode([]).shape == (0, 1)
+
+    assert computed == [["a", "bb"], ["ccc"]]
+    assert embedder._cache.stats()["hit_rate"] == 0.2
+
+
+def test_uncached_encode_neither_reads_nor_fills_the_cache():
+    computed = []
+    embedder = Embedder.__new__(Embedder)
+    embedder._model_name = "mini"
+    embedder._normalize = True
+    embedder._dimension = 1
+    embedder._cache = EmbeddingCache()
+
+    def _encode_uncached(texts):
+        computed.append(list(texts))
+        return np.array([[float(len(t))] for t in texts], dtype=np.float32)
+
+    embedder._encode_uncached = _encode_uncached
+
+    embedder.encode(["question"])
+    chunks = embedder.encode(["chunk", "question"], cache=False)
+    mixed = embedder._encode_batch(["question", "other chunk"], [True, False])
+
+    assert chunks.tolist() == [[5.0], [8.0]]
+    assert mixed.tolist() == [[8.0], [11.0]]
+    assert computed == [["question"], ["chunk", "question"], ["other chunk"]]
+    stats = embedder._cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
@@ -0,0 +1,119 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from answer_gen.components.jobs import job_runner
+from answer_gen.components.jobs.job_runner import JobRunner
+from answer_gen.storage import queries
+from answer_gen.utils.config.job_runner_config import JobRunnerConfig
+
+
+class _DummyContext:
+    async def __aenter__(self):
+        return object()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _fake_store_factory(jobs):
+    class _FakeStore:
+        def __init__(self, _session):
+            pass
+
+        async def claim_next_job(self, kinds):
+            for job in jobs.values():
+                if job.status == "queued" and job.kind in kinds:
+                    job.status = "running"
+                    return job
+            return None
+
+        async def get_job(self, job_id):
+            return jobs.get(job_id)
+
+        async def requeue_stale_jobs(self, _kinds, _stale_before):
+            return 0
+
+        async def commit(self):
+            pass
+
+        async def rollback(self):
+            pass
+
+    return _FakeStore
+
+
+def test_run_once_dispatches_by_kind_and_records_outcome(monkeypatch):
+    jobs = {
+        1: SimpleNamespace(id=1, kind="ok", status="queued", result=None, error=None, finished_at=None),
+        2: SimpleNamespace(id=2, kind="boom", status="queued", result=None, error=None, finished_at=None),
+    }
+
+    async def _ok(job_id):
+        return {"handled": job_id}
+
+    async def _boom(_job_id):
+        raise RuntimeError("extract failed")
+
+    monkeypatch.setattr(job_runner, "build_async_connection", lambda _db_url: _DummyContext())
+    monkeypatch.setattr(job_runner, "AsyncPersistence", _fake_store_factory(jobs))
+
+    runner = JobRunner("postgresql+psycopg://", {"ok": _ok, "boom": _boom}, JobRunnerConfig(workers=1))
+
+    async def _drain():
+        return [await runner.run_once() for _ in range(3)]
+
+    assert asyncio.run(_drain()) == [1, 2, None]
+    assert (jobs[1].status, jobs[1].result) == ("succeeded", {"handled": 1})
+    assert (jobs[2].status, jobs[2].error) == ("failed", "extract failed")
+    assert jobs[2].finished_at is not None
+
+
+def test_claim_job_stmt_skips_locked_rows():
+    sql = str(queries.claim_job_stmt(["document_ingestion"]).compile(dialect=postgresql.dialect()))
+
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "ORDER BY jobs.id" in sql
+
+
+def test_submit_writes_job_documents_one_upload_at_a_time(monkeypatch):
+    from answer_gen.components.ingestion.document_ingestor import build_ingestion_job, build_job_documents
+
+    events = []
+
+    class _Upload:
+        def __init__(self, name):
+            self.name = name
+
+        async def seek(self, _offset):
+            pass
+
+        async def read(self):
+            events.append(("read", self.name))
+            return self.name.encode()
+
+    class _FakeStore:
+        def __init__(self, _session):
+            pass
+
+        def insert_job(self, job):
+            job.id = 7
+
+        async def flush(self):
+            pass
+
+        async def insert_job_document(self, job_document):
+            events.append(("write", job_document.job_id, job_document.content))
+
+        async def commit(self):
+            events.append(("commit",))
+
+    monkeypatch.setattr(job_runner, "build_async_connection", lambda _db_url: _DummyContext())
+    monkeypatch.setattr(job_runner, "AsyncPersistence", _FakeStore)
+
+    runner = JobRunner("sqlite://", {"document_ingestion": None}, JobRunnerConfig())
+    uploads = [("a.pdf", "hash-a", _Upload("a")), ("b.pdf", "hash-b", _Upload("b"))]
+
+    assert asyncio.run(runner.submit(build_ingestion_job(len(uploads)), build_job_documents(uploads))) == 7
+    assert events == [("read", "a"), ("write", 7, b"a"), ("read", "b"), ("write", 7, b"b"), ("commit",)]
@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+
+from answer_gen.exceptions import GenerativeFileNotFound, GenerativeOutputError
+from answer_gen.utils.generative.clients.local_client import LocalGenerativeClient
+from answer_gen.utils.generative.clients.rate_limiter import RateLimiterRegistry, init_rate_limiters
+
+
+def _client(**overrides):
+    return LocalGenerativeClient(**{"latency_ms": 0.0, "latency_sigma": 0.0, "tokens_per_second": 0.0, **overrides})
+
+
+def _bulk_prompt(*question_ids):
+    items = [{"question_id": qid, "question": f"q{qid}", "sources": []} for qid in question_ids]
+    return 'Example: {"question_id": 1, "answer": "..."}\n' + json.dumps({"sources": [], "questions": items})
+
+
+def test_bulk_prompt_gets_one_deterministic_answer_per_question():
+    first = asyncio.run(_client().generate_text("gpt-4o-mini", _bulk_prompt(7, 9)))
+    again = asyncio.run(_client(seed=3).generate_text("gpt-4o-mini", _bulk_prompt(7, 9)))
+
+    assert [a["question_id"] for a in json.loads(first)] == [7, 9]
+    assert first == again
+
+
+def test_stream_deltas_join_to_the_full_output():
+    client = _client()
+
+    async def collect():
+        return "".join([delta async for delta in client.stream_text("gpt-4o-mini", _bulk_prompt(1, 2, 3))])
+
+    assert json.loads(asyncio.run(collect())) == json.loads(asyncio.run(client.generate_text("gpt-4o-mini", _bulk_prompt(1, 2, 3))))
+
+
+def test_malformed_rate_truncates_output():
+    output = asyncio.run(_client(malformed_rate=1.0).generate_text("gpt-4o-mini", _bulk_prompt(1)))
+
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(output)
+
+
+def test_uploaded_file_yields_synthetic_questions_until_deleted():
+    client = _client(questions_per_file=3)
+
+    async def scenario():
+        file_id = await client.upload_file(b"%PDF rfp")
+        questions = json.loads(await client.generate_text_with_file("gpt-4o-mini", "parse", file_id=file_id))["questions"]
+        assert await client.delete_file(file_id)
+        with pytest.raises(GenerativeFileNotFound):
+            await client.generate_text_with_file("gpt-4o-mini", "parse", file_id=file_id)
+        return questions
+
+    assert len(asyncio.run(scenario())) == 3
+
+
+def test_simulated_rate_limit_rejects_calls_over_the_limit():
+    client = _client(rate_limit_rpm=1)
+
+    asyncio.run(client.generate_text("gpt-4o-mini", "q"))
+    with pytest.raises(GenerativeOutputError):
+        asyncio.run(client.generate_text("gpt-4o-mini", "q", retries=1))
+
+    assert client.stats()["rate_limited"] == 1
+
+
+def test_simulated_limit_headers_reach_the_shared_limiter():
+    registry = init_rate_limiters(RateLimiterRegistry(initial_concurrency=4))
+    try:
+        asyncio.run(_client(rate_limit_rpm=5).generate_text("gpt-4o-mini", "q"))
+    finally:
+        init_rate_limiters(None)
+
+    assert registry.get("gpt-4o-mini").stats()["remaining_requests"] == 4
+
+
+def test_batch_completes_after_the_simulated_delay():
+    lines = [
+        json.dumps({"custom_id": f"shard-{i}", "method": "POST", "url": "/v1/responses", "body": {"model": "gpt-4o-mini", "input": _bulk_prompt(i)}})
+        for i in (1, 2)
+    ]
+
+    async def submit_and_poll(client):
+        return await client.get_batch(await client.submit_batch("\n".join(lines).encode("utf-8")))
+
+    pending = asyncio.run(submit_and_poll(_client(batch_completion_seconds=60.0)))
+    done = asyncio.run(submit_and_poll(_client(batch_completion_seconds=0.0)))
+
+    assert not pending.is_finished
+    assert done.status == "completed"
+    assert {cid: json.loads(text)[0]["question_id"] for cid, text in done.outputs.items()} == {"shard-1": 1, "shard-2": 2}
+    assert asyncio.run(_client().get_batch("local-batch-404")).status == "expired"
+
+
+def test_cancelled_batch_reports_cancelled_without_outputs():
+    client = _client(batch_completion_seconds=60.0)
+    line = json.dumps({"custom_id": "shard-1", "method": "POST", "url": "/v1/responses", "body": {"model": "gpt-4o-mini", "input": _bulk_prompt(1)}})
+
+    async def scenario():
+        batch_id = await client.submit_batch(line.encode("utf-8"))
+        cancelled = await client.cancel_batch(batch_id)
+        return cancelled, await client.get_batch(batch_id), await client.cancel_batch(batch_id)
+
+    cancelled, batch, again = asyncio.run(scenario())
+
+    assert cancelled and not again
+    assert batch.status == "cancelled" and batch.outputs == {}
@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 
 from answer_gen.exceptions import StorageWriteError
 from answer_gen.storage.persistence import Persistence
+from answer_gen.storage.async_persistence import AsyncPersistence
 
 
 def test_commit_raises_storage_write_error_and_rolls_back():
@@ -22,3 +25,48 @@ def test_commit_raises_storage_write_error_and_rolls_back():
         store.commit()
 
     assert session.rolled_back is True
+
+
+def test_async_commit_raises_storage_write_error_and_rolls_back():
+    class _FakeAsyncSession:
+        def __init__(self):
+            self.rolled_back = False
+
+        async def commit(self):
+            raise RuntimeError("db down")
+
+        async def rollback(self):
+            self.rolled_back = True
+
+    session = _FakeAsyncSession()
+    store = AsyncPersistence(session)
+
+    with pytest.raises(StorageWriteError):
+        asyncio.run(store.commit())
+
+    assert session.rolled_back is True
+
+
+def test_bulk_insert_chunks_copy_falls_back_to_orm_off_postgres():
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from answer_gen.storage import copy_loader
+
+    saved = []
+
+    class _FakeSession:
+        def get_bind(self):
+            return SimpleNamespace(dialect=SimpleNamespace(name="sqlite", driver="pysqlite"))
+
+        def bulk_save_objects(self, objects):
+            saved.extend(objects)
+
+    chunk = SimpleNamespace(doc_id=1, order=0, content="c", embedding=[0.5, 0.25], chunk_version_id=2)
+    Persistence(_FakeSession()).bulk_insert_chunks([chunk], method="copy")
+
+    assert saved == [chunk]
+    assert copy_loader.supports_copy(SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver="psycopg")))
+    (row,) = copy_loader.chunk_copy_rows([chunk])
+    assert row[3].dtype == np.float32 and row[3].tolist() == [0.5, 0.25]
@@ -0,0 +1,56 @@
+import json
+
+from answer_gen.components.answers.prompt_packer import PromptPacker
+
+
+def _items(count, context="ctx"):
+    return [{"question_id": i, "question": f"q{i}", "context": context} for i in range(count)]
+
+
+def _cost(item):
+    return len(json.dumps(item)) + 2
+
+
+def test_pack_respects_output_budget_and_max_items():
+    packer = PromptPacker(len, "", max_input_tokens=10_000, max_output_tokens=1000, output_tokens_per_item=300)
+    capped = PromptPacker(len, "", max_input_tokens=10_000, max_output_tokens=1000, output_tokens_per_item=300, max_items=2)
+
+    assert packer.max_items == 3
+    assert [len(s) for s in packer.pack(_items(7))] == [3, 3, 1]
+    assert [len(s) for s in capped.pack(_items(5))] == [2, 2, 1]
+
+
+def test_pack_respects_input_budget_and_keeps_order():
+    items = _items(6)
+    template = "x" * 20
+    budget = 20 + 2 * _cost(items[0])
+    packer = PromptPacker(len, template, max_input_tokens=budget, max_output_tokens=10_000, output_tokens_per_item=1)
+
+    shards = packer.pack(items)
+
+    assert [len(s) for s in shards] == [2, 2, 2]
+    assert [item["question_id"] for shard in shards for item in shard] == list(range(6))
+
+
+def test_pack_trims_oversized_context_instead_of_dropping_item():
+    items = _items(2)
+    items[1]["context"] = "y" * 5000
+    packer = PromptPacker(len, "", max_input_tokens=200, max_output_tokens=10_000, output_tokens_per_item=1)
+
+    shards = packer.pack(items)
+
+    packed = [item for shard in shards for item in shard]
+    assert [item["question_id"] for item in packed] == [0, 1]
+    assert all(_cost(item) <= packer.item_budget for item in packed)
+    assert packed[1]["context"] and len(packed[1]["context"]) < 5000
+
+
+def test_pack_counts_shared_sources_once_per_shard():
+    sources = {1: "s" * 100, 2: "t" * 100}
+    items = [{"question_id": i, "question": f"q{i}", "sources": [1]} for i in range(3)]
+    source_cost = _cost({"id": 1, "text": sources[1]})
+    budget = source_cost + sum(_cost(item) for item in items)
+    packer = PromptPacker(len, "", max_input_tokens=budget, max_output_tokens=10_000, output_tokens_per_item=1)
+
+    assert [len(s) for s in packer.pack(items, sources)] == [3]
+    assert [len(s) for s in packer.pack(items + [{"question_id": 3, "question": "q3", "sources": [2]}], sources)] == [3, 1]
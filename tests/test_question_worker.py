@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from answer_gen.components.questions import question_worker as question_worker_module
+from answer_gen.components.questions.question_worker import QuestionWorker
+from answer_gen.exceptions import GenerativeExecutionError, GenerativeFileNotFound
+from answer_gen.utils.config.question_worker_config import QuestionWorkerConfig
+
+
+def _build_config(**overrides) -> QuestionWorkerConfig:
+    return QuestionWorkerConfig(**{
+        "model": "gpt-4o-mini",
+        "prompt_path": "config/question_parsing_prompt.txt",
+        "embed_questions": False,
+        **overrides,
+    })
+
+
+class _FakeClient:
+    def __init__(self):
+        self.uploads = 0
+        self.deleted = []
+
+    async def upload_file(self, _file_bytes, expires_after_seconds=None):
+        self.uploads += 1
+        return f"file-{self.uploads}"
+
+    async def delete_file(self, file_id):
+        self.deleted.append(file_id)
+        return True
+
+
+class _FakeStore:
+    def __init__(self, remote_file=None, parsed=None):
+        self.remote_file = remote_file
+        self.parsed = dict(parsed or {})
+
+    async def get_parsed_questions(self, rfp_hash, prompt_version, model_name):
+        return self.parsed.get((rfp_hash, prompt_version, model_name))
+
+    async def put_parsed_questions(self, rfp_hash, prompt_version, model_name, questions):
+        self.parsed[(rfp_hash, prompt_version, model_name)] = list(questions)
+
+    async def get_rfp_remote_file(self, _rfp_hash):
+        return self.remote_file
+
+    async def upsert_rfp_remote_file(self, rfp_hash, file_id, expires_at):
+        self.remote_file = SimpleNamespace(rfp_hash=rfp_hash, file_id=file_id, expires_at=expires_at)
+
+    async def delete_rfp_remote_file(self, _remote_file):
+        self.remote_file = None
+
+    async def commit(self):
+        return None
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    calls = []
+
+    async def _fake_read(_path):
+        return "Extract the questions."
+
+    async def _fake_generate(_client, _prompt_path, _model, _file, file_id=None):
+        calls.append(file_id)
+        if file_id == "file-gone":
+            raise GenerativeFileNotFound("file not found")
+        if file_id == "file-flaky":
+            raise GenerativeExecutionError("model call failed")
+        return ["What is your uptime?"]
+
+    monkeypatch.setattr(question_worker_module, "read_file_async", _fake_read)
+    monkeypatch.setattr(question_worker_module, "generate_questions", _fake_generate)
+    return calls
+
+
+def _parse(worker, store):
+    return asyncio.run(worker._parse_questions(store, SimpleNamespace(id=1), "hash", b"%PDF"))
+
+
+def test_reparse_of_unchanged_rfp_skips_upload_and_llm(generated):
+    client = _FakeClient()
+    worker = QuestionWorker("postgresql://test", client, _build_config())
+    store = _FakeStore()
+
+    first = _parse(worker, store)
+    second = _parse(worker, store)
+
+    assert first == second == ["What is your uptime?"]
+    assert generated == ["file-1"]
+    assert client.uploads == 1
+
+
+def test_reuses_unexpired_remote_file_and_reuploads_expiring_one(generated):
+    client = _FakeClient()
+    worker = QuestionWorker("postgresql://test", client, _build_config(parse_cache=False))
+    fresh = SimpleNamespace(file_id="file-kept", expires_at=datetime.utcnow() + timedelta(days=1))
+    expiring = SimpleNamespace(file_id="file-old", expires_at=datetime.utcnow() + timedelta(seconds=60))
+
+    _parse(worker, _FakeStore(remote_file=fresh))
+    _parse(worker, _FakeStore(remote_file=expiring))
+
+    assert generated == ["file-kept", "file-1"]
+    assert client.uploads == 1
+
+
+def test_missing_remote_file_is_forgotten_and_reuploaded(generated):
+    client = _FakeClient()
+    worker = QuestionWorker("postgresql://test", client, _build_config(parse_cache=False))
+    store = _FakeStore(remote_file=SimpleNamespace(file_id="file-gone", expires_at=None))
+
+    assert _parse(worker, store) == ["What is your uptime?"]
+    assert generated == ["file-gone", "file-1"]
+    assert store.remote_file.file_id == "file-1"
+
+
+def test_other_generation_failures_keep_the_remote_file(generated):
+    client = _FakeClient()
+    worker = QuestionWorker("postgresql://test", client, _build_config(parse_cache=False))
+    store = _FakeStore(remote_file=SimpleNamespace(file_id="file-flaky", expires_at=None))
+
+    with pytest.raises(GenerativeExecutionError):
+        _parse(worker, store)
+
+    assert generated == ["file-flaky"]
+    assert client.uploads == 0
+    assert store.remote_file.file_id == "file-flaky"
@@ -0,0 +1,106 @@
+import asyncio
+
+from answer_gen.utils.generative.clients.rate_limiter import (
+    ModelRateLimiter,
+    RequestPriority,
+    parse_reset_seconds,
+)
+
+
+def test_parse_reset_seconds():
+    assert parse_reset_seconds("1s") == 1.0
+    assert parse_reset_seconds("6m0s") == 360.0
+    assert parse_reset_seconds("20ms") == 0.02
+    assert parse_reset_seconds("2") == 2.0
+    assert parse_reset_seconds(None) is None
+
+
+def test_interactive_requests_are_admitted_before_queued_bulk():
+    limiter = ModelRateLimiter("gpt-4o-mini", initial_concurrency=1, max_concurrency=1)
+    order = []
+
+    async def request(name, priority):
+        async with limiter.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def scenario():
+        async with limiter.slot(RequestPriority.BULK):
+            tasks = [
+                asyncio.create_task(request("bulk-1", RequestPriority.BULK)),
+                asyncio.create_task(request("bulk-2", RequestPriority.BULK)),
+                asyncio.create_task(request("interactive", RequestPriority.INTERACTIVE)),
+            ]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order == ["interactive", "bulk-1", "bulk-2"]
+
+
+def test_concurrent_rate_limits_decrease_once_and_successes_increase():
+    limiter = ModelRateLimiter("gpt-4o-mini", initial_concurrency=8)
+
+    limiter.on_rate_limited({}, epoch=0)
+    limiter.on_rate_limited({}, epoch=0)
+    assert limiter.limit == 4
+
+    for _ in range(8):
+        limiter.on_success({})
+    assert limiter.limit == 5
+
+
+def test_exhausted_token_bucket_holds_requests_until_reset():
+    limiter = ModelRateLimiter("gpt-4o-mini")
+
+    async def scenario():
+        limiter.on_success({"x-ratelimit-remaining-tokens": "100", "x-ratelimit-reset-tokens": "50ms"})
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with limiter.slot(estimated_tokens=80):
+            pass
+        async with limiter.slot(estimated_tokens=80):
+            pass
+        return loop.time() - started
+
+    assert asyncio.run(scenario()) >= 0.04
+
+
+def test_stream_holds_its_slot_until_drained(monkeypatch):
+    from types import SimpleNamespace
+
+    from answer_gen.utils.generative.clients import call_policy, openai_client
+    from answer_gen.utils.generative.clients.openai_client import OpenAIClient
+
+    limiter = ModelRateLimiter("gpt-4o-mini", initial_concurrency=2, max_concurrency=2)
+    in_flight = []
+    closed = []
+
+    class _Stream:
+        async def __aiter__(self):
+            for delta in ("a", "b"):
+                in_flight.append(limiter.stats()["in_flight"])
+                yield SimpleNamespace(type="response.output_text.delta", delta=delta)
+
+        async def close(self):
+            closed.append(True)
+
+    class _Responses:
+        def __init__(self):
+            self.with_raw_response = self
+
+        async def create(self, **kwargs):
+            return SimpleNamespace(headers={}, parse=_Stream)
+
+    monkeypatch.setattr(call_policy, "_POLICY", None)
+    monkeypatch.setattr(openai_client, "get_rate_limiter", lambda _model: limiter)
+    client = OpenAIClient(api_key="test")
+    client._client = SimpleNamespace(responses=_Responses())
+
+    async def run():
+        return "".join([delta async for delta in client.stream_text("gpt-4o-mini", "q")])
+
+    assert asyncio.run(run()) == "ab"
+    assert in_flight == [1, 1]
+    assert closed == [True]
+    assert limiter.stats()["in_flight"] == 0
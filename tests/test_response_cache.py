@@ -0,0 +1,99 @@
+import asyncio
+import json
+
+import pytest
+
+from answer_gen.exceptions import GenerativeOutputError
+from answer_gen.utils.generative import generative
+from answer_gen.utils.generative.response_cache import (
+    MemoryResponseCacheBackend,
+    ResponseCache,
+    build_response_cache,
+    init_response_cache,
+    prompt_fingerprint,
+)
+
+
+class _FakeClient:
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+        self.calls = 0
+
+    async def generate_text(self, model, prompt, **_kwargs):
+        self.calls += 1
+        return self.outputs.pop(0)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    async def _fake_read(_path):
+        return "Q: {question}"
+
+    monkeypatch.setattr(generative, "read_file_async", _fake_read)
+    cache = init_response_cache(ResponseCache(MemoryResponseCacheBackend(max_entries=8)))
+    yield cache
+    init_response_cache(None)
+
+
+def _answers_json(text):
+    return json.dumps([{"answer": text, "confidence": "high", "sources_used": [1], "coverage": "full", "notes": ""}])
+
+
+def test_fingerprint_changes_with_model_template_prompt_and_file():
+    base = prompt_fingerprint("gpt-4o-mini", "T {question}", "T q1")
+
+    assert base == prompt_fingerprint("gpt-4o-mini", "T {question}", "T q1")
+    assert base != prompt_fingerprint("gpt-4o", "T {question}", "T q1")
+    assert base != prompt_fingerprint("gpt-4o-mini", "T2 {question}", "T q1")
+    assert base != prompt_fingerprint("gpt-4o-mini", "T {question}", "T q2")
+    assert base != prompt_fingerprint("gpt-4o-mini", "T {question}", "T q1", file_hash="abc")
+
+
+def test_identical_calls_hit_cache_and_bypass_skips_it(cache):
+    client = _FakeClient([_answers_json("first"), _answers_json("second")])
+
+    first = asyncio.run(generative.generate_answers(client, "prompt.txt", "gpt-4o-mini", "q1"))
+    again = asyncio.run(generative.generate_answers(client, "prompt.txt", "gpt-4o-mini", "q1"))
+    fresh = asyncio.run(generative.generate_answers(client, "prompt.txt", "gpt-4o-mini", "q1", use_cache=False))
+
+    assert [a.answer for a in first + again + fresh] == ["first", "first", "second"]
+    assert client.calls == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["writes"], stats["bypassed"]) == (1, 1, 1, 1)
+
+
+def test_unparseable_response_is_not_cached(cache):
+    client = _FakeClient(["not json", _answers_json("ok")])
+
+    with pytest.raises(GenerativeOutputError):
+        asyncio.run(generative.generate_answers(client, "prompt.txt", "gpt-4o-mini", "q1"))
+    answers = asyncio.run(generative.generate_answers(client, "prompt.txt", "gpt-4o-mini", "q1"))
+
+    assert [a.answer for a in answers] == ["ok"]
+    assert client.calls == 2
+    assert cache.stats()["writes"] == 1
+
+
+def test_memory_backend_evicts_least_recent_and_expires(monkeypatch):
+    backend = MemoryResponseCacheBackend(max_entries=2, ttl_seconds=10)
+    now = [100.0]
+    monkeypatch.setattr("answer_gen.utils.generative.response_cache.time.monotonic", lambda: now[0])
+
+    async def scenario():
+        await backend.set("a", "m", "A")
+        await backend.set("b", "m", "B")
+        assert await backend.get("a") == "A"
+        await backend.set("c", "m", "C")
+        assert await backend.get("b") is None
+        now[0] += 11
+        return await backend.get("a")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_build_response_cache_validates_backend():
+    assert build_response_cache("off") is None
+    with pytest.raises(ValueError):
+        build_response_cache("redis")
+    with pytest.raises(ValueError):
+        build_response_cache("postgres")
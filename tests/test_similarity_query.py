@@ -0,0 +1,180 @@
+import os
+import random
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from answer_gen.storage import EMBEDDING_DIM
+from answer_gen.storage import queries
+from answer_gen.storage.persistence import Persistence
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, stmt):
+        self.stmt = stmt
+
+
+@compiles(_Explain)
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN " + compiler.process(element.stmt, **kw)
+
+
+def test_similarity_stmt_orders_by_distance_without_threshold_predicate():
+    stmt = queries.most_similar_chunks_stmt([0.1] * EMBEDDING_DIM, limit=6, chunk_version_id=4)
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True}))
+
+    where_clause = sql.split("WHERE", 1)[1].split("ORDER BY", 1)[0]
+    assert "<=>" not in where_clause
+    assert "chunk_version_id = 4" in where_clause
+    assert "JOIN" not in sql
+    assert "ORDER BY (chunks.embedding <=>" in sql
+    assert "LIMIT" in sql
+
+
+def test_get_most_similar_chunks_post_filters_and_returns_pairs():
+    class _FakeResult:
+        def all(self):
+            return [("c1", 0.9), ("c2", 0.6), ("c3", 0.2)]
+
+    class _FakeSession:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, stmt):
+            self.statements.append(stmt)
+            return _FakeResult()
+
+    session = _FakeSession()
+    pairs = Persistence(session).get_most_similar_chunks([0.1, 0.2], min_similarity=0.5, top_k=3, chunk_version_id=1, oversample=2)
+
+    assert pairs == [("c1", 0.9), ("c2", 0.6)]
+    assert session.statements[-1]._limit_clause.value == 6
+
+
+def test_batch_similarity_stmt_uses_one_lateral_query_over_unnested_vectors():
+    stmt = queries.most_similar_chunks_batch_stmt([[0.1] * EMBEDDING_DIM, [0.2] * EMBEDDING_DIM], limit=3, chunk_version_id=2)
+    compiled = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+    sql = str(compiled)
+
+    assert "unnest(" in sql and "WITH ORDINALITY" in sql
+    assert "JOIN LATERAL" in sql
+    assert "candidate.chunk_version_id = 2" in sql
+    assert len(compiled.params["query_embeddings"]) == 2
+
+
+def test_group_similar_chunks_keeps_query_order_and_empty_groups():
+    rows = [(1, "a", 0.9), (1, "b", 0.1), (3, "c", 0.7)]
+
+    grouped = queries.group_similar_chunks(rows, query_count=3, min_similarity=0.5, top_k=2)
+
+    assert grouped == [[("a", 0.9)], [], [("c", 0.7)]]
+
+
+def test_similar_answers_stmt_scans_question_index_and_filters_on_corpus():
+    stmt = queries.similar_answers_batch_stmt([[0.1] * EMBEDDING_DIM], limit=5, chunk_version_id=2, corpus_stamp="10:42")
+    compiled = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+    sql = str(compiled)
+
+    assert "JOIN LATERAL" in sql
+    assert "ORDER BY (candidate.embedding <=> query_vectors.embedding)" in sql
+    assert "answers.chunk_version_id IS NOT DISTINCT FROM" in sql
+    assert "10:42" in compiled.params.values()
+
+
+def test_similar_answers_stmt_only_ranks_other_questions_with_reusable_answers():
+    stmt = queries.similar_answers_batch_stmt(
+        [[0.1] * EMBEDDING_DIM],
+        limit=5,
+        chunk_version_id=2,
+        corpus_stamp="10:42",
+        exclude_question_ids=[7, 8],
+        exclude_content_prefix="No information",
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    lateral = sql[sql.index("JOIN LATERAL"):sql.index(") AS nearest")]
+
+    assert "FROM answers AS prior" in lateral
+    assert "prior.question_id = candidate.id" in lateral
+    assert "prior.corpus_stamp = '10:42'" in lateral
+    assert "prior.content NOT LIKE 'No information'" in lateral
+    assert "candidate.id NOT IN (7, 8)" in lateral
+    assert "answers.content NOT LIKE 'No information'" in sql
+
+
+def test_get_similar_answers_batch_applies_both_index_recall_settings():
+    import asyncio
+
+    from answer_gen.storage.async_persistence import AsyncPersistence
+
+    class _FakeResult:
+        def all(self):
+            return []
+
+    class _FakeSession:
+        def __init__(self):
+            self.statements = []
+
+        async def execute(self, stmt):
+            self.statements.append(str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})))
+            return _FakeResult()
+
+    session = _FakeSession()
+    asyncio.run(AsyncPersistence(session).get_similar_answers_batch(
+        [[0.1] * EMBEDDING_DIM], 0.9, 5, chunk_version_id=1, corpus_stamp="1:1", ef_search=80, probes=12
+    ))
+
+    settings = [sql for sql in session.statements if "set_config" in sql]
+    assert any("'hnsw.ef_search', '80'" in sql for sql in settings)
+    assert any("'ivfflat.probes', '12'" in sql for sql in settings)
+
+
+def test_group_similar_answers_keeps_best_match_above_threshold():
+    rows = [(1, "a", 0.95), (1, "b", 0.93), (2, "c", 0.5)]
+
+    assert queries.group_similar_answers(rows, query_count=3, min_similarity=0.9) == [("a", 0.95), None, None]
+
+
+@pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL not set (requires Postgres + pgvector)")
+def test_similarity_query_uses_partial_ann_index():
+    from sqlalchemy import create_engine, text
+
+    from answer_gen.storage import Base, ChunkVersion, Document, Chunk
+    from answer_gen.storage.vector_index import create_chunk_embedding_index
+    from answer_gen.utils.config.vector_index_config import VectorIndexConfig
+
+    engine = create_engine(os.environ["TEST_DATABASE_URL"])
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            Base.metadata.create_all(conn)
+
+            version_id = conn.execute(ChunkVersion.__table__.insert().values(version_name="explain-test").returning(ChunkVersion.id)).scalar_one()
+            doc_id = conn.execute(
+                Document.__table__.insert()
+                .values(filename="explain.pdf", storage_url="explain-test", hash="explain-test")
+                .returning(Document.id)
+            ).scalar_one()
+            rng = random.Random(0)
+            conn.execute(
+                Chunk.__table__.insert(),
+                [
+                    {"doc_id": doc_id, "order": i, "content": f"chunk {i}", "chunk_version_id": version_id,
+                     "embedding": [rng.random() for _ in range(EMBEDDING_DIM)]}
+                    for i in range(200)
+                ],
+            )
+            index_name = create_chunk_embedding_index(conn, VectorIndexConfig(index_method="hnsw"), version_id)
+            conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+            stmt = queries.most_similar_chunks_stmt([rng.random() for _ in range(EMBEDDING_DIM)], 5, version_id)
+            plan = "\n".join(conn.execute(_Explain(stmt)).scalars())
+        finally:
+            trans.rollback()
+    engine.dispose()
+
+    assert index_name in plan
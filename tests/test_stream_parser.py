@@ -0,0 +1,35 @@
+import json
+
+from answer_gen.utils.generative.parsers import IncrementalJsonArrayParser
+
+
+def _feed(text, step):
+    parser = IncrementalJsonArrayParser()
+    items = []
+    for i in range(0, len(text), step):
+        items.extend(parser.feed(text[i:i + step]))
+    return items
+
+
+def test_items_are_emitted_as_each_object_closes():
+    parser = IncrementalJsonArrayParser()
+
+    assert parser.feed('[{"question_id": 1, "answer": "a"}, {"question_id": 2, "ans') == [{"question_id": 1, "answer": "a"}]
+    assert parser.feed('wer": "b"}]') == [{"question_id": 2, "answer": "b"}]
+
+
+def test_wrapped_fenced_output_with_tricky_strings_parses_at_any_chunking():
+    answers = [
+        {"question_id": 1, "answer": 'Braces } and [brackets] in "quotes"', "sources_used": [1, 2]},
+        {"question_id": 2, "answer": "Escaped \\ backslash", "sources_used": []},
+    ]
+    text = "```json\n" + json.dumps({"answers": answers}) + "\n```"
+
+    for step in (1, 5, len(text)):
+        assert _feed(text, step) == answers
+
+
+def test_undecodable_item_is_skipped_and_text_after_the_array_ignored():
+    text = '[{"question_id": 1, "answer": oops}, {"question_id": 2, "answer": "b"}] [{"x": 1}]'
+
+    assert _feed(text, 4) == [{"question_id": 2, "answer": "b"}]
@@ -0,0 +1,40 @@
+import pytest
+
+from answer_gen.storage.vector_index import create_chunk_embedding_index, create_question_embedding_index
+from answer_gen.utils.config.vector_index_config import VectorIndexConfig
+
+
+class _RecordingConnection:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(str(stmt))
+
+
+def test_hnsw_index_is_partial_per_chunk_version_and_replaces_ivfflat():
+    conn = _RecordingConnection()
+
+    name = create_chunk_embedding_index(conn, VectorIndexConfig(index_method="hnsw", hnsw_m=8), chunk_version_id=3)
+
+    assert name == "ix_chunks_embedding_hnsw_v3"
+    create_sql, drop_sql = conn.statements
+    assert "USING hnsw (embedding vector_cosine_ops) WITH (m = 8, ef_construction = 64)" in create_sql
+    assert "WHERE chunk_version_id = 3" in create_sql
+    assert drop_sql == "DROP INDEX IF EXISTS ix_chunks_embedding_ivfflat_v3"
+
+
+def test_question_index_covers_embedded_questions_and_replaces_other_method():
+    conn = _RecordingConnection()
+
+    name = create_question_embedding_index(conn, VectorIndexConfig(index_method="ivfflat", ivfflat_lists=50))
+
+    assert name == "ix_questions_embedding_ivfflat"
+    create_sql, drop_sql = conn.statements
+    assert "ON questions USING ivfflat (embedding vector_cosine_ops) WITH (lists = 50)" in create_sql
+    assert drop_sql == "DROP INDEX IF EXISTS ix_questions_embedding_hnsw"
+
+
+def test_vector_index_config_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        VectorIndexConfig(index_method="flat")